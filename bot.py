@@ -15,10 +15,14 @@ Full license terms are available in the LICENSE file at the root of the reposito
 from __future__ import annotations
 
 import asyncio
+import bisect
+import dataclasses
+import datetime
 import functools
-import inspect
 import logging
 import time
+import types
+import uuid
 from concurrent import futures
 from typing import (
     TYPE_CHECKING,
@@ -27,9 +31,11 @@ from typing import (
     Coroutine,
     Dict,
     Final,
+    Iterable,
     List,
     Optional,
     ParamSpec,
+    Set,
     Tuple,
     Type,
     TypeAlias,
@@ -43,28 +49,52 @@ from discord.ext import commands
 from typing_extensions import Concatenate, Self
 
 from cogs.images import ApproveOrDenyImage, AttachmentRequestSettings, ImageRequest
-from cogs.infractions import InfractionsSettings
+from cogs.infractions import InfractionBuffer, InfractionHistory, InfractionsSettings
 from cogs.teams import Team
-from cogs.teams.practices import Practice
+from cogs.teams.practices import (
+    Practice,
+    PracticeAnalytics,
+    PracticeHistoryCache,
+    PracticeMember,
+    PracticeMemberHistory,
+    PracticePointsLedger,
+)
 from cogs.teams.scrims import Scrim, ScrimStatus
 from utils import (
     BYPASS_SETUP_HOOK,
     BYPASS_SETUP_HOOK_CACHE_LOADING,
+    CACHE_SNAPSHOT_INTERVAL,
+    CACHE_SNAPSHOT_PATH,
+    INFRACTION_BUFFER_MAX_SIZE,
+    INFRACTION_FLUSH_INTERVAL,
+    INFRACTION_FLUSH_SIZE,
+    INFRACTION_HISTORY_SIZE,
+    MESSAGE_EDIT_DELAY,
+    PRACTICE_HISTORY_CACHE_SIZE,
+    PRACTICE_HISTORY_MAX_AGE,
+    ROLE_SYNC_CONCURRENCY,
     RUNNING_DEVELOPMENT,
+    SLOW_QUERY_EXPLAIN,
+    SLOW_QUERY_THRESHOLD,
     START_TIMER_MANAGER,
     Context,
     ErrorHandler,
+    InstrumentedConnection,
+    MessageEditCoalescer,
+    PracticeSnapshot,
+    QueryStats,
+    RoleSyncEngine,
     TimerManager,
     _parse_environ_boolean,
     parse_initial_extensions,
 )
 
 if TYPE_CHECKING:
-    import datetime
-
     import aiohttp
     from discord.types.embed import EmbedType
 
+    from cogs.teams.team import TeamMember
+
 T = TypeVar("T")
 P = ParamSpec("P")
 PoolType: TypeAlias = "asyncpg.Pool[asyncpg.Record]"
@@ -87,14 +117,106 @@ initial_extensions: Tuple[str, ...] = (
     "cogs.teams.practices",
     "cogs.meta",
     "cogs.teams.scrims",
+    "cogs.cache_sync",
     "jishaku",
     "utils.error_handler",
 )
 
 
+@dataclasses.dataclass()
+class CacheLoader:
+    """Represents a registered cache loading function.
+
+    Attributes
+    ----------
+    name: :class:`str`
+        The flag name of the cache loader, such as ``TEAMS``.
+    func: Callable
+        The unbound cache loading function.
+    depends_on: Tuple[:class:`str`, ...]
+        The names of the cache loaders that must finish before this one can run.
+    """
+
+    name: str
+    func: CacheFunc[[], Optional[int]]
+    depends_on: Tuple[str, ...] = ()
+
+
+@dataclasses.dataclass()
+class CacheLoaderStats:
+    """Holds the statistics of a single cache loader run.
+
+    Attributes
+    ----------
+    name: :class:`str`
+        The flag name of the cache loader.
+    rows: :class:`int`
+        The amount of rows the cache loader loaded.
+    wall_time: :class:`float`
+        The time in seconds the cache loader took, excluding the time spent waiting for its dependencies.
+    connection_hold_time: :class:`float`
+        The time in seconds the cache loader held a pooled connection for.
+    """
+
+    name: str
+    rows: int = 0
+    wall_time: float = 0.0
+    connection_hold_time: float = 0.0
+
+
+@dataclasses.dataclass()
+class PoolStats:
+    """Holds the statistics of acquiring connections from the bot's pool.
+
+    Attributes
+    ----------
+    acquired: :class:`int`
+        The amount of connections that have been acquired.
+    total_wait_time: :class:`float`
+        The total time in seconds spent waiting for a connection.
+    max_wait_time: :class:`float`
+        The longest time in seconds spent waiting for a single connection.
+    timeouts: :class:`int`
+        The amount of times no connection became available before the acquire timeout.
+    """
+
+    acquired: int = 0
+    total_wait_time: float = 0.0
+    max_wait_time: float = 0.0
+    timeouts: int = 0
+
+    @property
+    def average_wait_time(self) -> float:
+        """:class:`float`: The average time in seconds spent waiting for a connection."""
+        return self.total_wait_time / self.acquired if self.acquired else 0.0
+
+    def record_acquire(self, wait_time: float) -> None:
+        self.acquired += 1
+        self.total_wait_time += wait_time
+        self.max_wait_time = max(self.max_wait_time, wait_time)
+
+
+# Mapping[flag_name, CacheLoader]
+_cache_loaders: Dict[str, CacheLoader] = {}
+
+
 def cache_loader(
     flag_name: str,
+    *,
+    depends_on: Tuple[str, ...] = (),
 ) -> Callable[[CacheFunc[P, T]], CacheFunc[P, Optional[T]]]:
+    """Registers a cache loading function. A cache loading function returns the amount of rows
+    it has loaded.
+
+    Parameters
+    ----------
+    flag_name: :class:`str`
+        The name of the cache. The environment flag ``{flag_name}_CACHE`` is used to enable or
+        disable this cache.
+    depends_on: Tuple[:class:`str`, ...]
+        The flag names of the caches that must be loaded before this one.
+    """
+
     def wrapped(func: CacheFunc[P, T]) -> CacheFunc[P, Optional[T]]:
         @functools.wraps(func)
         async def call_func(self: FuryBot, connection: ConnectionType, *args: P.args, **kwargs: P.kwargs) -> Optional[T]:
@@ -113,9 +235,7 @@ def cache_loader(
             _log.info("Finished loading %s cache from func %s", flag_name, func.__name__)
             return res
 
-        call_func.__cache_loader__ = True  # type: ignore
-        call_func.__cache_loader_name__ = flag_name  # type: ignore
-
+        _cache_loaders[flag_name] = CacheLoader(name=flag_name, func=call_func, depends_on=depends_on)  # type: ignore
         return call_func
 
     return wrapped
@@ -162,20 +282,41 @@ class DbContextManager:
         The bot instance.
     timeout: :class:`float`
         The timeout for acquiring a connection.
+    transaction: :class:`bool`
+        Whether the connection is used inside of a transaction. A single statement does not
+        need one, skipping it saves the ``BEGIN`` and ``COMMIT`` round trips.
+    readonly: :class:`bool`
+        Whether the transaction is read only. Only used when :attr:`transaction` is ``True``.
+    statement_timeout: Optional[:class:`float`]
+        The maximum time in seconds a statement may run for on this connection.
     """
 
     __slots__: Tuple[str, ...] = (
         "bot",
         "timeout",
+        "transaction",
+        "readonly",
+        "statement_timeout",
         "_pool",
         "_Connection",
         "_tr",
         "_connection",
     )
 
-    def __init__(self, bot: FuryBot, *, timeout: Optional[float] = 10.0) -> None:
+    def __init__(
+        self,
+        bot: FuryBot,
+        *,
+        timeout: Optional[float] = 10.0,
+        transaction: bool = True,
+        readonly: bool = False,
+        statement_timeout: Optional[float] = None,
+    ) -> None:
         self.bot: FuryBot = bot
         self.timeout: Optional[float] = timeout
+        self.transaction: bool = transaction
+        self.readonly: bool = readonly
+        self.statement_timeout: Optional[float] = statement_timeout
         self._pool: PoolType = bot.pool
         self._connection: Optional[ConnectionType] = None
         self._tr: Optional[Any] = None
@@ -187,10 +328,30 @@ class DbContextManager:
         await self.__aexit__(None, None, None)
 
     async def __aenter__(self) -> ConnectionType:
-        self._connection = connection = await self._pool.acquire(timeout=self.timeout)  # type: ignore
-        self._tr = tr = connection.transaction()
-        await tr.start()
-        return connection  # type: ignore
+        start = time.perf_counter()
+        try:
+            self._connection = connection = await self._pool.acquire(timeout=self.timeout)  # type: ignore
+        except asyncio.TimeoutError:
+            self.bot.pool_stats.timeouts += 1
+            raise
+
+        self.bot.pool_stats.record_acquire(time.perf_counter() - start)
+
+        try:
+            if self.transaction:
+                self._tr = tr = connection.transaction(readonly=self.readonly)
+                await tr.start()
+
+            if self.statement_timeout is not None:
+                # Outside of a transaction the setting lasts until the pool resets the connection on release.
+                scope = 'LOCAL ' if self.transaction else ''
+                await connection.execute(f'SET {scope}statement_timeout = {int(self.statement_timeout * 1000)}')
+        except BaseException:
+            await self._pool.release(connection)  # type: ignore
+            raise
+
+        # Statements run through the returned connection are recorded in the bot's query stats.
+        return InstrumentedConnection(connection, self.bot.query_stats)  # type: ignore
 
     async def __aexit__(
         self,
@@ -224,6 +385,10 @@ class FuryBot(commands.Bot):
 
     OWNER_ID: Final[int] = 146348630926819328
 
+    # Set as the application name of every pooled connection, so changes made by this process can be told
+    # apart from changes made by manual SQL or another process.
+    APPLICATION_NAME: Final[str] = f'fury-bot-{uuid.uuid4().hex[:12]}'
+
     if TYPE_CHECKING:
         user: discord.ClientUser  # This isn't accessed before the client has been logged in so it's OK to overwrite it.
         error_handler: ErrorHandler
@@ -248,15 +413,67 @@ class FuryBot(commands.Bot):
         # Mapping[guild_id, Mapping[team_id, Team]]
         self._team_cache: Dict[int, Dict[int, Team]] = {}
 
+        # Mapping[guild_id, Mapping[channel_id, team_id]]
+        self._team_channel_index: Dict[int, Dict[int, int]] = {}
+
+        # Mapping[(guild_id, member_id), Set[team_id]]
+        self._team_member_index: Dict[Tuple[int, int], Set[int]] = {}
+
         # Mapping[guild_id, Mapping[scrim_id, Scrim]
         self._team_scrim_cache: Dict[int, Dict[int, Scrim]] = {}
 
+        # Mapping[guild_id, Mapping[team_id, List[(scheduled_for, scrim_id)]]], each list is kept sorted
+        self._team_scrim_index: Dict[int, Dict[int, List[Tuple[datetime.datetime, int]]]] = {}
+
         # Mapping[guild_id, Mapping[team_id, Mapping[practice_id, Practice]]]
         self._team_practice_cache: Dict[int, Dict[int, Dict[int, Practice]]] = {}
 
+        # Mapping[guild_id, PracticePointsLedger]
+        self._practice_ledgers: Dict[int, PracticePointsLedger] = {}
+
+        # Mapping[guild_id, PracticeAnalytics]
+        self._practice_analytics: Dict[int, PracticeAnalytics] = {}
+
+        # Mapping[(guild_id, team_id), Practice], a team has at most one ongoing practice
+        self._ongoing_practices: Dict[Tuple[int, int], Practice] = {}
+
+        # Holds the history of practices that has been trimmed from memory, see PRACTICE_HISTORY_MAX_AGE
+        self.practice_history_cache: PracticeHistoryCache = PracticeHistoryCache(self, maxsize=PRACTICE_HISTORY_CACHE_SIZE)
+
         # Mapping[guild_id, InfractionsSettings]
         self._infractions_settings: Dict[int, InfractionsSettings] = {}
 
+        # Collects new infractions and writes them in batches
+        self.infraction_buffer: InfractionBuffer = InfractionBuffer(
+            self,
+            flush_size=INFRACTION_FLUSH_SIZE,
+            flush_interval=INFRACTION_FLUSH_INTERVAL,
+            max_size=INFRACTION_BUFFER_MAX_SIZE,
+        )
+
+        # Holds the infraction counts and recent infractions of every member, seeded by the INFRACTION_HISTORY cache
+        self.infraction_history: InfractionHistory = InfractionHistory(maxlen=INFRACTION_HISTORY_SIZE)
+
+        # Mapping[flag_name, Event], set once the cache loader has run (or has been skipped)
+        self._cache_ready: Dict[str, asyncio.Event] = {name: asyncio.Event() for name in _cache_loaders}
+
+        # Mapping[flag_name, CacheLoaderStats]
+        self.cache_loader_stats: Dict[str, CacheLoaderStats] = {}
+
+        self.pool_stats: PoolStats = PoolStats()
+        self.query_stats: QueryStats = QueryStats(
+            self, slow_threshold=SLOW_QUERY_THRESHOLD / 1000, explain_slow=SLOW_QUERY_EXPLAIN
+        )
+
+        # Debounces the edits of messages that change often, such as practice messages
+        self.message_editor: MessageEditCoalescer = MessageEditCoalescer(self, delay=MESSAGE_EDIT_DELAY)
+
+        # Applies role changes with a per guild budget, see RoleSyncEngine
+        self.role_sync: RoleSyncEngine = RoleSyncEngine(self, concurrency=ROLE_SYNC_CONCURRENCY)
+
+        self._cache_snapshot_task: Optional[asyncio.Task[None]] = None
+        self._practice_history_trim_task: Optional[asyncio.Task[None]] = None
+
         super().__init__(
             command_prefix=commands.when_mentioned_or("trev.", "trev", 'fury', 'fury.'),
             help_command=None,
@@ -291,6 +508,9 @@ class FuryBot(commands.Bot):
 
         old_init = kwargs.pop("init", None)
 
+        server_settings = kwargs.setdefault("server_settings", {})
+        server_settings.setdefault("application_name", cls.APPLICATION_NAME)
+
         async def init(con: asyncpg.Connection[asyncpg.Record]) -> None:
             await con.set_type_codec(
                 "jsonb",
@@ -354,21 +574,76 @@ class FuryBot(commands.Bot):
         return embed
 
     # Utilities for finding cache functions
-    def get_cache_function(self, cache_flag_name: str) -> Optional[CacheFunc[[], Optional[Any]]]:
-        # Walk through all functions on the client and locate the one with
-        # "func.__cache_loader_name__" equal to the cache_flag_name
-        for _name, func in inspect.getmembers(self, predicate=inspect.iscoroutinefunction):
-            if getattr(func, "__cache_loader_name__", None) == cache_flag_name:
-                return func
+    def get_cache_function(self, cache_flag_name: str) -> Optional[Callable[[ConnectionType], Coroutine[Any, Any, Any]]]:
+        """Get the cache loading function bound to this bot for the given flag name.
 
-        return None
+        Parameters
+        ----------
+        cache_flag_name: :class:`str`
+            The flag name of the cache loader, such as ``TEAMS``.
 
-    def get_cache_functions(self) -> Dict[str, CacheFunc[[], Optional[Any]]]:
-        return {
-            getattr(func, '__cache_loader_name__'): func
-            for _name, func in inspect.getmembers(self, predicate=inspect.iscoroutinefunction)
-            if getattr(func, "__cache_loader__", None)
-        }
+        Returns
+        -------
+        Optional[Callable]
+            The bound cache loading function, if it exists.
+        """
+        loader = _cache_loaders.get(cache_flag_name)
+        if loader is None:
+            return None
+
+        return types.MethodType(loader.func, self)
+
+    def get_cache_functions(self) -> Dict[str, Callable[[ConnectionType], Coroutine[Any, Any, Any]]]:
+        """Get all cache loading functions bound to this bot.
+
+        Returns
+        -------
+        Dict[:class:`str`, Callable]
+            A mapping of flag name to bound cache loading function.
+        """
+        return {name: types.MethodType(loader.func, self) for name, loader in _cache_loaders.items()}
+
+    def is_cache_ready(self, cache_flag_name: str, /) -> bool:
+        """Determines if the given cache has finished loading.
+
+        Parameters
+        ----------
+        cache_flag_name: :class:`str`
+            The flag name of the cache loader, such as ``TEAMS``.
+
+        Returns
+        -------
+        :class:`bool`
+        """
+        event = self._cache_ready.get(cache_flag_name)
+        return event is not None and event.is_set()
+
+    async def wait_for_cache(self, *cache_flag_names: str) -> None:
+        """|coro|
+
+        Waits until all of the given caches have finished loading. A cache that has been disabled
+        or failed to load is still marked as finished so waiters are never blocked forever.
+
+        Parameters
+        ----------
+        *cache_flag_names: :class:`str`
+            The flag names of the caches to wait for, such as ``TEAMS``.
+
+        Raises
+        ------
+        ValueError
+            One of the given caches does not exist.
+        """
+        events: List[asyncio.Event] = []
+        for name in cache_flag_names:
+            event = self._cache_ready.get(name)
+            if event is None:
+                raise ValueError(f'No cache loader named {name} exists.')
+
+            events.append(event)
+
+        for event in events:
+            await event.wait()
 
     # Infractions settings management
     def get_infractions_settings(self, guild_id: int, /) -> Optional[InfractionsSettings]:
@@ -444,8 +719,130 @@ class FuryBot(commands.Bot):
         """
         return self._team_cache.get(guild_id, {}).get(team_id)
 
+    def find_team(self, team_id: int, /) -> Optional[Team]:
+        """Get a team from any guild. Prefer :meth:`get_team` when the guild is known.
+
+        Parameters
+        ----------
+        team_id: :class:`int`
+            The team ID to get.
+
+        Returns
+        -------
+        Optional[:class:`Team`]
+            The team, if it exists.
+        """
+        for guild_teams in self._team_cache.values():
+            team = guild_teams.get(team_id)
+            if team is not None:
+                return team
+
+        return None
+
     def get_team_from_channel(self, channel_id: int, guild_id: int, /) -> Optional[Team]:
-        return Team.from_channel(channel_id, guild_id, bot=self)
+        """Get the team a channel is bound to, such as its category, text, voice or extra channels.
+
+        Parameters
+        ----------
+        channel_id: :class:`int`
+            The channel ID to look up.
+        guild_id: :class:`int`
+            The guild ID the channel is in.
+
+        Returns
+        -------
+        Optional[:class:`Team`]
+            The team the channel is bound to, if any.
+        """
+        channel_index = self._team_channel_index.get(guild_id)
+        if not channel_index:
+            # This guild has no teams, this is the case for most channel events.
+            return None
+
+        team_id = channel_index.get(channel_id)
+        if team_id is None:
+            return None
+
+        return self.get_team(team_id, guild_id=guild_id)
+
+    def update_team_channels(self, team: Team, old_channel_ids: Iterable[int], /) -> None:
+        """Update the channel index of a team after its channels have changed.
+
+        Parameters
+        ----------
+        team: :class:`Team`
+            The team whose channels have changed.
+        old_channel_ids: Iterable[:class:`int`]
+            The IDs of the channels the team was bound to before the change.
+        """
+        self._unindex_team_channels(team.guild_id, team.id, old_channel_ids)
+        self._index_team_channels(team)
+
+    def _index_team_channels(self, team: Team, /) -> None:
+        channel_index = self._team_channel_index.setdefault(team.guild_id, {})
+        for channel_id in team.channel_ids:
+            channel_index[channel_id] = team.id
+
+    def _unindex_team_channels(self, guild_id: int, team_id: int, channel_ids: Iterable[int], /) -> None:
+        channel_index = self._team_channel_index.get(guild_id)
+        if channel_index is None:
+            return
+
+        for channel_id in channel_ids:
+            # Only drop channels still bound to this team, another team may have claimed them since.
+            if channel_index.get(channel_id) == team_id:
+                del channel_index[channel_id]
+
+        if not channel_index:
+            del self._team_channel_index[guild_id]
+
+    def get_member_teams(self, member_id: int, guild_id: int, /) -> List[Team]:
+        """Get every team a member is on in a guild.
+
+        Parameters
+        ----------
+        member_id: :class:`int`
+            The member ID to look up.
+        guild_id: :class:`int`
+            The guild ID to get the teams from.
+
+        Returns
+        -------
+        List[:class:`Team`]
+            The teams the member is on.
+        """
+        team_ids = self._team_member_index.get((guild_id, member_id))
+        if not team_ids:
+            return []
+
+        return [team for team_id in team_ids if (team := self.get_team(team_id, guild_id=guild_id)) is not None]
+
+    def index_team_member(self, team_member: TeamMember, /) -> None:
+        """Add a team member to the member index, see :meth:`get_member_teams`.
+
+        Parameters
+        ----------
+        team_member: :class:`TeamMember`
+            The team member that was added to their team.
+        """
+        self._team_member_index.setdefault((team_member.guild_id, team_member.member_id), set()).add(team_member.team_id)
+
+    def unindex_team_member(self, team_member: TeamMember, /) -> None:
+        """Remove a team member from the member index, see :meth:`get_member_teams`.
+
+        Parameters
+        ----------
+        team_member: :class:`TeamMember`
+            The team member that was removed from their team.
+        """
+        key = (team_member.guild_id, team_member.member_id)
+        team_ids = self._team_member_index.get(key)
+        if team_ids is None:
+            return
+
+        team_ids.discard(team_member.team_id)
+        if not team_ids:
+            del self._team_member_index[key]
 
     def add_team(self, team: Team, /) -> None:
         """Add a team to the cache.
@@ -455,7 +852,19 @@ class FuryBot(commands.Bot):
         team: :class:`Team`
             The team to add.
         """
-        self._team_cache.setdefault(team.guild_id, {})[team.id] = team
+        guild_teams = self._team_cache.setdefault(team.guild_id, {})
+
+        existing = guild_teams.get(team.id)
+        if existing is not None:
+            self._unindex_team_channels(existing.guild_id, existing.id, existing.channel_ids)
+            for team_member in existing.team_members.values():
+                self.unindex_team_member(team_member)
+
+        guild_teams[team.id] = team
+        self._index_team_channels(team)
+        for team_member in team.team_members.values():
+            self.index_team_member(team_member)
+        self.get_practice_ledger(team.guild_id).add_team(team.id)
 
     def remove_team(self, team_id: int, guild_id: int, /) -> Optional[Team]:
         """Remove a team from the cache.
@@ -472,7 +881,14 @@ class FuryBot(commands.Bot):
         Optional[:class:`Team`]
             The team that was removed, if it existed.
         """
-        return self._team_cache.get(guild_id, {}).pop(team_id, None)
+        team = self._team_cache.get(guild_id, {}).pop(team_id, None)
+        if team is not None:
+            self._unindex_team_channels(guild_id, team_id, team.channel_ids)
+            for team_member in team.team_members.values():
+                self.unindex_team_member(team_member)
+            self.get_practice_ledger(guild_id).remove_team(team_id)
+
+        return team
 
     # Scrim Management
     def get_scrim(self, scrim_id: int, guild_id: int, /) -> Optional[Scrim]:
@@ -500,7 +916,50 @@ class FuryBot(commands.Bot):
         scrim: :class:`Scrim`
             The scrim to add.
         """
-        self._team_scrim_cache.setdefault(scrim.guild_id, {})[scrim.id] = scrim
+        guild_scrims = self._team_scrim_cache.setdefault(scrim.guild_id, {})
+
+        existing = guild_scrims.get(scrim.id)
+        if existing is not None:
+            self._unindex_scrim(existing, existing.scheduled_for)
+
+        guild_scrims[scrim.id] = scrim
+        self._index_scrim(scrim)
+
+    def reschedule_scrim(self, scrim: Scrim, old_scheduled_for: datetime.datetime, /) -> None:
+        """Update the scrim index after a scrim's scheduled time has changed.
+
+        Parameters
+        ----------
+        scrim: :class:`Scrim`
+            The scrim that has been rescheduled.
+        old_scheduled_for: :class:`datetime.datetime`
+            The time the scrim was scheduled for before the change.
+        """
+        self._unindex_scrim(scrim, old_scheduled_for)
+        self._index_scrim(scrim)
+
+    def _index_scrim(self, scrim: Scrim, /) -> None:
+        guild_index = self._team_scrim_index.setdefault(scrim.guild_id, {})
+        for team_id in (scrim.home_id, scrim.away_id):
+            bisect.insort(guild_index.setdefault(team_id, []), (scrim.scheduled_for, scrim.id))
+
+    def _unindex_scrim(self, scrim: Scrim, scheduled_for: datetime.datetime, /) -> None:
+        guild_index = self._team_scrim_index.get(scrim.guild_id)
+        if guild_index is None:
+            return
+
+        entry = (scheduled_for, scrim.id)
+        for team_id in (scrim.home_id, scrim.away_id):
+            entries = guild_index.get(team_id)
+            if not entries:
+                continue
+
+            index = bisect.bisect_left(entries, entry)
+            if index < len(entries) and entries[index] == entry:
+                del entries[index]
+
+            if not entries:
+                del guild_index[team_id]
 
     def remove_scrim(self, scrim_id: int, guild_id: int, /) -> Optional[Scrim]:
         """Remove a scrim from the cache.
@@ -517,10 +976,14 @@ class FuryBot(commands.Bot):
         Optional[:class:`Scrim`]
             The scrim that was removed, if it existed.
         """
-        return self._team_scrim_cache.get(guild_id, {}).pop(scrim_id, None)
+        scrim = self._team_scrim_cache.get(guild_id, {}).pop(scrim_id, None)
+        if scrim is not None:
+            self._unindex_scrim(scrim, scrim.scheduled_for)
+
+        return scrim
 
     def get_scrims_for(self, team_id: int, guild_id: int, /) -> List[Scrim]:
-        """Get all scrims for the given team in the given guild.
+        """Get all scrims for the given team in the given guild, ordered by when they are scheduled for.
 
         Parameters
         ----------
@@ -534,16 +997,43 @@ class FuryBot(commands.Bot):
         List[:class:`Scrim`]
             The scrims for the team in the guild.
         """
-        guild_scrims = self._team_scrim_cache.get(guild_id)
-        if guild_scrims is None:
+        entries = self._team_scrim_index.get(guild_id, {}).get(team_id)
+        if not entries:
             return []
 
-        scrims: List[Scrim] = []
-        for scrim in guild_scrims.values():
-            if team_id in {scrim.home_id, scrim.away_id}:
-                scrims.append(scrim)
+        guild_scrims = self._team_scrim_cache[guild_id]
+        return [guild_scrims[scrim_id] for _, scrim_id in entries]
+
+    def get_upcoming_scrims_for(
+        self, team_id: int, guild_id: int, /, *, after: Optional[datetime.datetime] = None
+    ) -> List[Scrim]:
+        """Get the scrims for the given team in the given guild that are scheduled at or after the given time,
+        ordered by when they are scheduled for.
 
-        return scrims
+        Parameters
+        ----------
+        team_id: :class:`int`
+            The team ID to get scrims for.
+        guild_id: :class:`int`
+            The guild ID to get scrims from.
+        after: Optional[:class:`datetime.datetime`]
+            Only scrims scheduled at or after this time are returned. Defaults to now.
+
+        Returns
+        -------
+        List[:class:`Scrim`]
+            The upcoming scrims for the team in the guild.
+        """
+        entries = self._team_scrim_index.get(guild_id, {}).get(team_id)
+        if not entries:
+            return []
+
+        after = after or discord.utils.utcnow()
+        guild_scrims = self._team_scrim_cache[guild_id]
+
+        # A 1-tuple sorts before every entry with the same time, so this finds the first scrim at or after it.
+        start = bisect.bisect_left(entries, (after,))
+        return [guild_scrims[scrim_id] for _, scrim_id in entries[start:]]
 
     # Practice Management
     def get_practice(self, practice_id: int, team_id: int, guild_id: int, /) -> Optional[Practice]:
@@ -565,6 +1055,27 @@ class FuryBot(commands.Bot):
         """
         return self._team_practice_cache.get(guild_id, {}).get(team_id, {}).get(practice_id)
 
+    def find_practice(self, practice_id: int, /) -> Optional[Practice]:
+        """Get a practice from any team in any guild. Prefer :meth:`get_practice` when the team is known.
+
+        Parameters
+        ----------
+        practice_id: :class:`int`
+            The practice ID to get.
+
+        Returns
+        -------
+        Optional[:class:`Practice`]
+            The practice, if it exists.
+        """
+        for guild_practices in self._team_practice_cache.values():
+            for team_practices in guild_practices.values():
+                practice = team_practices.get(practice_id)
+                if practice is not None:
+                    return practice
+
+        return None
+
     def get_practices(self, guild_id: int, /) -> List[Practice]:
         """Get all practices in a guild.
 
@@ -590,6 +1101,112 @@ class FuryBot(commands.Bot):
             The practice to add.
         """
         self._team_practice_cache.setdefault(practice.guild_id, {}).setdefault(practice.team_id, {})[practice.id] = practice
+        self.update_ongoing_practice(practice)
+        self.update_practice_stats(practice)
+
+    def get_practice_ledger(self, guild_id: int, /) -> PracticePointsLedger:
+        """Get the practice points ledger of a guild, which holds the total points and ranking of its teams.
+
+        Parameters
+        ----------
+        guild_id: :class:`int`
+            The guild ID to get the ledger for.
+
+        Returns
+        -------
+        :class:`PracticePointsLedger`
+        """
+        ledger = self._practice_ledgers.get(guild_id)
+        if ledger is None:
+            ledger = self._practice_ledgers[guild_id] = PracticePointsLedger(guild_id)
+
+        return ledger
+
+    def get_practice_analytics(self, guild_id: int, /) -> PracticeAnalytics:
+        """Get the practice analytics store of a guild, which holds the practice history of its teams.
+
+        Parameters
+        ----------
+        guild_id: :class:`int`
+            The guild ID to get the store for.
+
+        Returns
+        -------
+        :class:`PracticeAnalytics`
+        """
+        analytics = self._practice_analytics.get(guild_id)
+        if analytics is None:
+            analytics = self._practice_analytics[guild_id] = PracticeAnalytics(guild_id)
+
+        return analytics
+
+    def update_practice_stats(
+        self,
+        practice: Practice,
+        /,
+        *,
+        members: Optional[Iterable[PracticeMember]] = None,
+        histories: Optional[Iterable[PracticeMemberHistory]] = None,
+    ) -> None:
+        """Update the points and analytics of a practice after it has changed, such as when it has ended,
+        a member has joined or left, or its members have changed.
+
+        When neither ``members`` nor ``histories`` is given, every analytics row of the practice is
+        replaced. Otherwise only the practice's own row and the given rows are updated.
+
+        Parameters
+        ----------
+        practice: :class:`Practice`
+            The practice that has changed.
+        members: Optional[Iterable[:class:`PracticeMember`]]
+            The members that were added to the practice.
+        histories: Optional[Iterable[:class:`PracticeMemberHistory`]]
+            The history entries that were added or changed, such as when a member joined or left.
+        """
+        self.get_practice_ledger(practice.guild_id).record_practice(practice)
+
+        analytics = self.get_practice_analytics(practice.guild_id)
+        if members is None and histories is None:
+            analytics.add_practice(practice)
+            return
+
+        analytics.update_practice(practice)
+        for member in members or ():
+            analytics.add_member(member)
+
+        for history in histories or ():
+            analytics.update_history(history)
+
+    def get_ongoing_practice(self, team_id: int, guild_id: int, /) -> Optional[Practice]:
+        """Get the ongoing practice for the given team in the given guild.
+
+        Parameters
+        ----------
+        team_id: :class:`int`
+            The team ID to get the ongoing practice for.
+        guild_id: :class:`int`
+            The guild ID to get the ongoing practice from.
+
+        Returns
+        -------
+        Optional[:class:`Practice`]
+            The ongoing practice, if there is one.
+        """
+        return self._ongoing_practices.get((guild_id, team_id))
+
+    def update_ongoing_practice(self, practice: Practice, /) -> None:
+        """Update the ongoing practice of the practice's team after its status has changed.
+
+        Parameters
+        ----------
+        practice: :class:`Practice`
+            The practice that has started or ended.
+        """
+        key = (practice.guild_id, practice.team_id)
+        if practice.ongoing:
+            self._ongoing_practices[key] = practice
+        elif self._ongoing_practices.get(key) is practice:
+            del self._ongoing_practices[key]
 
     def remove_practice(self, practice_id: int, team_id: int, guild_id: int, /) -> Optional[Practice]:
         """Remove a practice from the cache.
@@ -608,7 +1225,17 @@ class FuryBot(commands.Bot):
         Optional[:class:`Practice`]
             The practice that was removed, if it existed.
         """
-        return self._team_practice_cache.get(guild_id, {}).get(team_id, {}).pop(practice_id, None)
+        practice = self._team_practice_cache.get(guild_id, {}).get(team_id, {}).pop(practice_id, None)
+        self.get_practice_ledger(guild_id).forget_practice(practice_id)
+        self.get_practice_analytics(guild_id).remove_practice(practice_id)
+        self.practice_history_cache.invalidate(practice_id)
+
+        ongoing = self._ongoing_practices.get((guild_id, team_id))
+        if ongoing is not None and ongoing.id == practice_id:
+            del self._ongoing_practices[(guild_id, team_id)]
+            ongoing.release_view()
+
+        return practice
 
     def clear_practices_for(self, team_id: int, guild_id: int, /) -> None:
         """Clear all practices for a team in a guild.
@@ -620,7 +1247,18 @@ class FuryBot(commands.Bot):
         guild_id: :class:`int`
             The guild ID to clear practices from.
         """
-        self._team_practice_cache.get(guild_id, {}).pop(team_id, None)
+        practices = self._team_practice_cache.get(guild_id, {}).pop(team_id, None)
+        ongoing = self._ongoing_practices.pop((guild_id, team_id), None)
+        if ongoing is not None:
+            ongoing.release_view()
+
+        if practices:
+            ledger = self.get_practice_ledger(guild_id)
+            analytics = self.get_practice_analytics(guild_id)
+            for practice_id in practices:
+                ledger.forget_practice(practice_id)
+                analytics.remove_practice(practice_id)
+                self.practice_history_cache.invalidate(practice_id)
 
     def get_practices_for(self, team_id: int, guild_id: int, /) -> List[Practice]:
         """Get all practices for the given team in the given guild.
@@ -665,7 +1303,14 @@ class FuryBot(commands.Bot):
         return await super().get_context(origin, cls=Context)
 
     # Helper utilities
-    def safe_connection(self, *, timeout: Optional[float] = 10.0) -> DbContextManager:
+    def safe_connection(
+        self,
+        *,
+        timeout: Optional[float] = 10.0,
+        transaction: bool = True,
+        readonly: bool = False,
+        statement_timeout: Optional[float] = None,
+    ) -> DbContextManager:
         """A context manager that will acquire a Connection from the bot's pool.
 
         This will neatly manage the Connection and release it back to the pool when the context is exited.
@@ -674,8 +1319,87 @@ class FuryBot(commands.Bot):
 
             async with bot.safe_connection(timeout=10) as connection:
                 await connection.execute('SELECT 1')
+
+        Parameters
+        ----------
+        timeout: Optional[:class:`float`]
+            The timeout for acquiring a connection.
+        transaction: :class:`bool`
+            Whether to run inside of a transaction. Defaults to ``True``, a single read should use
+            :meth:`fetch`, :meth:`fetchrow` or :meth:`fetchval` instead.
+        readonly: :class:`bool`
+            Whether the transaction is read only.
+        statement_timeout: Optional[:class:`float`]
+            The maximum time in seconds a statement may run for.
+        """
+        return DbContextManager(
+            self, timeout=timeout, transaction=transaction, readonly=readonly, statement_timeout=statement_timeout
+        )
+
+    async def fetch(self, query: str, *args: Any, timeout: Optional[float] = None) -> List[asyncpg.Record]:
+        """|coro|
+
+        Run a single query outside of a transaction and return all of its rows.
+
+        Parameters
+        ----------
+        query: :class:`str`
+            The query to run.
+        *args: Any
+            The query arguments.
+        timeout: Optional[:class:`float`]
+            The maximum time in seconds the query may run for, it is cancelled once this is exceeded.
+
+        Returns
+        -------
+        List[:class:`asyncpg.Record`]
+        """
+        async with self.safe_connection(transaction=False) as connection:
+            return await connection.fetch(query, *args, timeout=timeout)
+
+    async def fetchrow(self, query: str, *args: Any, timeout: Optional[float] = None) -> Optional[asyncpg.Record]:
+        """|coro|
+
+        Run a single query outside of a transaction and return its first row.
+
+        Parameters
+        ----------
+        query: :class:`str`
+            The query to run.
+        *args: Any
+            The query arguments.
+        timeout: Optional[:class:`float`]
+            The maximum time in seconds the query may run for, it is cancelled once this is exceeded.
+
+        Returns
+        -------
+        Optional[:class:`asyncpg.Record`]
+        """
+        async with self.safe_connection(transaction=False) as connection:
+            return await connection.fetchrow(query, *args, timeout=timeout)
+
+    async def fetchval(self, query: str, *args: Any, column: int = 0, timeout: Optional[float] = None) -> Any:
+        """|coro|
+
+        Run a single query outside of a transaction and return a value from its first row.
+
+        Parameters
+        ----------
+        query: :class:`str`
+            The query to run.
+        *args: Any
+            The query arguments.
+        column: :class:`int`
+            The index of the column to return.
+        timeout: Optional[:class:`float`]
+            The maximum time in seconds the query may run for, it is cancelled once this is exceeded.
+
+        Returns
+        -------
+        Any
         """
-        return DbContextManager(self, timeout=timeout)
+        async with self.safe_connection(transaction=False) as connection:
+            return await connection.fetchval(query, *args, column=column, timeout=timeout)
 
     def create_task(self, coro: Coroutine[T, Any, Any], *, name: Optional[str] = None) -> asyncio.Task[T]:
         """Create a task from a coroutine object.
@@ -730,32 +1454,94 @@ class FuryBot(commands.Bot):
         return await super().unload_extension(name, package=package)
 
     @cache_loader('INFRACTIONS_SETTINGS')
-    async def _cache_infractions_settings(self, connection: ConnectionType) -> None:
+    async def _cache_infractions_settings(self, connection: ConnectionType) -> int:
         infraction_settings = await connection.fetch('SELECT * FROM infractions.settings')
 
         for record in infraction_settings:
             settings = InfractionsSettings(data=dict(record), bot=self)
             self.add_infractions_settings(settings)
 
+        return len(infraction_settings)
+
+    @cache_loader('INFRACTION_HISTORY')
+    async def _cache_infraction_history(self, connection: ConnectionType) -> int:
+        # Flushes are held back while loading, so every infraction is either in the rows read here or
+        # still waiting in the buffer, and none of them is counted twice.
+        async with self.infraction_buffer.hold():
+            counts = await connection.fetch('''
+                SELECT guild_id, user_id, COUNT(*) AS count
+                FROM infractions.member_counter
+                GROUP BY guild_id, user_id
+                ''')
+            recent = await connection.fetch(
+                '''
+                SELECT guild_id, user_id, message_id, channel_id
+                FROM (
+                    SELECT *, ROW_NUMBER() OVER (PARTITION BY guild_id, user_id ORDER BY message_id DESC) AS position
+                    FROM infractions.member_counter
+                ) AS ranked
+                WHERE position <= $1
+                ORDER BY message_id
+                ''',
+                self.infraction_history.maxlen,
+            )
+
+            self.infraction_history.load(
+                (tuple(record) for record in counts),
+                (tuple(record) for record in recent),
+                self.infraction_buffer.get_all_pending(),
+            )
+
+        return len(recent)
+
     @cache_loader("TEAMS")
-    async def _cache_setup_teams(self, connection: ConnectionType) -> None:
-        # NOTE: Look into views for this later down the road or something
+    async def _cache_setup_teams(self, connection: ConnectionType) -> int:
+        # Fetch each table once and group the members and captains by team in Python, rather than
+        # running two extra queries for every team.
+        start = time.perf_counter()
+
         team_data = await connection.fetch("SELECT * FROM teams.settings")
         if not team_data:
             _log.debug("No teams to load.")
-            return
+            return 0
+
+        member_data = await connection.fetch("SELECT * FROM teams.members")
+        captain_data = await connection.fetch("SELECT * FROM teams.captains")
+
+        # Mapping[team_id, List[data]]
+        team_member_mapping: Dict[int, List[Dict[str, Any]]] = {}
+        for entry in member_data:
+            team_member_mapping.setdefault(entry['team_id'], []).append(dict(entry))
+
+        # Mapping[team_id, List[data]]
+        team_captain_mapping: Dict[int, List[Dict[str, Any]]] = {}
+        for entry in captain_data:
+            team_captain_mapping.setdefault(entry['team_id'], []).append(dict(entry))
 
         for entry in team_data:
             team_id = entry['id']
-            member_data = await connection.fetch("SELECT * FROM teams.members WHERE team_id = $1", team_id)
-            captain_data = await connection.fetch("SELECT * FROM teams.captains WHERE team_id = $1", team_id)
 
-            team = Team.from_raw(dict(entry), list(map(dict, member_data)), list(map(dict, captain_data)), bot=self)
-            self.add_team(team)
+            # Team.from_raw will add the team to the cache for us.
+            team = Team.from_raw(
+                dict(entry),
+                team_member_mapping.get(team_id, []),
+                team_captain_mapping.get(team_id, []),
+                bot=self,
+            )
             _log.debug('Loaded team %s (%s)', team.display_name, team.id)
 
-    @cache_loader("SCRIMS")
-    async def _cache_setup_scrims(self, connection: ConnectionType) -> None:
+        _log.info(
+            'Loaded %s teams (%s members, %s captains) in %.2f seconds.',
+            len(team_data),
+            len(member_data),
+            len(captain_data),
+            time.perf_counter() - start,
+        )
+
+        return len(team_data) + len(member_data) + len(captain_data)
+
+    @cache_loader("SCRIMS", depends_on=("TEAMS",))
+    async def _cache_setup_scrims(self, connection: ConnectionType) -> int:
         scrim_records = await connection.fetch("SELECT * FROM teams.scrims")
 
         for entry in scrim_records:
@@ -764,11 +1550,11 @@ class FuryBot(commands.Bot):
 
             scrim = Scrim(self, **data)
             scrim.load_persistent_views()
-            self._team_scrim_cache.setdefault(scrim.guild_id, {})[scrim.id] = scrim
+            self.add_scrim(scrim)
 
-    async def _load_image_request(self, data: asyncpg.Record, connection: ConnectionType) -> None:
-        await self.wait_until_ready()
+        return len(scrim_records)
 
+    async def _load_image_request(self, data: asyncpg.Record) -> None:
         # Fetch the request guild
         settings = await AttachmentRequestSettings.fetch_from_id(data['request_settings'], bot=self)
         if not settings:
@@ -798,19 +1584,81 @@ class FuryBot(commands.Bot):
         view = ApproveOrDenyImage(self, request)
         self.add_view(view, message_id=data["message_id"])
 
+    async def _load_image_requests(self, image_requests: List[asyncpg.Record]) -> None:
+        # The requests need the guild cache to be populated, so we wait for the bot to be ready here
+        # instead of in the cache loader, where a pooled connection would be held the whole time.
+        await self.wait_until_ready()
+
+        for request in image_requests:
+            try:
+                await self._load_image_request(request)
+            except Exception as exc:
+                _log.warning('Failed to load image request %s.', request['id'], exc_info=exc)
+
     @cache_loader("IMAGE_REQUESTS")
-    async def _cache_setup_image_requests(self, connection: ConnectionType) -> None:
+    async def _cache_setup_image_requests(self, connection: ConnectionType) -> int:
         image_requests = await connection.fetch(
             "SELECT * FROM images.requests WHERE denied_reason IS NULL OR message_id IS NULL;"
         )
-        for request in image_requests:
-            await self._load_image_request(request, connection=connection)
-
-    @cache_loader("PRACTICES")
-    async def _cache_setup_practices(self, connection: ConnectionType) -> None:
-        practice_data = await connection.fetch("SELECT * FROM teams.practice")
-        practice_member_data = await connection.fetch("SELECT * FROM teams.practice_member")
-        practice_member_history_data = await connection.fetch("SELECT * FROM teams.practice_member_history")
+        if image_requests:
+            self.create_task(self._load_image_requests(image_requests))
+
+        return len(image_requests)
+
+    @cache_loader("PRACTICES", depends_on=("TEAMS",))
+    async def _cache_setup_practices(self, connection: ConnectionType) -> int:
+        snapshot: Optional[PracticeSnapshot] = None
+        if CACHE_SNAPSHOT_PATH:
+            snapshot = await self.wrap(PracticeSnapshot.read, CACHE_SNAPSHOT_PATH)
+
+        history_cutoff = self._get_practice_history_cutoff()
+
+        practice_data: List[Dict[str, Any]]
+        practice_member_data: List[Dict[str, Any]]
+        practice_member_history_data: List[Dict[str, Any]]
+        if snapshot is not None:
+            # Only the rows that have changed since the snapshot was taken need to be fetched.
+            practice_data, practice_member_data, practice_member_history_data = await snapshot.fetch_rows(connection)
+        else:
+            practice_data = list(map(dict, await connection.fetch("SELECT * FROM teams.practice")))
+            practice_member_data = list(map(dict, await connection.fetch("SELECT * FROM teams.practice_member")))
+
+            if history_cutoff is None:
+                practice_member_history_data = list(
+                    map(dict, await connection.fetch("SELECT * FROM teams.practice_member_history"))
+                )
+            else:
+                # The history of old practices is trimmed once loaded anyways, so only their totals are fetched.
+                practice_member_history_data = list(
+                    map(
+                        dict,
+                        await connection.fetch(
+                            """
+                            SELECT history.* FROM teams.practice_member_history AS history
+                            INNER JOIN teams.practice AS practice ON practice.id = history.practice_id
+                            WHERE practice.ended_at IS NULL OR practice.ended_at > $1
+                            """,
+                            history_cutoff,
+                        ),
+                    )
+                )
+
+                practice_totals = await connection.fetch(
+                    """
+                    SELECT history.practice_id, history.member_id,
+                        EXTRACT(EPOCH FROM SUM(history.left_at - history.joined_at))::float8 AS practice_seconds
+                    FROM teams.practice_member_history AS history
+                    INNER JOIN teams.practice AS practice ON practice.id = history.practice_id
+                    WHERE practice.ended_at <= $1
+                    GROUP BY history.practice_id, history.member_id
+                    """,
+                    history_cutoff,
+                )
+                practice_seconds_mapping = {
+                    (record['practice_id'], record['member_id']): record['practice_seconds'] for record in practice_totals
+                }
+                for entry in practice_member_data:
+                    entry['practice_seconds'] = practice_seconds_mapping.get((entry['practice_id'], entry['member_id']))
 
         # Sort the member data to be {practice_id: {member_id: data}} because we can have more than one member per practice
         practice_member_mapping: Dict[int, Dict[int, Dict[Any, Any]]] = {}
@@ -833,17 +1681,186 @@ class FuryBot(commands.Bot):
             for data in member_data.values():
                 member = practice.add_member(dict(data))
 
+                practice_seconds = data.get('practice_seconds')
+                if practice_seconds is not None:
+                    # Only the total time of this member was loaded, their history is loaded on demand.
+                    member.trim_history(datetime.timedelta(seconds=practice_seconds))
+                    continue
+
                 member_practice_history = practice_member_history_mapping.get(practice.id, {}).get(member.member_id, [])
                 for history_entry in member_practice_history:
                     member.add_history(dict(history_entry))
 
-            self._team_practice_cache.setdefault(practice.guild_id, {}).setdefault(practice.team_id, {})[
-                practice.id
-            ] = practice
+            if self._should_trim_practice_history(practice, history_cutoff):
+                practice.trim_history()
+
+            self.add_practice(practice)
+
+        return len(practice_data) + len(practice_member_data) + len(practice_member_history_data)
+
+    async def _run_cache_loader(self, loader: CacheLoader) -> None:
+        try:
+            await self.wait_for_cache(*loader.depends_on)
+
+            stats = CacheLoaderStats(name=loader.name)
+            start = time.perf_counter()
+
+            async with self.safe_connection() as connection:
+                acquired = time.perf_counter()
+                rows = await loader.func(self, connection)
+
+            end = time.perf_counter()
+            if rows is None:
+                # The cache is disabled or failed to load, the cache loader has already logged why.
+                return
+
+            stats.rows = rows
+            stats.wall_time = end - start
+            stats.connection_hold_time = end - acquired
+            self.cache_loader_stats[loader.name] = stats
+
+            _log.info(
+                'Cache loader %s loaded %s rows in %.2f seconds, holding a connection for %.2f seconds.',
+                loader.name,
+                stats.rows,
+                stats.wall_time,
+                stats.connection_hold_time,
+            )
+        except Exception as exc:
+            _log.warning("Failed to load cache entry %s.", loader.name, exc_info=exc)
+        finally:
+            # Always mark the cache as ready, even on failure, so anything waiting on it is not blocked forever.
+            self._cache_ready[loader.name].set()
+
+    async def _run_cache_loaders(self) -> None:
+        start = time.perf_counter()
+
+        # Each loader waits on its own dependencies, so loaders with no dependency between them run in parallel.
+        await asyncio.gather(*(self._run_cache_loader(loader) for loader in _cache_loaders.values()))
+
+        _log.info("Finished loading %s cache entries in %.2f seconds.", len(_cache_loaders), time.perf_counter() - start)
+
+    async def write_cache_snapshot(self) -> bool:
+        """|coro|
+
+        Write the practice cache to the snapshot file set by the ``CACHE_SNAPSHOT_PATH`` environment
+        variable, so the next startup only has to fetch the rows that changed since.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the snapshot was written. Nothing is written when snapshots are disabled or the
+            practice cache has not been loaded, as that would store an incomplete cache.
+        """
+        if not CACHE_SNAPSHOT_PATH or 'PRACTICES' not in self.cache_loader_stats:
+            return False
+
+        practices = [
+            practice
+            for guild_practices in self._team_practice_cache.values()
+            for team_practices in guild_practices.values()
+            for practice in team_practices.values()
+        ]
+        snapshot = PracticeSnapshot.from_practices(practices)
+
+        start = time.perf_counter()
+        await self.wrap(snapshot.write, CACHE_SNAPSHOT_PATH)
+        _log.info('Wrote %s practices to the cache snapshot in %.2f seconds.', len(practices), time.perf_counter() - start)
+        return True
+
+    async def _cache_snapshot_loop(self) -> None:
+        await self.wait_for_cache('PRACTICES')
+
+        while not self.is_closed():
+            await asyncio.sleep(CACHE_SNAPSHOT_INTERVAL * 60)
+
+            try:
+                await self.write_cache_snapshot()
+            except Exception as exc:
+                _log.warning('Failed to write the cache snapshot.', exc_info=exc)
+
+    def _get_practice_history_cutoff(self) -> Optional[datetime.datetime]:
+        # Practices that ended before this time have their history trimmed, None when trimming is disabled.
+        if PRACTICE_HISTORY_MAX_AGE <= 0:
+            return None
+
+        return discord.utils.utcnow() - datetime.timedelta(days=PRACTICE_HISTORY_MAX_AGE)
+
+    @staticmethod
+    def _should_trim_practice_history(practice: Practice, cutoff: Optional[datetime.datetime]) -> bool:
+        return cutoff is not None and not practice.ongoing and practice.ended_at is not None and practice.ended_at <= cutoff
+
+    def trim_practice_history(self) -> int:
+        """Trim the history of every completed practice that has become older than the ``PRACTICE_HISTORY_MAX_AGE``
+        environment variable, keeping only the total practice time of each member in memory.
+
+        Returns
+        -------
+        :class:`int`
+            The amount of practices that were trimmed.
+        """
+        cutoff = self._get_practice_history_cutoff()
+        if cutoff is None:
+            return 0
+
+        trimmed = 0
+        for guild_practices in self._team_practice_cache.values():
+            for team_practices in guild_practices.values():
+                for practice in team_practices.values():
+                    if not self._should_trim_practice_history(practice, cutoff):
+                        continue
+
+                    if any(not member.history_trimmed for member in practice.members):
+                        practice.trim_history()
+                        trimmed += 1
+
+        return trimmed
+
+    async def _practice_history_trim_loop(self) -> None:
+        await self.wait_for_cache('PRACTICES')
+
+        while not self.is_closed():
+            trimmed = self.trim_practice_history()
+            if trimmed:
+                _log.info('Trimmed the history of %s practices.', trimmed)
+
+            await asyncio.sleep(60 * 60)
+
+    def _mark_caches_ready(self) -> None:
+        for event in self._cache_ready.values():
+            event.set()
+
+    @staticmethod
+    def _validate_cache_loaders() -> None:
+        # Ensure every dependency exists and that there are no cycles, otherwise
+        # the loaders would wait on each other forever.
+        visiting: List[str] = []
+        visited: List[str] = []
+
+        def visit(name: str) -> None:
+            if name in visited:
+                return
+
+            if name in visiting:
+                raise ValueError(f'Cache loader dependency cycle detected: {" -> ".join([*visiting, name])}')
+
+            loader = _cache_loaders.get(name)
+            if loader is None:
+                raise ValueError(f'Unknown cache loader dependency {name}.')
+
+            visiting.append(name)
+            for dependency in loader.depends_on:
+                visit(dependency)
+            visiting.remove(name)
+            visited.append(name)
+
+        for name in _cache_loaders:
+            visit(name)
 
     # Hooks
     async def setup_hook(self) -> None:
         if BYPASS_SETUP_HOOK:
+            self._mark_caches_ready()
             return
 
         extensions_to_load = parse_initial_extensions(initial_extensions)
@@ -852,30 +1869,40 @@ class FuryBot(commands.Bot):
 
         if BYPASS_SETUP_HOOK_CACHE_LOADING:
             _log.info("Bypassing cache loading.")
+            self._mark_caches_ready()
             return
 
-        cache_loading_functions: List[Tuple[str, Callable[..., Coroutine[Any, Any, Any]]]] = [
-            item
-            for item in inspect.getmembers(self, predicate=inspect.iscoroutinefunction)
-            if getattr(item[1], "__cache_loader__", None)
-        ]
+        self._validate_cache_loaders()
 
-        _log.info("Loading %s cache entries.", len(cache_loading_functions))
+        _log.info("Loading %s cache entries.", len(_cache_loaders))
+        self.create_task(self._run_cache_loaders())
 
-        async def _wrapped_cache_loader(
-            cache_loading_function: Callable[..., Coroutine[Any, Any, Any]],
-        ) -> None:
-            async with self.safe_connection() as connection:
-                try:
-                    await cache_loading_function(connection=connection)
-                except Exception as exc:
-                    _log.warning(
-                        "Failed to load cache entry %s.",
-                        cache_loading_function.__name__,
-                        exc_info=exc,
-                    )
+        if CACHE_SNAPSHOT_PATH and CACHE_SNAPSHOT_INTERVAL > 0:
+            self._cache_snapshot_task = self.create_task(self._cache_snapshot_loop())
 
-        for _, func in cache_loading_functions:
-            self.create_task(_wrapped_cache_loader(func))
+        if PRACTICE_HISTORY_MAX_AGE > 0:
+            self._practice_history_trim_task = self.create_task(self._practice_history_trim_loop())
+
+    async def close(self) -> None:
+        if self._cache_snapshot_task is not None:
+            self._cache_snapshot_task.cancel()
+
+        if self._practice_history_trim_task is not None:
+            self._practice_history_trim_task.cancel()
+
+        try:
+            await self.infraction_buffer.close()
+        except Exception as exc:
+            _log.warning('Failed to flush the infraction buffer on shutdown.', exc_info=exc)
+
+        try:
+            await self.message_editor.flush()
+        except Exception as exc:
+            _log.warning('Failed to send the waiting message edits on shutdown.', exc_info=exc)
+
+        try:
+            await self.write_cache_snapshot()
+        except Exception as exc:
+            _log.warning('Failed to write the cache snapshot on shutdown.', exc_info=exc)
 
-        _log.debug("Finished loading cache entries.")
+        await super().close()
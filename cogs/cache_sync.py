@@ -0,0 +1,447 @@
+"""
+Contributor-Only License v1.0
+
+This file is licensed under the Contributor-Only License. Usage is restricted to
+non-commercial purposes. Distribution, sublicensing, and sharing of this file
+are prohibited except by the original owner.
+
+Modifications are allowed solely for contributing purposes and must not
+misrepresent the original material. This license does not grant any
+patent rights or trademark rights.
+
+Full license terms are available in the LICENSE file at the root of the repository.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import logging
+from typing import TYPE_CHECKING, Any, Callable, Dict, Final, Optional, Tuple
+
+import orjson
+from dateutil.parser import isoparse
+
+from cogs.infractions import InfractionsSettings
+from cogs.teams import Team
+from cogs.teams.practices import Practice, PracticeStatus
+from cogs.teams.scrims import Scrim, ScrimStatus
+from cogs.teams.team import CaptainType, TeamCaptains, TeamMember
+from utils import RUNNING_DEVELOPMENT, BaseCog
+
+if TYPE_CHECKING:
+    import asyncpg
+
+    from bot import ConnectionType, FuryBot
+
+__all__: Tuple[str, ...] = ('CacheSync',)
+
+_log = logging.getLogger(__name__)
+if RUNNING_DEVELOPMENT:
+    _log.setLevel(logging.DEBUG)
+
+# The channel the notify_cache_change trigger in schemas/notify.sql publishes to.
+CACHE_CHANGES_CHANNEL: Final[str] = 'cache_changes'
+
+# JSON has no timestamp type, these columns are sent as ISO 8601 strings.
+TIMESTAMP_COLUMNS: Final[Tuple[str, ...]] = ('scheduled_for', 'started_at', 'ended_at', 'joined_at', 'left_at')
+
+
+@dataclasses.dataclass()
+class SyncedTable:
+    """Represents a table that publishes its changes to the bot.
+
+    Attributes
+    ----------
+    name: :class:`str`
+        The schema qualified name of the table.
+    cache: Optional[:class:`str`]
+        The flag name of the cache that holds this table, if any. Changes are only applied
+        once this cache has finished loading.
+    keys: Tuple[:class:`str`, ...]
+        The columns that identify a row, sent in place of the full row when it is too large
+        for a notification.
+    """
+
+    name: str
+    cache: Optional[str]
+    keys: Tuple[str, ...]
+
+
+# Mapping[table_name, SyncedTable]
+SYNCED_TABLES: Final[Dict[str, SyncedTable]] = {
+    table.name: table
+    for table in (
+        SyncedTable('teams.settings', 'TEAMS', ('id',)),
+        SyncedTable('teams.captains', 'TEAMS', ('team_id', 'captain_id')),
+        SyncedTable('teams.members', 'TEAMS', ('team_id', 'member_id')),
+        SyncedTable('teams.scrims', 'SCRIMS', ('id', 'guild_id')),
+        SyncedTable('teams.practice', 'PRACTICES', ('id', 'team_id', 'guild_id')),
+        SyncedTable('teams.practice_member', 'PRACTICES', ('id', 'practice_id', 'member_id')),
+        SyncedTable('teams.practice_member_history', 'PRACTICES', ('id', 'practice_id', 'member_id')),
+        SyncedTable('infractions.settings', 'INFRACTIONS_SETTINGS', ('guild_id',)),
+        # Attachment request settings are always fetched from the database, so there is nothing
+        # cached to update yet. The table still publishes its changes for when it is cached.
+        SyncedTable('images.request_settings', None, ('id',)),
+    )
+}
+
+
+@dataclasses.dataclass()
+class CacheChange:
+    """Represents a single row change published by the database.
+
+    Attributes
+    ----------
+    table: :class:`SyncedTable`
+        The table the row belongs to.
+    operation: :class:`str`
+        The operation, one of ``INSERT``, ``UPDATE`` or ``DELETE``.
+    row: Dict[:class:`str`, Any]
+        The new row, or the old row if it was deleted.
+    partial: :class:`bool`
+        Whether only the key columns of the row were sent.
+    """
+
+    table: SyncedTable
+    operation: str
+    row: Dict[str, Any]
+    partial: bool = False
+
+    @property
+    def deleted(self) -> bool:
+        """:class:`bool`: Whether the row was deleted."""
+        return self.operation == 'DELETE'
+
+
+class CacheSync(BaseCog):
+    """Keeps the bot's caches in sync with changes made to the database outside of this process,
+    such as manual SQL fixes or a second bot process.
+
+    A dedicated connection listens for the notifications published by the triggers in ``schemas/notify.sql``,
+    and each change is applied to the cached object in place. Changes made by this process are skipped,
+    as the cache has already been updated by the code that made them.
+    """
+
+    def __init__(self, bot: FuryBot) -> None:
+        super().__init__(bot)
+        self._connection: Optional[ConnectionType] = None
+        self._queue: asyncio.Queue[CacheChange] = asyncio.Queue()
+        self._worker: Optional[asyncio.Task[None]] = None
+
+        # Mapping[table_name, handler]
+        self._handlers: Dict[str, Callable[[CacheChange], None]] = {
+            'teams.settings': self._apply_team,
+            'teams.captains': self._apply_team_captain,
+            'teams.members': self._apply_team_member,
+            'teams.scrims': self._apply_scrim,
+            'teams.practice': self._apply_practice,
+            'teams.practice_member': self._apply_practice_member,
+            'teams.practice_member_history': self._apply_practice_member_history,
+            'infractions.settings': self._apply_infractions_settings,
+        }
+
+    async def cog_load(self) -> None:
+        await self._connect()
+        self._worker = self.bot.create_task(self._process_changes())
+
+    async def cog_unload(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+
+        await self._disconnect()
+
+    # Connection management
+    async def _connect(self) -> None:
+        connection: ConnectionType = await self.bot.pool.acquire()  # type: ignore
+        await connection.add_listener(CACHE_CHANGES_CHANNEL, self._on_notification)
+        connection.add_termination_listener(self._on_termination)
+        self._connection = connection
+
+    async def _disconnect(self) -> None:
+        connection, self._connection = self._connection, None
+        if connection is None:
+            return
+
+        connection.remove_termination_listener(self._on_termination)
+
+        try:
+            await connection.remove_listener(CACHE_CHANGES_CHANNEL, self._on_notification)
+        finally:
+            await self.bot.pool.release(connection)
+
+    def _on_termination(self, connection: asyncpg.Connection[Any]) -> None:
+        _log.warning('The cache sync connection was closed, reconnecting.')
+        self._connection = None
+        self.bot.create_task(self._reconnect(connection))
+
+    async def _reconnect(self, closed_connection: asyncpg.Connection[Any]) -> None:
+        # Hand the closed connection back so the pool can replace it.
+        try:
+            await self.bot.pool.release(closed_connection)  # type: ignore
+        except Exception as exc:
+            _log.debug('Failed to release the closed cache sync connection.', exc_info=exc)
+
+        delay = 1.0
+        while self._connection is None and not self.bot.is_closed():
+            try:
+                await self._connect()
+            except Exception as exc:
+                _log.warning('Failed to reconnect the cache sync connection, retrying in %s seconds.', delay, exc_info=exc)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 60.0)
+            else:
+                _log.warning(
+                    'Reconnected the cache sync connection. Changes made while disconnected were missed, '
+                    'use the cache reload command if the caches are out of date.'
+                )
+
+    # Receiving changes
+    def _on_notification(self, connection: asyncpg.Connection[Any], pid: int, channel: str, payload: str) -> None:
+        try:
+            data = orjson.loads(payload)
+        except orjson.JSONDecodeError as exc:
+            _log.warning('Received a malformed cache change notification.', exc_info=exc)
+            return
+
+        if data.get('origin') == self.bot.APPLICATION_NAME:
+            # This change was made by this process, the cache has already been updated.
+            return
+
+        table = SYNCED_TABLES.get(data['table'])
+        if table is None:
+            _log.debug('Received a cache change for unknown table %s.', data['table'])
+            return
+
+        change = CacheChange(table=table, operation=data['operation'], row=data['row'], partial=data.get('partial', False))
+        self._queue.put_nowait(change)
+
+    async def _process_changes(self) -> None:
+        # Changes are applied one at a time, in the order they were committed.
+        while True:
+            change = await self._queue.get()
+
+            try:
+                await self._process_change(change)
+            except Exception as exc:
+                _log.warning('Failed to apply a %s cache change for %s.', change.operation, change.table.name, exc_info=exc)
+
+    async def _process_change(self, change: CacheChange) -> None:
+        if change.table.cache is not None:
+            # A change applied while the cache is loading could be overwritten by the loader.
+            await self.bot.wait_for_cache(change.table.cache)
+
+        handler = self._handlers.get(change.table.name)
+        if handler is None:
+            return
+
+        if change.partial and not change.deleted:
+            row = await self._fetch_row(change)
+            if row is None:
+                # The row was deleted after this change was made, its delete notification will follow.
+                return
+
+            change.row = row
+        else:
+            change.row = self._parse_row(change.row)
+
+        _log.debug('Applying a %s cache change for %s.', change.operation, change.table.name)
+        handler(change)
+
+    async def _fetch_row(self, change: CacheChange) -> Optional[Dict[str, Any]]:
+        keys = change.table.keys
+        conditions = ' AND '.join(f'{key} = ${index}' for index, key in enumerate(keys, start=1))
+
+        record = await self.bot.fetchrow(
+            f'SELECT * FROM {change.table.name} WHERE {conditions}', *(change.row[key] for key in keys)
+        )
+
+        return record and dict(record)
+
+    @staticmethod
+    def _parse_row(row: Dict[str, Any]) -> Dict[str, Any]:
+        for column in TIMESTAMP_COLUMNS:
+            value = row.get(column)
+            if value is not None:
+                # Postgres trims trailing zeros from the fraction, which fromisoformat doesn't accept before 3.11.
+                row[column] = isoparse(value)
+
+        return row
+
+    # Applying changes
+    def _apply_team(self, change: CacheChange) -> None:
+        row = change.row
+        if change.deleted:
+            team = self.bot.find_team(row['id'])
+            if team is not None:
+                self.bot.remove_team(team.id, team.guild_id)
+
+            return
+
+        team = self.bot.get_team(row['id'], guild_id=row['guild_id'])
+        if team is None:
+            # Team.from_raw adds the team to the cache for us.
+            Team.from_raw(row, [], [], bot=self.bot)
+            return
+
+        old_channel_ids = team.channel_ids
+
+        team.category_channel_id = row['category_channel_id']
+        team.text_channel_id = row['text_channel_id']
+        team.voice_channel_id = row['voice_channel_id']
+        team.extra_channel_ids = row['extra_channel_ids']
+        team.name = row['name']
+        team.nickname = row['nickname']
+        team.description = row['description']
+        team.logo = row['logo']
+
+        if team.channel_ids != old_channel_ids:
+            self.bot.update_team_channels(team, old_channel_ids)
+
+    def _apply_team_captain(self, change: CacheChange) -> None:
+        row = change.row
+        team = self.bot.find_team(row['team_id'])
+        if team is None:
+            return
+
+        if change.deleted:
+            team.captains.pop(row['captain_id'], None)
+            return
+
+        captain = team.captains.get(row['captain_id'])
+        if captain is None:
+            team.captains[row['captain_id']] = TeamCaptains(self.bot, guild_id=team.guild_id, **row)
+        else:
+            captain.captain_type = CaptainType(row['captain_type'])
+
+    def _apply_team_member(self, change: CacheChange) -> None:
+        row = change.row
+        team = self.bot.find_team(row['team_id'])
+        if team is None:
+            return
+
+        if change.deleted:
+            team.remove_member(row['member_id'])
+            return
+
+        member = team.team_members.get(row['member_id'])
+        if member is None:
+            team.add_member(TeamMember(self.bot, guild_id=team.guild_id, **row))
+        else:
+            member.is_sub = row['is_sub']
+
+    def _apply_scrim(self, change: CacheChange) -> None:
+        row = change.row
+        if change.deleted:
+            self.bot.remove_scrim(row['id'], row['guild_id'])
+            return
+
+        row['status'] = ScrimStatus(row['status'])
+
+        scrim = self.bot.get_scrim(row['id'], row['guild_id'])
+        if scrim is None:
+            scrim = Scrim(self.bot, **row)
+            scrim.load_persistent_views()
+            self.bot.add_scrim(scrim)
+            return
+
+        # The scrim is removed and added back so the team scrim index picks up a new time or team.
+        self.bot.remove_scrim(scrim.id, scrim.guild_id)
+        for field in dataclasses.fields(Scrim):
+            if field.name in row:
+                setattr(scrim, field.name, row[field.name])
+
+        self.bot.add_scrim(scrim)
+
+    def _apply_practice(self, change: CacheChange) -> None:
+        row = change.row
+        if change.deleted:
+            self.bot.remove_practice(row['id'], row['team_id'], row['guild_id'])
+            return
+
+        practice = self.bot.get_practice(row['id'], row['team_id'], row['guild_id'])
+        if practice is None:
+            self.bot.add_practice(Practice(bot=self.bot, data=row))
+            return
+
+        practice.started_at = row['started_at']
+        practice.ended_at = row['ended_at']
+        practice.status = PracticeStatus(row['status'])
+        practice.message_id = row['message_id']
+        if not practice.ongoing:
+            practice.release_view()
+
+        self.bot.update_ongoing_practice(practice)
+        # Only the practice itself has changed.
+        self.bot.update_practice_stats(practice, members=())
+
+    def _apply_practice_member(self, change: CacheChange) -> None:
+        row = change.row
+        practice = self.bot.find_practice(row['practice_id'])
+        if practice is None:
+            return
+
+        if change.deleted:
+            practice.remove_member(row['member_id'])
+            self.bot.update_practice_stats(practice)
+            return
+
+        member = practice.get_member(row['member_id'])
+        if member is None:
+            member = practice.add_member(row)
+        else:
+            member.attending = row['attending']
+            member.reason = row['reason']
+
+        # The amount of attending members changes the points of the practice.
+        self.bot.update_practice_stats(practice, members=(member,))
+
+    def _apply_practice_member_history(self, change: CacheChange) -> None:
+        row = change.row
+        practice = self.bot.find_practice(row['practice_id'])
+        member = practice and practice.get_member(row['member_id'])
+        if member is None:
+            return
+
+        if member.history_trimmed:
+            # Only the total time of this member is kept in memory, drop any loaded history so the
+            # change is picked up the next time it is viewed.
+            self.bot.practice_history_cache.invalidate(practice.id)
+            return
+
+        history = next((entry for entry in member.history if entry.id == row['id']), None)
+        if change.deleted:
+            if history is not None:
+                member.remove_history(history)
+                self.bot.update_practice_stats(member.practice)
+
+            return
+
+        if history is None:
+            history = member.add_history(row)
+        else:
+            history.joined_at = row['joined_at']
+            history.left_at = row['left_at']
+
+        self.bot.update_practice_stats(member.practice, histories=(history,))
+
+    def _apply_infractions_settings(self, change: CacheChange) -> None:
+        row = change.row
+        if change.deleted:
+            self.bot.remove_infractions_settings(row['guild_id'])
+            return
+
+        settings = self.bot.get_infractions_settings(row['guild_id'])
+        if settings is None:
+            self.bot.add_infractions_settings(InfractionsSettings(data=row, bot=self.bot))
+            return
+
+        settings.notification_channel_id = row['notification_channel_id']
+        settings.moderator_ids = row['moderators'] or []
+        settings.moderator_role_ids = row['moderator_role_ids'] or []
+        settings.enable_no_dms_open = row['enable_no_dms_open']
+        settings.enable_infraction_counter = row['enable_infraction_counter']
+
+
+async def setup(bot: FuryBot) -> None:
+    await bot.add_cog(CacheSync(bot))
@@ -69,8 +69,7 @@ class AttachmentRequestSettings:
 
     @classmethod
     async def fetch_from_guild(cls: Type[Self], guild_id: int, /, *, bot: FuryBot) -> Optional[Self]:
-        async with bot.safe_connection() as connection:
-            data = await connection.fetchrow('SELECT * FROM images.request_settings WHERE guild_id = $1', guild_id)
+        data = await bot.fetchrow('SELECT * FROM images.request_settings WHERE guild_id = $1', guild_id)
 
         if not data:
             return None
@@ -79,8 +78,7 @@ class AttachmentRequestSettings:
 
     @classmethod
     async def fetch_from_id(cls: Type[Self], id: int, /, *, bot: FuryBot) -> Optional[Self]:
-        async with bot.safe_connection() as connection:
-            data = await connection.fetchrow('SELECT * FROM images.request_settings WHERE id = $1', id)
+        data = await bot.fetchrow('SELECT * FROM images.request_settings WHERE id = $1', id)
 
         if not data:
             return None
@@ -123,7 +121,7 @@ class AttachmentRequestSettings:
         channel_id: int = MISSING,
         notification_role_id: Optional[int] = MISSING,
     ) -> None:
-        builder = QueryBuilder('images.request_settings')
+        builder = QueryBuilder('images.request_settings', columns=('channel_id', 'notification_role_id'))
         builder.add_condition('id', self.id)
 
         if channel_id is not MISSING:
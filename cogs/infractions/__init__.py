@@ -14,13 +14,16 @@ Full license terms are available in the LICENSE file at the root of the reposito
 
 from __future__ import annotations
 
+import datetime
 from typing import TYPE_CHECKING, Union
 
 import discord
 from discord import app_commands
 
+from .buffer import InfractionBuffer as InfractionBuffer
 from .counter import InfractionCounter
 from .dm_notifications import DmNotifications
+from .history import InfractionHistory as InfractionHistory
 from .panel import DoesWantToCreateInfractionsSettings, InfractionsSettingsPanel
 from .settings import InfractionsSettings as InfractionsSettings
 
@@ -36,6 +39,15 @@ class Infractions(DmNotifications, InfractionCounter):
         default_permissions=discord.Permissions(moderate_members=True),
     )
 
+    @staticmethod
+    def _format_windowed_count(settings: InfractionsSettings, user_id: int, amount: int) -> str:
+        # Windowed counts come from a ring buffer of recent infractions, so a full buffer may be missing older ones.
+        infractions = settings.get_member_infractions(user_id)
+        if infractions and infractions.is_capped(amount):
+            return f'{amount}+'
+
+        return str(amount)
+
     @infractions.command(name='manage', description='Manage infraction settings.')
     @app_commands.default_permissions(moderate_members=True)
     @app_commands.guild_only()
@@ -82,8 +94,16 @@ class Infractions(DmNotifications, InfractionCounter):
                 content='Infraction counter is disabled. Enable it in the settings to use this command'
             )
 
+        now = discord.utils.utcnow()
         count = await settings.fetch_infractions_count_from(member.id)
-        return await interaction.edit_original_response(content=f'{member.mention} has **{count} total infractions**.')
+        last_day = await settings.fetch_infractions_count_since(member.id, now - datetime.timedelta(days=1))
+        last_week = await settings.fetch_infractions_count_since(member.id, now - datetime.timedelta(days=7))
+
+        return await interaction.edit_original_response(
+            content=f'{member.mention} has **{count} total infractions**, '
+            f'**{self._format_windowed_count(settings, member.id, last_day)}** in the last 24 hours and '
+            f'**{self._format_windowed_count(settings, member.id, last_week)}** in the last 7 days.'
+        )
 
     @infractions.command(name='recent', description='Show the hyperlink to the most recent infraction.')
     @app_commands.default_permissions(moderate_members=True)
@@ -151,15 +171,14 @@ class Infractions(DmNotifications, InfractionCounter):
 
         if isinstance(target, discord.Role):
             members = target.members
-            for member in members:
-                await settings.clear_infractions(member.id)
+            cleared = await settings.clear_infractions_many([member.id for member in members])
 
             return await interaction.edit_original_response(
-                content=f'Cleared all infractions for **{len(members)}** members that have the {target.mention} role.'
+                content=f'Cleared **{cleared}** infractions for **{len(members)}** members that have the {target.mention} role.'
             )
 
-        await settings.clear_infractions(target.id)
-        return await interaction.edit_original_response(content=f'Cleared all infractions for {target.mention}.')
+        cleared = await settings.clear_infractions(target.id)
+        return await interaction.edit_original_response(content=f'Cleared **{cleared}** infractions for {target.mention}.')
 
     # Clears all the infraction history in the guild without a target
     @infractions.command(name='clear-all', description='Clear the infraction history for all members in the guild.')
@@ -184,8 +203,10 @@ class Infractions(DmNotifications, InfractionCounter):
                 content='Infraction counter is disabled. Enable it in the settings to use this command'
             )
 
-        await settings.clear_all_infractions()
-        return await interaction.edit_original_response(content='Cleared all infractions for all members in the guild.')
+        cleared = await settings.clear_all_infractions()
+        return await interaction.edit_original_response(
+            content=f'Cleared all **{cleared}** infractions for all members in the guild.'
+        )
 
 
 async def setup(bot: FuryBot) -> None:
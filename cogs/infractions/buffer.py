@@ -0,0 +1,296 @@
+"""
+Contributor-Only License v1.0
+
+This file is licensed under the Contributor-Only License. Usage is restricted to
+non-commercial purposes. Distribution, sublicensing, and sharing of this file
+are prohibited except by the original owner.
+
+Modifications are allowed solely for contributing purposes and must not
+misrepresent the original material. This license does not grant any
+patent rights or trademark rights.
+
+Full license terms are available in the LICENSE file at the root of the repository.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+
+from utils import RUNNING_DEVELOPMENT
+
+if TYPE_CHECKING:
+    from bot import FuryBot
+
+_log = logging.getLogger(__name__)
+if RUNNING_DEVELOPMENT:
+    _log.setLevel(logging.DEBUG)
+
+# (guild_id, user_id, message_id, channel_id), in the column order of infractions.member_counter
+InfractionRecord = Tuple[int, int, int, int]
+
+COLUMNS: Tuple[str, ...] = ('guild_id', 'user_id', 'message_id', 'channel_id')
+
+
+class InfractionBuffer:
+    """Collects new infractions in memory and writes them to ``infractions.member_counter`` in batches
+    with ``COPY``, rather than holding a connection for every single AutoMod action.
+
+    A flush happens once ``flush_size`` infractions are waiting or ``flush_interval`` seconds after the
+    first one arrived, whichever comes first. When ``max_size`` infractions are waiting, adding another
+    one waits for a flush first. Infractions that still don't fit, such as when the database is
+    unreachable, are dropped and counted.
+
+    Parameters
+    ----------
+    bot: :class:`FuryBot`
+        The bot instance.
+    flush_size: :class:`int`
+        How many waiting infractions trigger a flush.
+    flush_interval: :class:`float`
+        The most seconds an infraction waits before it is flushed.
+    max_size: :class:`int`
+        The most infractions that can wait at once.
+
+    Attributes
+    ----------
+    flushes: :class:`int`
+        How many flushes have been written.
+    failed_flushes: :class:`int`
+        How many flushes failed, their infractions were put back to be retried.
+    rows_flushed: :class:`int`
+        How many infractions have been written.
+    dropped: :class:`int`
+        How many infractions were dropped because the buffer was full.
+    max_depth: :class:`int`
+        The most infractions that have waited at once.
+    last_flush_latency: :class:`float`
+        How many seconds the last flush took.
+    max_flush_latency: :class:`float`
+        How many seconds the slowest flush took.
+    total_flush_time: :class:`float`
+        How many seconds all flushes took together.
+    """
+
+    __slots__: Tuple[str, ...] = (
+        'bot',
+        'flush_size',
+        'flush_interval',
+        'max_size',
+        'flushes',
+        'failed_flushes',
+        'rows_flushed',
+        'dropped',
+        'max_depth',
+        'last_flush_latency',
+        'max_flush_latency',
+        'total_flush_time',
+        '_pending',
+        '_depth',
+        '_flush_lock',
+        '_timer',
+    )
+
+    def __init__(self, bot: FuryBot, *, flush_size: int, flush_interval: float, max_size: int) -> None:
+        self.bot: FuryBot = bot
+        self.flush_size: int = flush_size
+        self.flush_interval: float = flush_interval
+        self.max_size: int = max_size
+
+        self.flushes: int = 0
+        self.failed_flushes: int = 0
+        self.rows_flushed: int = 0
+        self.dropped: int = 0
+        self.max_depth: int = 0
+        self.last_flush_latency: float = 0.0
+        self.max_flush_latency: float = 0.0
+        self.total_flush_time: float = 0.0
+
+        # Mapping[guild_id, List[InfractionRecord]]
+        self._pending: Dict[int, List[InfractionRecord]] = {}
+        self._depth: int = 0
+        self._flush_lock: asyncio.Lock = asyncio.Lock()
+        self._timer: Optional[asyncio.Task[None]] = None
+
+    def __len__(self) -> int:
+        return self._depth
+
+    @property
+    def average_flush_latency(self) -> float:
+        """:class:`float`: How many seconds a flush took on average."""
+        return self.total_flush_time / self.flushes if self.flushes else 0.0
+
+    def get_pending(self, guild_id: int, user_id: int, /) -> List[InfractionRecord]:
+        """Get the infractions of a member that have not been written yet.
+
+        Parameters
+        ----------
+        guild_id: :class:`int`
+            The ID of the guild.
+        user_id: :class:`int`
+            The ID of the member.
+
+        Returns
+        -------
+        List[Tuple[:class:`int`, :class:`int`, :class:`int`, :class:`int`]]
+            The waiting ``(guild_id, user_id, message_id, channel_id)`` rows, oldest first.
+        """
+        return [record for record in self._pending.get(guild_id, ()) if record[1] == user_id]
+
+    def get_all_pending(self) -> List[InfractionRecord]:
+        """Get every infraction that has not been written yet.
+
+        Returns
+        -------
+        List[Tuple[:class:`int`, :class:`int`, :class:`int`, :class:`int`]]
+            The waiting ``(guild_id, user_id, message_id, channel_id)`` rows.
+        """
+        return [record for guild_records in self._pending.values() for record in guild_records]
+
+    def discard(self, guild_id: int, /, *, user_ids: Optional[Iterable[int]] = None) -> int:
+        """Drop waiting infractions without writing them, such as when they are cleared.
+
+        Parameters
+        ----------
+        guild_id: :class:`int`
+            The ID of the guild.
+        user_ids: Optional[Iterable[:class:`int`]]
+            The IDs of the members to drop the infractions of. Drops every infraction in the guild when ``None``.
+
+        Returns
+        -------
+        :class:`int`
+            How many infractions were dropped.
+        """
+        guild_records = self._pending.pop(guild_id, [])
+        if user_ids is not None:
+            targets = set(user_ids)
+            kept = [record for record in guild_records if record[1] not in targets]
+            if kept:
+                self._pending[guild_id] = kept
+
+            discarded = len(guild_records) - len(kept)
+        else:
+            discarded = len(guild_records)
+
+        self._depth -= discarded
+        return discarded
+
+    @contextlib.asynccontextmanager
+    async def hold(self) -> AsyncIterator[None]:
+        """Hold back flushes while the block runs, so that every infraction is either already written
+        or still waiting in the buffer. Waits for a flush that is already running.
+        """
+        async with self._flush_lock:
+            yield
+
+    async def add(self, guild_id: int, user_id: int, /, *, message_id: int, channel_id: int) -> bool:
+        """|coro|
+
+        Add an infraction to be written with the next flush.
+
+        Parameters
+        ----------
+        guild_id: :class:`int`
+            The ID of the guild.
+        user_id: :class:`int`
+            The ID of the member the infraction is for.
+        message_id: :class:`int`
+            The ID of the infraction notification.
+        channel_id: :class:`int`
+            The ID of the channel the infraction notification was sent in.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the infraction was added, ``False`` if it was dropped because the buffer is full.
+        """
+        if self._depth >= self.max_size:
+            await self.flush()
+
+            if self._depth >= self.max_size:
+                self.dropped += 1
+                _log.warning('Infraction buffer is full, dropping infraction %s of user %s.', message_id, user_id)
+                return False
+
+        self._pending.setdefault(guild_id, []).append((guild_id, user_id, message_id, channel_id))
+        self._depth += 1
+        self.max_depth = max(self.max_depth, self._depth)
+
+        if self._depth >= self.flush_size:
+            self.bot.create_task(self.flush())
+        elif self._timer is None:
+            self._timer = self.bot.create_task(self._flush_later())
+
+        return True
+
+    async def flush(self) -> int:
+        """|coro|
+
+        Write every waiting infraction right away. Waits for a flush that is already running.
+
+        Returns
+        -------
+        :class:`int`
+            How many infractions were written.
+        """
+        async with self._flush_lock:
+            if not self._depth:
+                return 0
+
+            if self._timer is not None and self._timer is not asyncio.current_task():
+                self._timer.cancel()
+            self._timer = None
+
+            pending, self._pending = self._pending, {}
+            self._depth = 0
+            records = [record for guild_records in pending.values() for record in guild_records]
+
+            start = time.perf_counter()
+            try:
+                async with self.bot.safe_connection() as connection:
+                    await connection.copy_records_to_table(
+                        'member_counter', schema_name='infractions', columns=COLUMNS, records=records
+                    )
+            except Exception as exc:
+                self.failed_flushes += 1
+                _log.warning('Failed to flush %s infractions, they will be retried.', len(records), exc_info=exc)
+
+                # Put the infractions back in front of the ones that came in meanwhile.
+                for guild_id, guild_records in pending.items():
+                    guild_records.extend(self._pending.get(guild_id, ()))
+                    self._pending[guild_id] = guild_records
+                self._depth += len(records)
+
+                if self._timer is None:
+                    self._timer = self.bot.create_task(self._flush_later())
+                return 0
+
+            elapsed = time.perf_counter() - start
+            self.flushes += 1
+            self.rows_flushed += len(records)
+            self.last_flush_latency = elapsed
+            self.max_flush_latency = max(self.max_flush_latency, elapsed)
+            self.total_flush_time += elapsed
+
+            _log.debug('Flushed %s infractions in %.2fms.', len(records), elapsed * 1000)
+            return len(records)
+
+    async def close(self) -> None:
+        """|coro|
+
+        Write every waiting infraction before the bot shuts down.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        await self.flush()
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        self._timer = None
+        await self.flush()
@@ -0,0 +1,253 @@
+"""
+Contributor-Only License v1.0
+
+This file is licensed under the Contributor-Only License. Usage is restricted to
+non-commercial purposes. Distribution, sublicensing, and sharing of this file
+are prohibited except by the original owner.
+
+Modifications are allowed solely for contributing purposes and must not
+misrepresent the original material. This license does not grant any
+patent rights or trademark rights.
+
+Full license terms are available in the LICENSE file at the root of the repository.
+"""
+
+from __future__ import annotations
+
+import collections
+import datetime
+from typing import Deque, Dict, Iterable, Optional, Tuple
+
+import discord
+
+# (message_id, channel_id) of an infraction notification
+RecentInfraction = Tuple[int, int]
+
+
+class MemberInfractions:
+    """Holds the infraction count of a member along with a ring buffer of their most recent infractions.
+
+    The time of an infraction is taken from the ID of its notification, so no timestamps are stored.
+
+    Parameters
+    ----------
+    maxlen: :class:`int`
+        How many recent infractions are kept.
+
+    Attributes
+    ----------
+    count: :class:`int`
+        The total amount of infractions the member has.
+    recent: Deque[Tuple[:class:`int`, :class:`int`]]
+        The ``(message_id, channel_id)`` of the most recent infractions, oldest first.
+    """
+
+    __slots__: Tuple[str, ...] = ('count', 'recent')
+
+    def __init__(self, *, maxlen: int) -> None:
+        self.count: int = 0
+        self.recent: Deque[RecentInfraction] = collections.deque(maxlen=maxlen)
+
+    def __repr__(self) -> str:
+        return f'<MemberInfractions count={self.count} recent={len(self.recent)}>'
+
+    @property
+    def most_recent(self) -> Optional[RecentInfraction]:
+        """Optional[Tuple[:class:`int`, :class:`int`]]: The ``(message_id, channel_id)`` of the most recent infraction."""
+        return self.recent[-1] if self.recent else None
+
+    def add(self, message_id: int, channel_id: int, /) -> None:
+        self.count += 1
+        if self.recent and message_id < self.recent[-1][0]:
+            # Notifications can arrive out of order, keep the ring buffer sorted by time.
+            if len(self.recent) == self.recent.maxlen and message_id < self.recent[0][0]:
+                # Older than everything in a full ring buffer
+                return
+
+            self.recent.append((message_id, channel_id))
+            ordered = sorted(self.recent)
+            self.recent.clear()
+            self.recent.extend(ordered)
+            return
+
+        self.recent.append((message_id, channel_id))
+
+    def count_since(self, when: datetime.datetime, /) -> int:
+        """Count the infractions that happened after a given time.
+
+        Parameters
+        ----------
+        when: :class:`datetime.datetime`
+            The time to count from.
+
+        Returns
+        -------
+        :class:`int`
+            The amount of infractions, at most the size of the ring buffer.
+        """
+        cutoff = discord.utils.time_snowflake(when)
+
+        amount = 0
+        for message_id, _ in reversed(self.recent):
+            if message_id < cutoff:
+                break
+
+            amount += 1
+
+        return amount
+
+    def is_capped(self, amount: int, /) -> bool:
+        """Whether a count from :meth:`count_since` may be missing infractions that no longer fit in the ring buffer.
+
+        Parameters
+        ----------
+        amount: :class:`int`
+            The count to check.
+
+        Returns
+        -------
+        :class:`bool`
+        """
+        return amount == len(self.recent) == self.recent.maxlen and self.count > amount
+
+
+class InfractionHistory:
+    """Keeps the infraction counts and recent infractions of every member in memory, per guild, so
+    counting the infractions of a member doesn't have to go to the database.
+
+    The history is seeded from ``infractions.member_counter`` when the bot starts. Until then,
+    :attr:`loaded` is ``False`` and new infractions are not tracked here.
+
+    Parameters
+    ----------
+    maxlen: :class:`int`
+        How many recent infractions are kept for each member.
+
+    Attributes
+    ----------
+    loaded: :class:`bool`
+        Whether the history has been seeded.
+    """
+
+    __slots__: Tuple[str, ...] = ('maxlen', 'loaded', '_guilds')
+
+    def __init__(self, *, maxlen: int) -> None:
+        self.maxlen: int = maxlen
+        self.loaded: bool = False
+
+        # Mapping[guild_id, Mapping[user_id, MemberInfractions]]
+        self._guilds: Dict[int, Dict[int, MemberInfractions]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(members) for members in self._guilds.values())
+
+    def get(self, guild_id: int, user_id: int, /) -> Optional[MemberInfractions]:
+        """Get the infractions of a member.
+
+        Parameters
+        ----------
+        guild_id: :class:`int`
+            The ID of the guild.
+        user_id: :class:`int`
+            The ID of the member.
+
+        Returns
+        -------
+        Optional[:class:`MemberInfractions`]
+            The infractions, ``None`` if the member has none.
+        """
+        members = self._guilds.get(guild_id)
+        if members is None:
+            return None
+
+        return members.get(user_id)
+
+    def add(self, guild_id: int, user_id: int, /, *, message_id: int, channel_id: int) -> None:
+        """Track a new infraction of a member. Does nothing until the history has been seeded.
+
+        Parameters
+        ----------
+        guild_id: :class:`int`
+            The ID of the guild.
+        user_id: :class:`int`
+            The ID of the member.
+        message_id: :class:`int`
+            The ID of the infraction notification.
+        channel_id: :class:`int`
+            The ID of the channel the infraction notification was sent in.
+        """
+        if not self.loaded:
+            return
+
+        self._get_or_create(guild_id, user_id).add(message_id, channel_id)
+
+    def remove(self, guild_id: int, user_id: int, /) -> Optional[MemberInfractions]:
+        """Forget the infractions of a member, such as when they have been cleared.
+
+        Parameters
+        ----------
+        guild_id: :class:`int`
+            The ID of the guild.
+        user_id: :class:`int`
+            The ID of the member.
+
+        Returns
+        -------
+        Optional[:class:`MemberInfractions`]
+            The removed infractions, if the member had any.
+        """
+        members = self._guilds.get(guild_id)
+        if members is None:
+            return None
+
+        return members.pop(user_id, None)
+
+    def clear(self, guild_id: int, /) -> None:
+        """Forget the infractions of every member in a guild.
+
+        Parameters
+        ----------
+        guild_id: :class:`int`
+            The ID of the guild.
+        """
+        self._guilds.pop(guild_id, None)
+
+    def load(
+        self,
+        counts: Iterable[Tuple[int, int, int]],
+        recent: Iterable[Tuple[int, int, int, int]],
+        pending: Iterable[Tuple[int, int, int, int]] = (),
+    ) -> None:
+        """Seed the history, replacing anything tracked before.
+
+        Parameters
+        ----------
+        counts: Iterable[Tuple[:class:`int`, :class:`int`, :class:`int`]]
+            The ``(guild_id, user_id, count)`` of every member with infractions.
+        recent: Iterable[Tuple[:class:`int`, :class:`int`, :class:`int`, :class:`int`]]
+            The ``(guild_id, user_id, message_id, channel_id)`` of the most recent infractions of every
+            member, oldest first. These don't add to the counts.
+        pending: Iterable[Tuple[:class:`int`, :class:`int`, :class:`int`, :class:`int`]]
+            The ``(guild_id, user_id, message_id, channel_id)`` of infractions that have not been
+            written yet. These add to the counts.
+        """
+        self._guilds = {}
+
+        for guild_id, user_id, count in counts:
+            self._get_or_create(guild_id, user_id).count = count
+
+        for guild_id, user_id, message_id, channel_id in recent:
+            self._get_or_create(guild_id, user_id).recent.append((message_id, channel_id))
+
+        for guild_id, user_id, message_id, channel_id in pending:
+            self._get_or_create(guild_id, user_id).add(message_id, channel_id)
+
+        self.loaded = True
+
+    def _get_or_create(self, guild_id: int, user_id: int) -> MemberInfractions:
+        members = self._guilds.setdefault(guild_id, {})
+        infractions = members.get(user_id)
+        if infractions is None:
+            infractions = members[user_id] = MemberInfractions(maxlen=self.maxlen)
+
+        return infractions
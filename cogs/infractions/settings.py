@@ -14,7 +14,8 @@ Full license terms are available in the LICENSE file at the root of the reposito
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, Union
+import datetime
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Type, Union
 
 import discord
 from typing_extensions import Self
@@ -24,6 +25,8 @@ from utils import QueryBuilder
 if TYPE_CHECKING:
     from bot import FuryBot
 
+    from .history import MemberInfractions
+
 MISSING = discord.utils.MISSING
 
 
@@ -154,7 +157,16 @@ class InfractionsSettings:
         enable_no_dms_open: bool = MISSING,
         enable_infraction_counter: bool = MISSING,
     ) -> None:
-        builder = QueryBuilder('infractions.settings')
+        builder = QueryBuilder(
+            'infractions.settings',
+            columns=(
+                'notification_channel_id',
+                'moderators',
+                'moderator_role_ids',
+                'enable_no_dms_open',
+                'enable_infraction_counter',
+            ),
+        )
         builder.add_condition('guild_id', self.guild_id)
 
         if notification_channel_id is not MISSING:
@@ -186,9 +198,32 @@ class InfractionsSettings:
 
         self.bot.remove_infractions_settings(self.guild_id)
 
+    def get_member_infractions(self, user_id: int, /) -> Optional[MemberInfractions]:
+        """Get the infraction count and recent infractions of a member from memory.
+
+        Parameters
+        ----------
+        user_id: :class:`int`
+            The ID of the member.
+
+        Returns
+        -------
+        Optional[:class:`MemberInfractions`]
+            The infractions, ``None`` if the member has none or the history has not been loaded.
+        """
+        return self.bot.infraction_history.get(self.guild_id, user_id)
+
     async def fetch_infractions_count_from(self, user_id: int, /) -> int:
-        async with self.bot.safe_connection() as connection:
-            count = await connection.fetchval(
+        history = self.bot.infraction_history
+        if history.loaded:
+            infractions = history.get(self.guild_id, user_id)
+            return infractions.count if infractions else 0
+
+        # Infractions that haven't been flushed yet are counted from the buffer. Flushes are held back
+        # so no infraction moves from the buffer to the table between the two reads and is counted twice.
+        async with self.bot.infraction_buffer.hold():
+            pending = len(self.bot.infraction_buffer.get_pending(self.guild_id, user_id))
+            count = await self.bot.fetchval(
                 '''
                 SELECT COUNT(*) as count
                 FROM infractions.member_counter
@@ -198,64 +233,232 @@ class InfractionsSettings:
                 user_id,
             )
 
-            if count is None:
-                return 0
+        if count is None:
+            return pending
 
-            return count
+        return count + pending
 
-    async def clear_all_infractions(self) -> None:
-        async with self.bot.safe_connection() as connection:
-            await connection.execute(
+    async def fetch_infractions_count_since(self, user_id: int, when: datetime.datetime, /) -> int:
+        history = self.bot.infraction_history
+        if history.loaded:
+            infractions = history.get(self.guild_id, user_id)
+            return infractions.count_since(when) if infractions else 0
+
+        cutoff = discord.utils.time_snowflake(when)
+        async with self.bot.infraction_buffer.hold():
+            pending = sum(
+                1 for record in self.bot.infraction_buffer.get_pending(self.guild_id, user_id) if record[2] >= cutoff
+            )
+            count = await self.bot.fetchval(
                 '''
-                DELETE FROM infractions.member_counter
-                WHERE guild_id = $1
+                SELECT COUNT(*) as count
+                FROM infractions.member_counter
+                WHERE guild_id = $1 AND user_id = $2 AND message_id >= $3
                 ''',
                 self.guild_id,
+                user_id,
+                cutoff,
             )
 
-    async def clear_infractions(self, user_id: int, /) -> None:
-        async with self.bot.safe_connection() as connection:
-            await connection.execute(
+        return (count or 0) + pending
+
+    async def clear_all_infractions(self) -> int:
+        # Flushes are held back so the waiting infractions can be dropped along with the written ones,
+        # and the history forgets exactly what was deleted.
+        async with self.bot.infraction_buffer.hold():
+            async with self.bot.safe_connection() as connection:
+                status = await connection.execute(
+                    '''
+                    DELETE FROM infractions.member_counter
+                    WHERE guild_id = $1
+                    ''',
+                    self.guild_id,
+                )
+
+            discarded = self.bot.infraction_buffer.discard(self.guild_id)
+            self.bot.infraction_history.clear(self.guild_id)
+
+        return int(status.split()[-1]) + discarded
+
+    async def clear_infractions(self, user_id: int, /) -> int:
+        return await self.clear_infractions_many((user_id,))
+
+    async def clear_infractions_many(self, user_ids: Iterable[int], /) -> int:
+        """|coro|
+
+        Clear the infractions of many members with a single statement.
+
+        Parameters
+        ----------
+        user_ids: Iterable[:class:`int`]
+            The IDs of the members to clear.
+
+        Returns
+        -------
+        :class:`int`
+            How many infractions were cleared, including ones that had not been written yet.
+        """
+        user_ids = list(set(user_ids))
+        if not user_ids:
+            return 0
+
+        # Flushes are held back so the waiting infractions can be dropped along with the written ones,
+        # and the history forgets exactly what was deleted.
+        async with self.bot.infraction_buffer.hold():
+            async with self.bot.safe_connection() as connection:
+                status = await connection.execute(
+                    '''
+                    DELETE FROM infractions.member_counter
+                    WHERE guild_id = $1 AND user_id = ANY($2::bigint[])
+                    ''',
+                    self.guild_id,
+                    user_ids,
+                )
+
+            discarded = self.bot.infraction_buffer.discard(self.guild_id, user_ids=user_ids)
+            for user_id in user_ids:
+                self.bot.infraction_history.remove(self.guild_id, user_id)
+
+        # The status of a DELETE is "DELETE <rows>"
+        return int(status.split()[-1]) + discarded
+
+    async def count_many(self, user_ids: Iterable[int], /) -> Dict[int, int]:
+        """|coro|
+
+        Count the infractions of many members at once.
+
+        Parameters
+        ----------
+        user_ids: Iterable[:class:`int`]
+            The IDs of the members to count.
+
+        Returns
+        -------
+        Dict[:class:`int`, :class:`int`]
+            A mapping of member ID to infraction count. Every given member is included.
+        """
+        user_ids = list(set(user_ids))
+        history = self.bot.infraction_history
+        if history.loaded:
+            counts: Dict[int, int] = {}
+            for user_id in user_ids:
+                infractions = history.get(self.guild_id, user_id)
+                counts[user_id] = infractions.count if infractions else 0
+
+            return counts
+
+        counts = dict.fromkeys(user_ids, 0)
+        if not user_ids:
+            return counts
+
+        async with self.bot.infraction_buffer.hold():
+            records = await self.bot.fetch(
                 '''
-                DELETE FROM infractions.member_counter
-                WHERE guild_id = $1 AND user_id = $2
+                SELECT user_id, COUNT(*) as count
+                FROM infractions.member_counter
+                WHERE guild_id = $1 AND user_id = ANY($2::bigint[])
+                GROUP BY user_id
                 ''',
                 self.guild_id,
-                user_id,
+                user_ids,
+            )
+
+            for guild_id, user_id, _, _ in self.bot.infraction_buffer.get_all_pending():
+                if guild_id == self.guild_id and user_id in counts:
+                    counts[user_id] += 1
+
+        for record in records:
+            counts[record['user_id']] += record['count']
+
+        return counts
+
+    async def export(self, user_ids: Optional[Iterable[int]] = None, /) -> List[PreviousPartialInfraction]:
+        """|coro|
+
+        Export the infractions of many members, or of every member in the guild.
+
+        Parameters
+        ----------
+        user_ids: Optional[Iterable[:class:`int`]]
+            The IDs of the members to export. Exports every member when ``None``.
+
+        Returns
+        -------
+        List[:class:`PreviousPartialInfraction`]
+            The infractions, sorted by member and then oldest first.
+        """
+        targets = None if user_ids is None else set(user_ids)
+        if targets is not None and not targets:
+            return []
+
+        # Held back so every infraction is either read here or still waiting in the buffer.
+        async with self.bot.infraction_buffer.hold():
+            records = await self.bot.fetch(
+                '''
+                SELECT user_id, message_id, channel_id
+                FROM infractions.member_counter
+                WHERE guild_id = $1 AND ($2::bigint[] IS NULL OR user_id = ANY($2::bigint[]))
+                ''',
+                self.guild_id,
+                None if targets is None else list(targets),
             )
 
+            rows = [(record['user_id'], record['message_id'], record['channel_id']) for record in records]
+            for guild_id, user_id, message_id, channel_id in self.bot.infraction_buffer.get_all_pending():
+                if guild_id == self.guild_id and (targets is None or user_id in targets):
+                    rows.append((user_id, message_id, channel_id))
+
+        rows.sort()
+        return [
+            PreviousPartialInfraction(
+                data={'user_id': user_id, 'message_id': message_id, 'channel_id': channel_id}, settings=self
+            )
+            for user_id, message_id, channel_id in rows
+        ]
+
     async def add_infraction_for(self, user_id: int, /, *, in_channel: int, message_id: int) -> None:
         if not self.notification_channel_id:
             # We cannot do anything without a notification channel
             # TODO: Maybe some sort of error?
             return
 
-        async with self.bot.safe_connection() as connection:
-            await connection.execute(
-                '''
-                INSERT INTO infractions.member_counter(guild_id, user_id, message_id, channel_id)
-                VALUES ($1, $2, $3, $4)
-                ''',
-                self.guild_id,
-                user_id,
-                message_id,
-                in_channel,
-            )
+        # Written in a batch with other infractions, see InfractionBuffer.
+        added = await self.bot.infraction_buffer.add(self.guild_id, user_id, message_id=message_id, channel_id=in_channel)
+        if added:
+            self.bot.infraction_history.add(self.guild_id, user_id, message_id=message_id, channel_id=in_channel)
 
     async def fetch_most_recent_infraction_from(self, user_id: int) -> Optional[PreviousPartialInfraction]:
-        async with self.bot.safe_connection() as connection:
-            record = await connection.fetchrow(
-                '''
-                SELECT message_id, channel_id, user_id
-                FROM infractions.member_counter
-                WHERE guild_id = $1 AND user_id = $2
-                ORDER BY message_id DESC
-                LIMIT 1
-                ''',
-                self.guild_id,
-                user_id,
-            )
-            if not record:
+        history = self.bot.infraction_history
+        if history.loaded:
+            infractions = history.get(self.guild_id, user_id)
+            most_recent = infractions and infractions.most_recent
+            if not most_recent:
                 return None
 
-            return PreviousPartialInfraction(data=dict(record), settings=self)
+            message_id, channel_id = most_recent
+            return PreviousPartialInfraction(
+                data={'user_id': user_id, 'message_id': message_id, 'channel_id': channel_id}, settings=self
+            )
+
+        pending = self.bot.infraction_buffer.get_pending(self.guild_id, user_id)
+        if pending:
+            _, _, message_id, channel_id = max(pending, key=lambda record: record[2])
+            return PreviousPartialInfraction(
+                data={'user_id': user_id, 'message_id': message_id, 'channel_id': channel_id}, settings=self
+            )
+
+        record = await self.bot.fetchrow(
+            '''
+            SELECT message_id, channel_id, user_id
+            FROM infractions.member_counter
+            WHERE guild_id = $1 AND user_id = $2
+            ORDER BY message_id DESC
+            LIMIT 1
+            ''',
+            self.guild_id,
+            user_id,
+        )
+        if not record:
+            return None
+
+        return PreviousPartialInfraction(data=dict(record), settings=self)
@@ -17,10 +17,11 @@ from __future__ import annotations
 import dataclasses
 import importlib.machinery
 import importlib.util
+import io
 import logging
 import re
 from types import ModuleType
-from typing import TYPE_CHECKING, Annotated, Any, Dict, List, Optional, Sequence
+from typing import TYPE_CHECKING, Annotated, Any, Dict, List, Optional, Sequence, Tuple
 
 import asyncpg
 import discord
@@ -35,6 +36,9 @@ _log = logging.getLogger(__name__)
 if RUNNING_DEVELOPMENT:
     _log.setLevel(logging.DEBUG)
 
+# The StatementStats attributes the sql stats command can sort by.
+QUERY_STATS_SORTS: Tuple[str, ...] = ('total_time', 'calls', 'mean_time', 'max_time', 'rows')
+
 
 def to_markdown_table(data: Sequence[Dict[Any, Any]], padding: int = 0) -> str:
     # Get all the keys from the first element.
@@ -244,6 +248,51 @@ class Owner(BaseCog):
                 return await self.bot.error_handler.log_error(exc, target=ctx, event_name='sql-fetchrow-fail')
             return await ctx.send(to_code_block(str(status), language='sql'))
 
+    @sql.command(name='pool', description='Show how long acquiring a pooled connection takes.')
+    async def pool(self, ctx: Context) -> Optional[discord.Message]:
+        stats = self.bot.pool_stats
+        data = [
+            {
+                'acquired': stats.acquired,
+                'average_wait': f'{stats.average_wait_time * 1000:.2f}ms',
+                'max_wait': f'{stats.max_wait_time * 1000:.2f}ms',
+                'timeouts': stats.timeouts,
+                'pool_size': self.bot.pool.get_size(),
+                'pool_idle': self.bot.pool.get_idle_size(),
+            }
+        ]
+        return await ctx.send(to_code_block(to_markdown_table(data, padding=1)))
+
+    @sql.command(name='stats', description='Show the statements that take up the most database time.')
+    async def stats(self, ctx: Context, limit: int = 10, sort: str = 'total_time') -> Optional[discord.Message]:
+        if sort not in QUERY_STATS_SORTS:
+            return await ctx.send(f'Can only sort by {human_join(QUERY_STATS_SORTS, transform=lambda e: f"`{e}`")}.')
+
+        statements = self.bot.query_stats.top(limit, sort=sort)
+        if not statements:
+            return await ctx.send('No statements have been recorded yet.')
+
+        data = [
+            {
+                'query': entry.query if len(entry.query) <= 80 else f'{entry.query[:77]}...',
+                'calls': entry.calls,
+                'total': f'{entry.total_time * 1000:.0f}ms',
+                'mean': f'{entry.mean_time * 1000:.2f}ms',
+                'p95': f'<={entry.percentile(0.95) * 1000:.0f}ms',
+                'max': f'{entry.max_time * 1000:.0f}ms',
+                'rows': entry.rows,
+            }
+            for entry in statements
+        ]
+        table = to_markdown_table(data, padding=1)
+
+        code_block = to_code_block(table)
+        if len(code_block) <= 2000:
+            return await ctx.send(code_block)
+
+        # Too long for a message, send it as a file instead.
+        return await ctx.send(file=discord.File(io.BytesIO(table.encode()), filename='query_stats.md'))
+
     @commands.group(name='cache', description='Reload a cache function through the bot.', invoke_without_command=True)
     @commands.is_owner()
     async def cache(self, ctx: Context) -> Optional[discord.Message]:
@@ -269,11 +318,51 @@ class Owner(BaseCog):
                     continue
 
                 # If we have found it, call it and store it for later
-                await func(self.bot, connection)
+                await func(connection)
                 statuses.append(f'Loaded cache function `{cache_name}`.')
 
         return await ctx.send('\n'.join(statuses))
 
+    @cache.command(name='stats', description='Show how long each cache function took to load.')
+    @commands.is_owner()
+    async def cache_stats(self, ctx: Context) -> Optional[discord.Message]:
+        stats = self.bot.cache_loader_stats
+        if not stats:
+            return await ctx.send('No cache functions have finished loading.')
+
+        data = [
+            {
+                'name': entry.name,
+                'ready': self.bot.is_cache_ready(entry.name),
+                'rows': entry.rows,
+                'wall_time': f'{entry.wall_time:.2f}s',
+                'connection_hold_time': f'{entry.connection_hold_time:.2f}s',
+            }
+            for entry in stats.values()
+        ]
+
+        history_cache = self.bot.practice_history_cache
+        history_stats = (
+            f'Practice history cache: {len(history_cache)}/{history_cache.maxsize} practices, '
+            f'{history_cache.hits} hits, {history_cache.misses} misses.'
+        )
+
+        message_editor = self.bot.message_editor
+        editor_stats = (
+            f'Message edits: {message_editor.edits} sent, {message_editor.dropped} dropped renders, '
+            f'{len(message_editor)} waiting.'
+        )
+
+        infraction_buffer = self.bot.infraction_buffer
+        buffer_stats = (
+            f'Infraction buffer: {len(infraction_buffer)} waiting (max {infraction_buffer.max_depth}), '
+            f'{infraction_buffer.rows_flushed} written in {infraction_buffer.flushes} flushes averaging '
+            f'{infraction_buffer.average_flush_latency * 1000:.2f}ms, {infraction_buffer.dropped} dropped.'
+        )
+        return await ctx.send(
+            f'{to_code_block(to_markdown_table(data, padding=1))}\n{history_stats}\n{editor_stats}\n{buffer_stats}'
+        )
+
 
 async def setup(bot: FuryBot):
     await bot.add_cog(Owner(bot))
@@ -428,7 +428,9 @@ class Teams(BaseCog):
             return await interaction.followup.send('This can only be used in a guild.')
 
         member_instances: List[TeamMember] = [
-            team_member for team in self.bot.get_teams(interaction.guild.id) if (team_member := team.get_member(member.id))
+            team_member
+            for team in self.bot.get_member_teams(member.id, interaction.guild.id)
+            if (team_member := team.get_member(member.id))
         ]
 
         if not member_instances:
@@ -497,6 +499,8 @@ class Teams(BaseCog):
         if not channel.guild:
             return
 
+        await self.bot.wait_for_cache('TEAMS')
+
         # This was a category channel, let's check if it was a team
         try:
             team = Team.from_channel(channel.id, channel.guild.id, bot=self.bot)
@@ -528,6 +532,8 @@ class Teams(BaseCog):
         if not channel.guild:
             return
 
+        await self.bot.wait_for_cache('TEAMS')
+
         # This was a text channel, let's check if it was a team
         try:
             team = Team.from_channel(channel.id, channel.guild.id, bot=self.bot)
@@ -578,14 +584,23 @@ class Teams(BaseCog):
         payload: :class:`discord.RawMemberRemoveEvent`
             The payload for the event.
         """
-        teams = self.bot.get_teams(payload.guild_id)
+        await self.bot.wait_for_cache('TEAMS')
+
+        teams = self.bot.get_member_teams(payload.user.id, payload.guild_id)
         if not teams:
             return
 
+        # Remove the member from every team they were on at once, then sync only those teams.
+        async with self.bot.safe_connection() as connection:
+            await connection.execute(
+                'DELETE FROM teams.members WHERE member_id = $1 AND team_id = ANY($2::int[])',
+                payload.user.id,
+                [team.id for team in teams],
+            )
+
         for team in teams:
-            team_member = team.get_member(payload.user.id)
-            if team_member is not None:
-                await team_member.remove_from_team()
+            team.remove_member(payload.user.id)
+            await team.sync()
 
 
 async def setup(bot: FuryBot) -> None:
@@ -27,8 +27,11 @@ from ..errors import MemberNotOnTeam, TeamNotFound
 from ..team import Team
 
 # for imports and ease of use for other modules
+from .analytics import *  # noqa
 from .errors import *  # noqa
+from .history import *  # noqa
 from .leaderboard import *  # noqa
+from .ledger import *  # noqa
 from .persistent import *  # noqa
 from .practice import *  # noqa
 
@@ -106,6 +109,9 @@ class PracticeCog(PracticeLeaderboardCog, BaseCog):
         message: discord.Message,
         guild: discord.Guild,
     ) -> Practice:
+        if team.get_member(member.id) is None:
+            raise MemberNotOnTeam(f'The member {member.id} is not on the team {team.id}, can not join practice.')
+
         # We can create a new practice now.
         async with self.bot.safe_connection() as connection:
             practice_data = await connection.fetchrow(
@@ -131,17 +137,9 @@ class PracticeCog(PracticeLeaderboardCog, BaseCog):
             # Add this practice to the bot so we can access it later
             self.bot.add_practice(practice)
 
-        await practice.handle_member_join(member=member, when=interaction.created_at)
-
-        # Add all members in the voice channel already
-        for connected_member in connected_channel.members:
-            if connected_member == member:
-                continue
-
-            try:
-                await practice.handle_member_join(member=connected_member, when=interaction.created_at)
-            except MemberNotOnTeam:
-                pass
+        # Add the member who started the practice and everyone already in the voice channel at once, members
+        # that aren't on the team are skipped.
+        await practice.handle_members_join([member, *connected_channel.members], when=interaction.created_at)
 
         return practice
 
@@ -223,6 +221,9 @@ class PracticeCog(PracticeLeaderboardCog, BaseCog):
             # The two channels are the same, return
             return
 
+        # The team and practice caches may still be loading right after startup.
+        await self.bot.wait_for_cache('TEAMS', 'PRACTICES')
+
         if not before.channel and after.channel:
             _log.debug("Member %s joined a voice channel.", member.id)
 
@@ -0,0 +1,379 @@
+"""
+Contributor-Only License v1.0
+
+This file is licensed under the Contributor-Only License. Usage is restricted to
+non-commercial purposes. Distribution, sublicensing, and sharing of this file
+are prohibited except by the original owner.
+
+Modifications are allowed solely for contributing purposes and must not
+misrepresent the original material. This license does not grant any
+patent rights or trademark rights.
+
+Full license terms are available in the LICENSE file at the root of the repository.
+"""
+
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy
+
+if TYPE_CHECKING:
+    from .practice import Practice, PracticeMember, PracticeMemberHistory
+
+__all__: Tuple[str, ...] = ('PracticeAnalytics',)
+
+# The amount of rows a column table starts with, it doubles in size whenever it runs out of room.
+INITIAL_CAPACITY: int = 256
+
+
+def _timestamp(dt: Optional[datetime.datetime]) -> float:
+    return numpy.nan if dt is None else dt.timestamp()
+
+
+class _ColumnTable:
+    """A growable set of NumPy columns where every row has a unique key, such as the ID of the database row
+    it mirrors, and rows are grouped by the practice they belong to. Rows are updated in place by their key.
+
+    Removed rows are only marked as dead, and are dropped once they make up half of the table.
+    """
+
+    __slots__: Tuple[str, ...] = ('_columns', '_alive', '_size', '_dead', '_rows', '_practice_rows')
+
+    def __init__(self, dtypes: Dict[str, Any]) -> None:
+        self._columns: Dict[str, numpy.ndarray[Any, Any]] = {
+            name: numpy.empty(INITIAL_CAPACITY, dtype=dtype) for name, dtype in dtypes.items()
+        }
+        self._alive: numpy.ndarray[Any, Any] = numpy.zeros(INITIAL_CAPACITY, dtype=bool)
+        self._size: int = 0
+        self._dead: int = 0
+
+        # Mapping[key, row_index]
+        self._rows: Dict[int, int] = {}
+
+        # Mapping[practice_id, Set[key]]
+        self._practice_rows: Dict[int, Set[int]] = {}
+
+    def _grow(self, capacity: int) -> None:
+        for name, column in self._columns.items():
+            grown = numpy.empty(capacity, dtype=column.dtype)
+            grown[: self._size] = column[: self._size]
+            self._columns[name] = grown
+
+        alive = numpy.zeros(capacity, dtype=bool)
+        alive[: self._size] = self._alive[: self._size]
+        self._alive = alive
+
+    def _compact(self) -> None:
+        keep = numpy.flatnonzero(self._alive[: self._size])
+        for column in self._columns.values():
+            column[: len(keep)] = column[keep]
+
+        # Both the old indexes and the keys are ordered by row, so the surviving keys map onto the new indexes in order.
+        keys = [key for key, _ in sorted(self._rows.items(), key=lambda item: item[1])]
+        self._rows = {key: index for index, key in enumerate(keys)}
+
+        self._size = len(keep)
+        self._dead = 0
+        self._alive[:] = False
+        self._alive[: self._size] = True
+
+    def __contains__(self, key: int) -> bool:
+        return key in self._rows
+
+    def upsert(self, key: int, values: Tuple[Any, ...]) -> None:
+        # Writes the row with the given key, appending it if it does not exist yet. The first value is the practice ID.
+        index = self._rows.get(key)
+        if index is None:
+            if self._size == len(self._alive):
+                self._grow(self._size * 2)
+
+            index = self._rows[key] = self._size
+            self._alive[index] = True
+            self._size += 1
+            self._practice_rows.setdefault(values[0], set()).add(key)
+
+        for column, value in zip(self._columns.values(), values):
+            column[index] = value
+
+    def remove(self, key: int) -> None:
+        index = self._rows.pop(key, None)
+        if index is None:
+            return
+
+        practice_id = int(self._columns['practice_id'][index])
+        keys = self._practice_rows.get(practice_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._practice_rows[practice_id]
+
+        self._alive[index] = False
+        self._dead += 1
+
+        if self._dead > INITIAL_CAPACITY and self._dead * 2 > self._size:
+            self._compact()
+
+    def remove_practice(self, practice_id: int) -> None:
+        for key in list(self._practice_rows.get(practice_id, ())):
+            self.remove(key)
+
+    def column(self, name: str) -> numpy.ndarray[Any, Any]:
+        return self._columns[name][: self._size]
+
+    def mask(self, team_id: int) -> numpy.ndarray[Any, Any]:
+        # The rows that are alive and belong to the given team.
+        return self._alive[: self._size] & (self.column('team_id') == team_id)
+
+
+class PracticeAnalytics:
+    """Holds the practice data of a guild in NumPy columns, so that statistics over a team's entire
+    practice history are vectorized reductions rather than walks over every practice, member and history object.
+
+    A practice is stored as rows in three tables: practices, practice members and sessions, where each
+    session is one stay of a member in the voice channel with its join and leave times. Rows mirror the
+    database rows they come from and are updated one at a time, so a member joining or leaving only
+    touches their own session row.
+
+    Parameters
+    ----------
+    guild_id: :class:`int`
+        The ID of the guild this store is for.
+
+    Attributes
+    ----------
+    guild_id: :class:`int`
+        The ID of the guild this store is for.
+    """
+
+    __slots__: Tuple[str, ...] = ('guild_id', '_practices', '_members', '_sessions')
+
+    def __init__(self, guild_id: int) -> None:
+        self.guild_id: int = guild_id
+
+        # Timestamps are stored as epoch seconds, with NaN for a practice that has not ended or a session
+        # of a member that is still in the voice channel.
+        self._practices: _ColumnTable = _ColumnTable(
+            {
+                'practice_id': numpy.int64,
+                'team_id': numpy.int64,
+                'started_at': numpy.float64,
+                'ended_at': numpy.float64,
+            }
+        )
+        # A member whose history has been trimmed from memory keeps their total time in trimmed_seconds
+        # instead of having sessions.
+        self._members: _ColumnTable = _ColumnTable(
+            {
+                'practice_id': numpy.int64,
+                'team_id': numpy.int64,
+                'member_id': numpy.int64,
+                'trimmed_seconds': numpy.float64,
+            }
+        )
+        self._sessions: _ColumnTable = _ColumnTable(
+            {
+                'practice_id': numpy.int64,
+                'team_id': numpy.int64,
+                'member_id': numpy.int64,
+                'joined_at': numpy.float64,
+                'left_at': numpy.float64,
+            }
+        )
+
+    def add_practice(self, practice: Practice, /) -> None:
+        """Add a practice to the store, replacing every row previously stored for it.
+
+        Parameters
+        ----------
+        practice: :class:`Practice`
+            The practice to add.
+        """
+        self.update_practice(practice)
+
+        self._members.remove_practice(practice.id)
+        self._sessions.remove_practice(practice.id)
+
+        for member in practice.members:
+            self.add_member(member)
+
+            for history in member.history:
+                self.update_history(history)
+
+    def update_practice(self, practice: Practice, /) -> None:
+        """Update the row of a practice itself, such as when it has ended, without touching its members.
+
+        Parameters
+        ----------
+        practice: :class:`Practice`
+            The practice to update.
+        """
+        self._practices.upsert(
+            practice.id, (practice.id, practice.team_id, _timestamp(practice.started_at), _timestamp(practice.ended_at))
+        )
+
+    def add_member(self, member: PracticeMember, /) -> None:
+        """Add the row of a member of a practice, if it is not stored yet.
+
+        Parameters
+        ----------
+        member: :class:`PracticeMember`
+            The member to add.
+        """
+        if member.id in self._members:
+            # The row only changes through add_practice. Its trimmed time must not be set while sessions
+            # of the member are still stored, or their time would be counted twice.
+            return
+
+        practice = member.practice
+        trimmed_seconds = member.get_total_practice_time().total_seconds() if member.history_trimmed else 0.0
+        self._members.upsert(member.id, (practice.id, practice.team_id, member.member_id, trimmed_seconds))
+
+    def update_history(self, history: PracticeMemberHistory, /) -> None:
+        """Add or update the session row of a history entry, such as when a member joins or leaves the voice channel.
+
+        Parameters
+        ----------
+        history: :class:`PracticeMemberHistory`
+            The history entry to update.
+        """
+        member = history.member
+        practice = member.practice
+        self.add_member(member)
+
+        self._sessions.upsert(
+            history.id,
+            (practice.id, practice.team_id, member.member_id, _timestamp(history.joined_at), _timestamp(history.left_at)),
+        )
+
+    def remove_practice(self, practice_id: int, /) -> None:
+        """Remove a practice from the store.
+
+        Parameters
+        ----------
+        practice_id: :class:`int`
+            The ID of the practice to remove.
+        """
+        self._practices.remove_practice(practice_id)
+        self._members.remove_practice(practice_id)
+        self._sessions.remove_practice(practice_id)
+
+    def _completed_mask(self, table: _ColumnTable, team_id: int) -> numpy.ndarray[Any, Any]:
+        # The rows of the given table that belong to a completed practice of the team.
+        practice_mask = self._practices.mask(team_id) & ~numpy.isnan(self._practices.column('ended_at'))
+        completed_ids = self._practices.column('practice_id')[practice_mask]
+        return table.mask(team_id) & numpy.isin(table.column('practice_id'), completed_ids)
+
+    def get_practice_count(self, team_id: int, /) -> int:
+        """Get the amount of practices a team has had, including an ongoing practice.
+
+        Parameters
+        ----------
+        team_id: :class:`int`
+            The ID of the team.
+
+        Returns
+        -------
+        :class:`int`
+        """
+        return int(numpy.count_nonzero(self._practices.mask(team_id)))
+
+    def get_total_practice_seconds(self, team_id: int, /) -> float:
+        """Get the total length, in seconds, of all completed practices of a team.
+
+        Parameters
+        ----------
+        team_id: :class:`int`
+            The ID of the team.
+
+        Returns
+        -------
+        :class:`float`
+        """
+        mask = self._practices.mask(team_id)
+        durations = self._practices.column('ended_at')[mask] - self._practices.column('started_at')[mask]
+        return float(numpy.nansum(durations))
+
+    def get_session_seconds(self, team_id: int, /, *, member_id: Optional[int] = None) -> List[float]:
+        """Get the length, in seconds, of every finished session in the practices of a team, oldest first.
+        A session is one stay of a member in the voice channel.
+
+        Parameters
+        ----------
+        team_id: :class:`int`
+            The ID of the team.
+        member_id: Optional[:class:`int`]
+            Only get the sessions of this member.
+
+        Returns
+        -------
+        List[:class:`float`]
+        """
+        joined_at = self._sessions.column('joined_at')
+        left_at = self._sessions.column('left_at')
+
+        mask = self._sessions.mask(team_id) & ~numpy.isnan(left_at)
+        if member_id is not None:
+            mask &= self._sessions.column('member_id') == member_id
+
+        order = numpy.argsort(joined_at[mask], kind='stable')
+        return (left_at[mask] - joined_at[mask])[order].tolist()
+
+    def get_member_practice_seconds(self, team_id: int, /) -> Dict[int, float]:
+        """Get the total time, in seconds, each member has spent in the completed practices of a team.
+
+        Parameters
+        ----------
+        team_id: :class:`int`
+            The ID of the team.
+
+        Returns
+        -------
+        Dict[:class:`int`, :class:`float`]
+            A mapping of member ID to their practice time. Members that were part of a practice without
+            ever joining the voice channel have a time of ``0``.
+        """
+        member_mask = self._completed_mask(self._members, team_id)
+        session_mask = self._completed_mask(self._sessions, team_id)
+
+        # Sessions still open are not counted, the same as PracticeMember.get_total_practice_time.
+        session_seconds = numpy.nan_to_num(
+            self._sessions.column('left_at')[session_mask] - self._sessions.column('joined_at')[session_mask]
+        )
+
+        member_ids = numpy.concatenate(
+            (self._members.column('member_id')[member_mask], self._sessions.column('member_id')[session_mask])
+        )
+        if not len(member_ids):
+            return {}
+
+        seconds = numpy.concatenate((self._members.column('trimmed_seconds')[member_mask], session_seconds))
+        unique_member_ids, inverse = numpy.unique(member_ids, return_inverse=True)
+        totals = numpy.bincount(inverse, weights=seconds, minlength=len(unique_member_ids))
+
+        return dict(zip(unique_member_ids.tolist(), totals.tolist()))
+
+    def get_member_absences(self, team_id: int, member_ids: Iterable[int], /) -> Dict[int, int]:
+        """Get how many practices of a team each of the given members has missed, meaning they neither
+        joined nor were excused from it.
+
+        Parameters
+        ----------
+        team_id: :class:`int`
+            The ID of the team.
+        member_ids: Iterable[:class:`int`]
+            The IDs of the members to count absences for.
+
+        Returns
+        -------
+        Dict[:class:`int`, :class:`int`]
+            A mapping of member ID to their absence count.
+        """
+        practice_count = self.get_practice_count(team_id)
+
+        present_member_ids = self._members.column('member_id')[self._members.mask(team_id)]
+        unique_member_ids, counts = numpy.unique(present_member_ids, return_counts=True)
+        attended = dict(zip(unique_member_ids.tolist(), counts.tolist()))
+
+        return {member_id: practice_count - attended.get(member_id, 0) for member_id in member_ids}
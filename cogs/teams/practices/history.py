@@ -0,0 +1,118 @@
+"""
+Contributor-Only License v1.0
+
+This file is licensed under the Contributor-Only License. Usage is restricted to
+non-commercial purposes. Distribution, sublicensing, and sharing of this file
+are prohibited except by the original owner.
+
+Modifications are allowed solely for contributing purposes and must not
+misrepresent the original material. This license does not grant any
+patent rights or trademark rights.
+
+Full license terms are available in the LICENSE file at the root of the repository.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import cachetools
+
+from .practice import PracticeMemberHistory
+
+if TYPE_CHECKING:
+    from bot import FuryBot
+
+    from .practice import PracticeMember
+
+__all__: Tuple[str, ...] = ('PracticeHistoryCache',)
+
+
+class PracticeHistoryCache:
+    """A bounded cache of the join and leave history of practices whose history has been trimmed from memory.
+
+    The history of a practice is fetched all at once the first time any of its members is looked up, and the
+    least recently used practices are dropped once the cache is full.
+
+    Parameters
+    ----------
+    bot: :class:`FuryBot`
+        The bot instance.
+    maxsize: :class:`int`
+        The maximum amount of practices to keep the history of.
+
+    Attributes
+    ----------
+    bot: :class:`FuryBot`
+        The bot instance.
+    hits: :class:`int`
+        How many lookups were served from the cache.
+    misses: :class:`int`
+        How many lookups had to fetch the history from the database.
+    """
+
+    __slots__: Tuple[str, ...] = ('bot', 'hits', 'misses', '_cache')
+
+    def __init__(self, bot: FuryBot, *, maxsize: int) -> None:
+        self.bot: FuryBot = bot
+        self.hits: int = 0
+        self.misses: int = 0
+
+        # Mapping[practice_id, Mapping[member_id, List[PracticeMemberHistory]]]
+        self._cache: cachetools.LRUCache[int, Dict[int, List[PracticeMemberHistory]]] = cachetools.LRUCache(maxsize=maxsize)
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    @property
+    def maxsize(self) -> int:
+        """:class:`int`: The maximum amount of practices to keep the history of."""
+        return int(self._cache.maxsize)
+
+    def invalidate(self, practice_id: int, /) -> None:
+        """Drop the cached history of a practice, it will be fetched again on its next lookup.
+
+        Parameters
+        ----------
+        practice_id: :class:`int`
+            The ID of the practice.
+        """
+        self._cache.pop(practice_id, None)
+
+    async def fetch(self, member: PracticeMember, /) -> List[PracticeMemberHistory]:
+        """|coro|
+
+        Get the history of a practice member, fetching the history of their practice if it is not cached.
+
+        Parameters
+        ----------
+        member: :class:`PracticeMember`
+            The member to get the history of.
+
+        Returns
+        -------
+        List[:class:`PracticeMemberHistory`]
+            The history of the member, ordered from oldest to newest.
+        """
+        entry: Optional[Dict[int, List[PracticeMemberHistory]]] = self._cache.get(member.practice_id)
+        if entry is not None:
+            self.hits += 1
+            return entry.get(member.member_id, [])
+
+        self.misses += 1
+
+        practice = member.practice
+        rows = await self.bot.fetch(
+            'SELECT * FROM teams.practice_member_history WHERE practice_id = $1 ORDER BY id', practice.id
+        )
+
+        entry = {}
+        for row in rows:
+            practice_member = practice.get_member(row['member_id'])
+            if practice_member is not None:
+                entry.setdefault(practice_member.member_id, []).append(
+                    PracticeMemberHistory(member=practice_member, data=dict(row))
+                )
+
+        self._cache[practice.id] = entry
+        return entry.get(member.member_id, [])
@@ -14,16 +14,18 @@ Full license terms are available in the LICENSE file at the root of the reposito
 
 from __future__ import annotations
 
+import asyncio
 import dataclasses
 import datetime
+import json
 import logging
-from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Final, List, Optional, Tuple
 
 import discord
 from discord import app_commands
 from discord.ext import tasks
 
-from utils import BaseCog, GuildAble, human_timedelta
+from utils import BaseCog, GuildAble, RoleSyncReport, human_timedelta
 
 if TYPE_CHECKING:
     from bot import FuryBot
@@ -35,6 +37,17 @@ __all__: Tuple[str, ...] = ("PracticeLeaderboard", "PracticeLeaderboardCog")
 _log = logging.getLogger(__name__)
 _log.setLevel(logging.DEBUG)
 
+# How often, in minutes, every leaderboard is updated.
+UPDATE_INTERVAL: Final[int] = 10
+
+# The share of the update interval the guilds are spread across, so their edits don't all happen at once
+# while leaving some room before the next update starts.
+UPDATE_SPREAD: Final[float] = 0.8
+
+
+def _hash_embed(embed: discord.Embed) -> int:
+    return hash(json.dumps(embed.to_dict(), sort_keys=True))
+
 
 @dataclasses.dataclass(init=True, kw_only=True)
 class PracticeLeaderboard(GuildAble):
@@ -59,6 +72,8 @@ class PracticeLeaderboard(GuildAble):
         Th ID of the role assigned to the members of the current top team.
     bot: :class:`FuryBot`
         The bot instance.
+    embed_hash: Optional[:class:`int`]
+        The hash of the embed last shown on the message, used to skip edits that would change nothing.
     """
 
     id: int
@@ -68,6 +83,7 @@ class PracticeLeaderboard(GuildAble):
     top_team_id: Optional[int]
     role_id: int
     bot: FuryBot
+    embed_hash: Optional[int] = dataclasses.field(default=None, repr=False, compare=False)
 
     def _get_bot(self) -> FuryBot:
         return self.bot
@@ -117,6 +133,57 @@ class PracticeLeaderboard(GuildAble):
         except discord.NotFound:
             return None
 
+    @property
+    def message_created_at(self) -> datetime.datetime:
+        """:class:`datetime.datetime`: When the message this leaderboard is bound to was sent."""
+        return discord.utils.snowflake_time(self.message_id)
+
+    def get_partial_message(self) -> Optional[discord.PartialMessage]:
+        """Get the message this leaderboard is bound to without fetching it.
+
+        Returns
+        -------
+        Optional[:class:`discord.PartialMessage`]
+            The message this leaderboard is bound to. ``None`` if the channel this leaderboard
+            is in is not found.
+        """
+        channel = self.channel
+        if channel is None:
+            return None
+
+        return channel.get_partial_message(self.message_id)
+
+    async def update_message(self, embed: discord.Embed) -> bool:
+        """|coro|
+
+        Edit the message this leaderboard is bound to, unless it already shows the given embed.
+
+        Parameters
+        ----------
+        embed: :class:`discord.Embed`
+            The embed to show.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the message was edited.
+        """
+        embed_hash = _hash_embed(embed)
+        if embed_hash == self.embed_hash:
+            return False
+
+        message = self.get_partial_message()
+        if message is None:
+            return False
+
+        try:
+            await message.edit(embed=embed)
+        except discord.NotFound:
+            return False
+
+        self.embed_hash = embed_hash
+        return True
+
     async def resend_message(self, embed: discord.Embed) -> discord.Message:
         """|coro|
 
@@ -137,9 +204,12 @@ class PracticeLeaderboard(GuildAble):
         ValueError
             The channel this leaderboard is in is not found.
         """
-        message = await self.fetch_message()
-        if message is not None:
-            await message.delete()
+        old_message = self.get_partial_message()
+        if old_message is not None:
+            try:
+                await old_message.delete()
+            except discord.NotFound:
+                pass
 
         channel = self.channel
         if not channel:
@@ -147,6 +217,7 @@ class PracticeLeaderboard(GuildAble):
 
         message = await channel.send(embed=embed)
         self.message_id = message.id
+        self.embed_hash = _hash_embed(embed)
 
         async with self.bot.safe_connection() as connection:
             await connection.execute(
@@ -157,32 +228,29 @@ class PracticeLeaderboard(GuildAble):
 
         return message
 
-    async def change_top_team(self, team: Team) -> None:
+    async def change_top_team(self, team: Team) -> Optional[RoleSyncReport]:
         """|coro|
 
         Changes the current top team to another one and manages the roles of the members.
 
+        Only the members whose role actually has to change are edited, see :class:`RoleSyncEngine`.
+
         Parameters
         ----------
         team: :class:`Team`
             The team to change the top team to.
+
+        Returns
+        -------
+        Optional[:class:`RoleSyncReport`]
+            How the role of the members was changed. ``None`` if the role no longer exists.
         """
         role = self.role
         if role is None:
             # NOTE: Add exception raising here / auto removing leaderboard
-            return
+            return None
 
         previous_top_team = self.top_team_id and self.bot.get_team(self.top_team_id, guild_id=team.guild_id)
-        if previous_top_team:
-            for team_member in previous_top_team.members:
-                discord_member = await team_member.getch_discord_member()
-                if not discord_member:
-                    continue
-
-                try:
-                    await discord_member.remove_roles(role, reason="Team member booted off leaderboard.")
-                except discord.Forbidden:
-                    pass
 
         self.top_team_id = team.id
         async with self.bot.safe_connection() as connection:
@@ -192,16 +260,23 @@ class PracticeLeaderboard(GuildAble):
                 self.id,
             )
 
-        # Add roles onto new team
-        for team_member in team.members:
-            discord_member = await team_member.getch_discord_member()
-            if not discord_member:
-                continue
-
-            try:
-                await discord_member.add_roles(role, reason="Team member booted off leaderboard.")
-            except discord.Forbidden:
-                pass
+        report = await self.bot.role_sync.sync(
+            role,
+            (team_member.member_id for team_member in team.members),
+            possible_holders=(
+                (team_member.member_id for team_member in previous_top_team.members) if previous_top_team else ()
+            ),
+            reason="Practice leaderboard top team changed.",
+        )
+        _log.info(
+            "Changed top team of leaderboard %s to %s: %s role changes applied, %s skipped, %s failed.",
+            self.id,
+            team.id,
+            report.applied,
+            report.skipped,
+            report.failed,
+        )
+        return report
 
     async def delete(self) -> None:
         """|coro|
@@ -251,16 +326,13 @@ class PracticeLeaderboardCog(BaseCog):
         A helper method called when the co is loaded. This will load all the leaderboards from the database
         into memory and start the update loop.
         """
-        async with self.bot.safe_connection() as connection:
-            data = await connection.fetch("SELECT * FROM teams.practice_leaderboards;")
+        data = await self.bot.fetch("SELECT * FROM teams.practice_leaderboards;")
 
-            for entry in data:
-                guild_id = entry["guild_id"]
-                channel_id = entry["channel_id"]
+        for entry in data:
+            guild_id = entry["guild_id"]
+            channel_id = entry["channel_id"]
 
-                self.leaderboard_cache.setdefault(guild_id, {})[channel_id] = PracticeLeaderboard(
-                    bot=self.bot, **dict(entry)
-                )
+            self.leaderboard_cache.setdefault(guild_id, {})[channel_id] = PracticeLeaderboard(bot=self.bot, **dict(entry))
 
         self.update_leaderboards.start()
 
@@ -284,16 +356,13 @@ class PracticeLeaderboardCog(BaseCog):
         List[Tuple[:class:`Team`, :class:`float`]]
             A list of tuples containing the team and their total points.
         """
-        teams = self.bot.get_teams(guild_id)
-        if not teams:
-            return []
+        ranked_teams: List[Tuple[Team, float]] = []
+        for team_id, points in self.bot.get_practice_ledger(guild_id).top():
+            team = self.bot.get_team(team_id, guild_id=guild_id)
+            if team is not None:
+                ranked_teams.append((team, points))
 
-        ranked_teams = sorted(
-            self.bot.get_teams(guild_id),
-            key=lambda team: team.total_points,
-            reverse=True,
-        )
-        return [(team, team.total_points) for team in ranked_teams]
+        return ranked_teams
 
     def create_leaderboard_embed(self, leaderboard: PracticeLeaderboard, teams: List[Tuple[Team, float]]) -> discord.Embed:
         """Creates the leaderboard embed for the given leaderboard and teams.
@@ -427,6 +496,7 @@ class PracticeLeaderboardCog(BaseCog):
 
         embed = self.create_leaderboard_embed(leaderboard, ranked_teams)
         await message.edit(embed=embed)
+        leaderboard.embed_hash = _hash_embed(embed)
 
         return await interaction.edit_original_response(
             content="Successfully created leaderboard! It automatically updates every 60 seconds.",
@@ -474,46 +544,67 @@ class PracticeLeaderboardCog(BaseCog):
 
         return await interaction.edit_original_response(content="Successfully deleted leaderboard!")
 
-    @tasks.loop(minutes=10)
+    async def update_guild_leaderboards(self, guild_id: int, leaderboards: List[PracticeLeaderboard]) -> None:
+        """|coro|
+
+        Update every leaderboard of a guild. The teams are ranked once for all of them, and
+        leaderboards whose embed has not changed are not edited.
+
+        Parameters
+        ----------
+        guild_id: :class:`int`
+            The ID of the guild.
+        leaderboards: List[:class:`PracticeLeaderboard`]
+            The leaderboards of the guild.
+        """
+        top_teams = self.rank_teams(guild_id)
+        if not top_teams:
+            return
+
+        top_team, _ = top_teams[0]
+        for leaderboard in leaderboards:
+            if top_team.id != leaderboard.top_team_id:
+                _log.debug("Change in top team for guild %s.", guild_id)
+                await leaderboard.change_top_team(top_team)
+
+            embed = self.create_leaderboard_embed(leaderboard, top_teams)
+
+            # If the message is older than 7 days long, resend it
+            if (discord.utils.utcnow() - leaderboard.message_created_at) >= datetime.timedelta(days=7):
+                await leaderboard.resend_message(embed)
+                _log.debug("Resent leaderboard %s for guild %s.", leaderboard.id, guild_id)
+            elif await leaderboard.update_message(embed):
+                _log.debug("Updated leaderboard %s for guild %s.", leaderboard.id, guild_id)
+
+    @tasks.loop(minutes=UPDATE_INTERVAL)
     async def update_leaderboards(self) -> None:
         """|coro|
 
         An loop called every 10 minutes that edits the leaderboard message with an updated embed. Will also reassign
         roles to the top team if they have changed.
+
+        The guilds are spread evenly across most of the interval, so not every leaderboard is edited at once.
         """
-        for guild_id, leaderboards in self.leaderboard_cache.items():
+        guild_ids = [guild_id for guild_id, leaderboards in self.leaderboard_cache.items() if leaderboards]
+        if not guild_ids:
+            return
+
+        delay = UPDATE_INTERVAL * 60 * UPDATE_SPREAD / len(guild_ids)
+        for index, guild_id in enumerate(guild_ids):
+            if index:
+                await asyncio.sleep(delay)
+
             guild = self.bot.get_guild(guild_id)
             if not guild:
                 _log.debug("Ignoring guild %s in update leaderboard.", guild_id)
                 continue
 
-            for leaderboard in leaderboards.values():
-                top_teams = self.rank_teams(guild_id)
-                if not top_teams:
-                    continue
-
-                top_team, _ = top_teams[0]
-                if top_team.id != leaderboard.top_team_id:
-                    _log.debug("Change in top team for guild %s.", guild_id)
-                    await leaderboard.change_top_team(top_team)
-
-                _log.debug(
-                    "Updating message for leaderboard %s for guild %s.",
-                    leaderboard.id,
-                    guild_id,
-                )
-                message = await leaderboard.fetch_message()
-                if message is None:
-                    continue
-
-                embed = self.create_leaderboard_embed(leaderboard, top_teams)
-                await message.edit(embed=embed)
-
-                # If the message is older than 7 days long, resend it
-                if (discord.utils.utcnow() - message.created_at) >= datetime.timedelta(days=7):
-                    await leaderboard.resend_message(embed)
-
-                _log.debug("Updated leaderboard %s for guild %s.", leaderboard.id, guild_id)
+            # Leaderboards can be created or deleted while waiting between guilds, so they're looked up now.
+            leaderboards = list(self.leaderboard_cache.get(guild_id, {}).values())
+            try:
+                await self.update_guild_leaderboards(guild_id, leaderboards)
+            except discord.HTTPException as exc:
+                _log.warning("Failed to update the leaderboards of guild %s.", guild_id, exc_info=exc)
 
     @update_leaderboards.before_loop
     async def before_update_leaderboards(self) -> None:
@@ -523,4 +614,5 @@ class PracticeLeaderboardCog(BaseCog):
         wait for the bot to be ready before starting the loop.
         """
         await self.bot.wait_until_ready()
+        await self.bot.wait_for_cache('TEAMS', 'PRACTICES')
         _log.info("Starting practice leaderboard update loop.")
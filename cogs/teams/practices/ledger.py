@@ -0,0 +1,187 @@
+"""
+Contributor-Only License v1.0
+
+This file is licensed under the Contributor-Only License. Usage is restricted to
+non-commercial purposes. Distribution, sublicensing, and sharing of this file
+are prohibited except by the original owner.
+
+Modifications are allowed solely for contributing purposes and must not
+misrepresent the original material. This license does not grant any
+patent rights or trademark rights.
+
+Full license terms are available in the LICENSE file at the root of the repository.
+"""
+
+from __future__ import annotations
+
+import bisect
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .practice import Practice
+
+__all__: Tuple[str, ...] = ('PracticePointsLedger',)
+
+
+class PracticePointsLedger:
+    """Keeps the total practice points of every team in a guild, along with a ranking of the teams
+    that is kept sorted as points change.
+
+    Each practice's points are recorded separately, so recording a practice again after it has
+    changed only applies the difference.
+
+    Parameters
+    ----------
+    guild_id: :class:`int`
+        The ID of the guild this ledger is for.
+
+    Attributes
+    ----------
+    guild_id: :class:`int`
+        The ID of the guild this ledger is for.
+    """
+
+    __slots__: Tuple[str, ...] = ('guild_id', '_points', '_practice_points', '_ranking')
+
+    def __init__(self, guild_id: int) -> None:
+        self.guild_id: int = guild_id
+
+        # Mapping[team_id, points], only holds the teams that are ranked
+        self._points: Dict[int, float] = {}
+
+        # Mapping[practice_id, (team_id, points)]
+        self._practice_points: Dict[int, Tuple[int, float]] = {}
+
+        # A sorted list of (-points, team_id), so the team with the most points comes first.
+        self._ranking: List[Tuple[float, int]] = []
+
+    def __len__(self) -> int:
+        return len(self._ranking)
+
+    def _unrank(self, team_id: int) -> None:
+        entry = (-self._points[team_id], team_id)
+        index = bisect.bisect_left(self._ranking, entry)
+        if index < len(self._ranking) and self._ranking[index] == entry:
+            del self._ranking[index]
+
+    def _rank(self, team_id: int) -> None:
+        bisect.insort(self._ranking, (-self._points[team_id], team_id))
+
+    def _adjust(self, team_id: int, delta: float) -> None:
+        if not delta or team_id not in self._points:
+            return
+
+        self._unrank(team_id)
+        self._points[team_id] += delta
+        self._rank(team_id)
+
+    def add_team(self, team_id: int, /) -> None:
+        """Add a team to the ranking. Any practices already recorded for the team count towards its points.
+
+        Parameters
+        ----------
+        team_id: :class:`int`
+            The ID of the team to add.
+        """
+        if team_id in self._points:
+            return
+
+        self._points[team_id] = sum(
+            points for entry_team_id, points in self._practice_points.values() if entry_team_id == team_id
+        )
+        self._rank(team_id)
+
+    def remove_team(self, team_id: int, /) -> None:
+        """Remove a team and all of its recorded practices from the ledger.
+
+        Parameters
+        ----------
+        team_id: :class:`int`
+            The ID of the team to remove.
+        """
+        if team_id in self._points:
+            self._unrank(team_id)
+            del self._points[team_id]
+
+        for practice_id in [
+            practice_id for practice_id, (entry_team_id, _) in self._practice_points.items() if entry_team_id == team_id
+        ]:
+            del self._practice_points[practice_id]
+
+    def record_practice(self, practice: Practice, /) -> None:
+        """Record the points of a practice, replacing the points previously recorded for it. A practice that
+        has not ended yet is worth no points.
+
+        Parameters
+        ----------
+        practice: :class:`Practice`
+            The practice to record.
+        """
+        points = practice.total_points or 0.0
+
+        _, previous = self._practice_points.get(practice.id, (practice.team_id, 0.0))
+        self._practice_points[practice.id] = (practice.team_id, points)
+        self._adjust(practice.team_id, points - previous)
+
+    def forget_practice(self, practice_id: int, /) -> None:
+        """Remove the points of a practice, such as when it has been deleted.
+
+        Parameters
+        ----------
+        practice_id: :class:`int`
+            The ID of the practice to remove.
+        """
+        entry = self._practice_points.pop(practice_id, None)
+        if entry is not None:
+            team_id, points = entry
+            self._adjust(team_id, -points)
+
+    def get_points(self, team_id: int, /) -> float:
+        """Get the total points of a team.
+
+        Parameters
+        ----------
+        team_id: :class:`int`
+            The ID of the team.
+
+        Returns
+        -------
+        :class:`float`
+            The total points of the team, ``0`` if it has none.
+        """
+        return self._points.get(team_id, 0.0)
+
+    def get_rank(self, team_id: int, /) -> Optional[int]:
+        """Get the rank of a team, starting at ``1`` for the team with the most points.
+
+        Parameters
+        ----------
+        team_id: :class:`int`
+            The ID of the team.
+
+        Returns
+        -------
+        Optional[:class:`int`]
+            The rank of the team, or ``None`` if the team is not in the ledger.
+        """
+        points = self._points.get(team_id)
+        if points is None:
+            return None
+
+        return bisect.bisect_left(self._ranking, (-points, team_id)) + 1
+
+    def top(self, limit: Optional[int] = None, /) -> List[Tuple[int, float]]:
+        """Get the highest ranked teams.
+
+        Parameters
+        ----------
+        limit: Optional[:class:`int`]
+            The amount of teams to get. Defaults to all teams.
+
+        Returns
+        -------
+        List[Tuple[:class:`int`, :class:`float`]]
+            The team IDs and their points, ordered from the most points to the least.
+        """
+        ranking = self._ranking if limit is None else self._ranking[:limit]
+        return [(team_id, -negative_points) for negative_points, team_id in ranking]
@@ -27,7 +27,7 @@ if TYPE_CHECKING:
     from bot import FuryBot
 
     from ..team import Team, TeamMember
-    from .practice import Practice, PracticeMember
+    from .practice import Practice, PracticeMember, PracticeMemberHistory
 
 __all__: Tuple[str, ...] = (
     "TeamPracticesPanel",
@@ -169,17 +169,23 @@ class PracticeMemberPanel(BaseView):
         The practice member to manage.
     discord_member: :class:`discord.Member`
         The :class:`discord.Member` object representing the member.
+    history: List[:class:`.PracticeMemberHistory`]
+        The history of the member during the practice. Defaults to the history the member
+        holds in memory, see :meth:`.PracticeMember.fetch_history`.
     """
 
     def __init__(
         self,
         member: PracticeMember,
         discord_member: Union[discord.Member, discord.User],
+        *,
+        history: Optional[List[PracticeMemberHistory]] = None,
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
         self.member: PracticeMember = member
         self.discord_member: Union[discord.Member, discord.User] = discord_member
+        self.history: List[PracticeMemberHistory] = member.history if history is None else history
 
     @property
     def embed(self) -> discord.Embed:
@@ -206,13 +212,13 @@ class PracticeMemberPanel(BaseView):
                 value=f"This member has marked themselves as not attending this practice.\n**Reason**: {self.member.reason}",
             )
 
-        total_time = sum(total_time.total_seconds() for history in self.member.history if (total_time := history.total_time))
+        total_time = sum(total_time.total_seconds() for history in self.history if (total_time := history.total_time))
         embed.add_field(
             name="Total Time Practicing This Session",
             value=f"In this session, this member has spent **{human_timedelta(total_time)}** practicing.",
         )
 
-        for count, history in enumerate(self.member.history, start=1):
+        for count, history in enumerate(self.history, start=1):
             left_at = (
                 history.left_at
                 and f'{discord.utils.format_dt(history.left_at, "T")} ({discord.utils.format_dt(history.left_at, "R")})'
@@ -360,7 +366,8 @@ class PracticePanel(BaseView):
                 ephemeral=True,
             )
 
-        view = self.create_child(PracticeMemberPanel, practice_member, selected)
+        history = await practice_member.fetch_history()
+        view = self.create_child(PracticeMemberPanel, practice_member, selected, history=history)
         return await interaction.response.edit_message(view=view, embed=view.embed)
 
     @discord.ui.button(label="Manage Practice Members")
@@ -14,7 +14,7 @@ Full license terms are available in the LICENSE file at the root of the reposito
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 import discord
 from typing_extensions import Self
@@ -25,6 +25,7 @@ from utils import default_button_doc_string, human_timedelta
 
 if TYPE_CHECKING:
     from bot import FuryBot
+    from utils import MessageEditStats
 
     from .practice import Practice, PracticeMember
 
@@ -253,25 +254,31 @@ class PracticeView(discord.ui.View):
         )
         return False
 
+    @property
+    def edit_stats(self) -> Optional[MessageEditStats]:
+        """Optional[:class:`MessageEditStats`]: How many times the message of this practice has been edited,
+        and how many renders were dropped in favour of a newer one."""
+        return self.practice.bot.message_editor.get_stats(self.practice.message_id)
+
+    def _render_message(self) -> Dict[str, Any]:
+        # A completed practice has no buttons left to press.
+        return {'view': self if self.practice.ongoing else None, 'embed': self.embed}
+
     async def update_message(self) -> None:
         """|coro|
 
         Updates the message this persistent view is attached to with the updated embed.
 
-        This is called whenever a practice member joins or leaves a voice channel.
+        This is called whenever a practice member joins or leaves a voice channel. Edits are debounced
+        through :attr:`FuryBot.message_editor`, so a burst of changes results in one edit showing the latest
+        state of the practice.
         """
         team_text_channel = self.practice.team and self.practice.team.text_channel
         if not team_text_channel:
             # This team text channel has been deleted, we cannot update anything
             return
 
-        message_id = self.practice.message_id
-        try:
-            message = await team_text_channel.fetch_message(message_id)
-        except discord.NotFound:
-            pass
-        else:
-            await message.edit(view=self, embed=self.embed)
+        self.practice.bot.message_editor.schedule(team_text_channel, self.practice.message_id, self._render_message)
 
     @discord.ui.button(
         label="I Can't Attend",
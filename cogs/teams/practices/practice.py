@@ -18,11 +18,11 @@ import datetime
 import enum
 import logging
 import math
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import discord
 
-from utils import TeamAble, TeamMemberAble, human_timedelta
+from utils import InsertBuilder, TeamAble, TeamMemberAble, human_timedelta
 
 from ..errors import MemberNotOnTeam
 from .errors import MemberAlreadyInPractice, MemberNotAttendingPractice, MemberNotInPractice
@@ -71,29 +71,27 @@ class PracticeMemberHistory(TeamMemberAble, TeamAble):
     left_at: Optional[:class:`datetime.datetime`]
         The time the member left the voice channel. If the member is still in the voice channel
         then this will be ``None``.
-    team_id: :class:`int`
-        The ID of the team the member is on.
     channel_id: :class:`int`
         The ID of the voice channel this practice is in.
-    guild_id: :class:`int`
-        The ID of the guild this practice is in.
     """
 
+    # A practice can have thousands of history entries, slots keep each one as small as possible. The team
+    # and guild are the same as the practice's, so they're read from it rather than stored on every entry.
+    __slots__: Tuple[str, ...] = ('member', 'id', 'joined_at', 'left_at', 'channel_id')
+
     def __init__(self, *, member: PracticeMember, data: Dict[str, Any]) -> None:
         self.member: PracticeMember = member
 
         self.id: int = data['id']
         self.joined_at: datetime.datetime = data['joined_at']
         self.left_at: Optional[datetime.datetime] = data['left_at']
-        self.team_id: int = data['team_id']
         self.channel_id: int = data['channel_id']
-        self.guild_id: int = data['guild_id']
 
     def _get_guild_id(self) -> int:
-        return self.guild_id
+        return self.member.practice.guild_id
 
     def _get_team_id(self) -> int:
-        return self.team_id
+        return self.member.practice.team_id
 
     def _get_bot(self) -> FuryBot:
         return self.member.practice.bot
@@ -101,6 +99,16 @@ class PracticeMemberHistory(TeamMemberAble, TeamAble):
     def _get_member_id(self) -> int:
         return self.member.member_id
 
+    @property
+    def team_id(self) -> int:
+        """:class:`int`: The ID of the team the member is on."""
+        return self.member.practice.team_id
+
+    @property
+    def guild_id(self) -> int:
+        """:class:`int`: The ID of the guild this practice is in."""
+        return self.member.practice.guild_id
+
     @property
     def total_time(self) -> Optional[datetime.timedelta]:
         """Returns the total time the member was in the voice channel for."""
@@ -137,8 +145,6 @@ class PracticeMember(TeamMemberAble, TeamAble):
         The ID of this practice member.
     member_id: :class:`int`
         The Discord ID of the given member.
-    practice_id: :class:`int`
-        The ID of the practice this member belongs to.
     attending: :class:`bool`
         Whether the member is attending or not. Defaults to ``True`` but
         can be ``False`` if the member has marked themselves as not attending.
@@ -147,18 +153,22 @@ class PracticeMember(TeamMemberAble, TeamAble):
         is ``False``, this will be :class:`str` 100% of the time.
     """
 
+    __slots__: Tuple[str, ...] = ('practice', 'id', 'member_id', 'attending', 'reason', '_history', '_total_time')
+
     def __init__(self, *, practice: Practice, data: Dict[str, Any]) -> None:
         self.practice: Practice = practice
 
         self.id: int = data['id']
         self.member_id: int = data['member_id']
-        self.practice_id: int = data['practice_id']
 
         self.attending: bool = data['attending']
         self.reason: Optional[str] = data['reason']
 
         self._history: List[PracticeMemberHistory] = []
 
+        # Set once the history of this member has been trimmed, the total time is all that's kept in memory.
+        self._total_time: Optional[datetime.timedelta] = None
+
     def __eq__(self, __o: object) -> bool:
         try:
             o_member_id = getattr(__o, 'member_id')  # skipcq: PTC-W0034
@@ -185,6 +195,11 @@ class PracticeMember(TeamMemberAble, TeamAble):
     def _get_member_id(self) -> int:
         return self.member_id
 
+    @property
+    def practice_id(self) -> int:
+        """:class:`int`: The ID of the practice this member belongs to."""
+        return self.practice.id
+
     def add_history(self, data: Dict[str, Any]) -> PracticeMemberHistory:
         practice_member_history = PracticeMemberHistory(member=self, data=data)
         self._history.append(practice_member_history)
@@ -203,9 +218,48 @@ class PracticeMember(TeamMemberAble, TeamAble):
 
     @property
     def history(self) -> List[PracticeMemberHistory]:
-        """List[:class:`PracticeMemberHistory`]: Returns the history for this member during this practice."""
+        """List[:class:`PracticeMemberHistory`]: Returns the history for this member during this practice.
+
+        This is empty when the history of this member has been trimmed, use :meth:`fetch_history` to load it.
+        """
         return self._history
 
+    @property
+    def history_trimmed(self) -> bool:
+        """:class:`bool`: Whether only the total practice time of this member is kept in memory, rather
+        than their full history."""
+        return self._total_time is not None
+
+    async def fetch_history(self) -> List[PracticeMemberHistory]:
+        """|coro|
+
+        Get the history for this member during this practice, loading it from the database
+        if it has been trimmed.
+
+        Returns
+        -------
+        List[:class:`PracticeMemberHistory`]
+            The history of this member.
+        """
+        if self._total_time is None:
+            return self._history
+
+        return await self.practice.bot.practice_history_cache.fetch(self)
+
+    def trim_history(self, total_time: Optional[datetime.timedelta] = None) -> None:
+        """Drop the history of this member from memory, keeping only their total practice time.
+
+        Parameters
+        ----------
+        total_time: Optional[:class:`datetime.timedelta`]
+            The total practice time to keep. Defaults to the total of the history being dropped.
+        """
+        if total_time is None:
+            total_time = self.get_total_practice_time()
+
+        self._total_time = total_time
+        self._history = []
+
     @property
     def is_practicing(self) -> bool:
         """Determines if the member is currently in the voice channel for this practice."""
@@ -222,6 +276,9 @@ class PracticeMember(TeamMemberAble, TeamAble):
 
     def get_total_practice_time(self) -> datetime.timedelta:
         """:class:`float`: Returns the total time the member has spent in the voice channel for this practice."""
+        if self._total_time is not None:
+            return self._total_time
+
         total_time: datetime.timedelta = datetime.timedelta()
         for history in self._history:
             if history.left_at is None:
@@ -246,6 +303,7 @@ class PracticeMember(TeamMemberAble, TeamAble):
 
         # Remove from the practice's cache as well
         self.practice.remove_member(self.member_id)
+        self.practice.bot.update_practice_stats(self.practice)
 
     async def handle_join(self, *, when: Optional[datetime.datetime] = None) -> PracticeMemberHistory:
         """|coro|
@@ -290,6 +348,7 @@ class PracticeMember(TeamMemberAble, TeamAble):
 
             practice_member_history = self.add_history(dict(practice_member_history_data))
 
+        self.practice.bot.update_practice_stats(self.practice, histories=(practice_member_history,))
         return practice_member_history
 
     async def handle_leave(self, *, when: Optional[datetime.datetime] = None) -> PracticeMemberHistory:
@@ -320,6 +379,7 @@ class PracticeMember(TeamMemberAble, TeamAble):
             )
 
         current_history.left_at = when
+        self.practice.bot.update_practice_stats(self.practice, histories=(current_history,))
 
         return current_history
 
@@ -377,13 +437,29 @@ class Practice(TeamAble):
     message_id: :class:`int`
         The ID of the message that is used to display the current status of the practice
         to the team members.
-    view: :class:`PracticeView`
+    view: Optional[:class:`PracticeView`]
         The persistent view used to display the current status of the practice to the team members.
-        Also used to handle the buttons for the practice.
+        Also used to handle the buttons for the practice. Only ongoing practices have a view, this
+        will be ``None`` once the practice has ended.
     started_by_id: :class:`int`
         The ID of the member that started this practice.
     """
 
+    __slots__: Tuple[str, ...] = (
+        'bot',
+        'id',
+        'started_at',
+        'ended_at',
+        'team_id',
+        'channel_id',
+        'guild_id',
+        'status',
+        'message_id',
+        'view',
+        'started_by_id',
+        '_members',
+    )
+
     def __init__(self, *, bot: FuryBot, data: Dict[str, Any]) -> None:
         self.bot: FuryBot = bot
 
@@ -398,8 +474,13 @@ class Practice(TeamAble):
         self.status: PracticeStatus = PracticeStatus(data['status'])
 
         self.message_id: int = data['message_id']
-        self.view: PracticeView = PracticeView(practice=self)
-        self.bot.add_view(self.view, message_id=self.message_id)
+
+        # Completed practices can no longer be interacted with, so only an ongoing practice
+        # registers a persistent view with the bot.
+        self.view: Optional[PracticeView] = None
+        if self.ongoing:
+            self.view = PracticeView(practice=self)
+            self.bot.add_view(self.view, message_id=self.message_id)
 
         self.started_by_id: int = data['started_by_id']
 
@@ -408,6 +489,20 @@ class Practice(TeamAble):
     def __hash__(self) -> int:
         return hash(self.id)
 
+    def release_view(self) -> Optional[PracticeView]:
+        """Stop the persistent view of this practice, removing it from the bot.
+
+        Returns
+        -------
+        Optional[:class:`PracticeView`]
+            The view that was released, or ``None`` if this practice had no view.
+        """
+        view, self.view = self.view, None
+        if view is not None:
+            view.stop()
+
+        return view
+
     def _get_guild_id(self) -> int:
         return self.guild_id
 
@@ -493,13 +588,16 @@ class Practice(TeamAble):
         -------
         Optional[:class:`float`]
             The total points this practice has generated for the team.
-            This will be ``None`` if the practice has not ended.
+            This will be ``None`` if the practice has not ended, and ``0`` if
+            fewer than two members attended.
         """
         total_time = self.duration
         if not total_time:
             return None
 
-        if len(self.attending_members) == 1:
+        # A practice of a single member earns nothing. One with no attending members, such as after
+        # every member was deleted, has nothing to take the log of.
+        if len(self.attending_members) <= 1:
             return 0
 
         hours = total_time.total_seconds() / 3600
@@ -532,6 +630,16 @@ class Practice(TeamAble):
 
         return f'{discord.utils.format_dt(self.ended_at, "F")} ({discord.utils.format_dt(self.ended_at, "R")})'
 
+    def trim_history(self) -> None:
+        """Drop the join and leave history of every member of this practice from memory, keeping only
+        their total practice times. The history is then loaded on demand through :meth:`PracticeMember.fetch_history`.
+
+        This should only be done for completed practices, as ongoing practices need the history of their members.
+        """
+        for member in self._members.values():
+            if not member.history_trimmed:
+                member.trim_history()
+
     def get_total_practice_time(self) -> Optional[datetime.timedelta]:
         """Optional[:class:`datetime.timedelta`]: The total time this practice was. This will be ``None`` if the practice has not ended."""
         if not self.ended_at:
@@ -652,8 +760,10 @@ class Practice(TeamAble):
                 raise ValueError("Failed to create practice member.")
 
         attending_member = self.add_member(dict(practice_member_data))
+        self.bot.update_practice_stats(self, members=(attending_member,))
 
-        await self.view.update_message()
+        if self.view is not None:
+            await self.view.update_message()
         return attending_member
 
     async def handle_member_join(
@@ -724,9 +834,107 @@ class Practice(TeamAble):
         # for the member so we have updated cache.
         await attending_member.handle_join(when=when)
 
-        await self.view.update_message()
+        if self.view is not None:
+            await self.view.update_message()
         return attending_member
 
+    async def handle_members_join(
+        self, members: Sequence[Union[discord.Member, discord.User]], *, when: Optional[datetime.datetime] = None
+    ) -> List[PracticeMember]:
+        """|coro|
+
+        Called when many members join a given practice session at once, such as everyone already in the voice channel
+        when the practice is started. This behaves like :meth:`handle_member_join` for every member, but creates every
+        :class:`PracticeMember` and :class:`PracticeMemberHistory` in one statement each and updates the message once.
+
+        Unlike :meth:`handle_member_join`, members that are not on the team or are not attending are skipped
+        instead of raising.
+
+        Parameters
+        ----------
+        members: Sequence[:class:`discord.Member`]
+            The members that joined the voice channel.
+        when: Optional[:class:`datetime.datetime`]
+            The time the members joined the voice channel. If this is not given, it will default to :func:`discord.utils.utcnow`.
+
+        Returns
+        -------
+        List[:class:`PracticeMember`]
+            The practice members that joined, in the order they were given.
+        """
+        when = when or discord.utils.utcnow()
+
+        team = self.team
+        if not team:
+            raise MemberNotOnTeam(f'The team {self.team_id} no longer exists, members can not join practice.')
+
+        new_member_ids: List[int] = []
+        joining_ids: List[int] = []
+        for member in members:
+            if member.id in joining_ids:
+                continue
+
+            if team.get_member(member.id) is None:
+                _log.debug("Member %s is not on the team.", member.id)
+                continue
+
+            attending_member = self.get_member(member.id)
+            if attending_member is None:
+                new_member_ids.append(member.id)
+            elif not attending_member.attending:
+                _log.debug("Member %s is not attending practice. ignoring them.", member.id)
+                continue
+
+            joining_ids.append(member.id)
+
+        if not joining_ids:
+            return []
+
+        _log.debug("Handling %s members joining practice %s at once.", len(joining_ids), self.id)
+
+        member_builder = InsertBuilder(
+            'teams.practice_member', {'member_id': 'bigint', 'practice_id': 'integer'}, returning=('*',)
+        )
+        member_builder.add_rows((member_id, self.id) for member_id in new_member_ids)
+
+        history_builder = InsertBuilder(
+            'teams.practice_member_history',
+            {
+                'joined_at': 'timestamptz',
+                'team_id': 'integer',
+                'channel_id': 'bigint',
+                'guild_id': 'bigint',
+                'practice_id': 'integer',
+                'member_id': 'bigint',
+            },
+            returning=('*',),
+        )
+        history_builder.add_rows(
+            (when, self.team_id, self.channel_id, self.guild_id, self.id, member_id) for member_id in joining_ids
+        )
+
+        async with self.bot.safe_connection() as connection:
+            practice_member_data = await member_builder.fetch(connection)
+            practice_member_history_data = await history_builder.fetch(connection)
+
+        # The cache is only touched once both inserts have been committed, a failed insert
+        # rolls both back and must not leave members in the cache that were never written.
+        for row in practice_member_data:
+            self.add_member(dict(row))
+
+        histories: List[PracticeMemberHistory] = []
+        for row in practice_member_history_data:
+            practice_member = self.get_member(row['member_id'])
+            if practice_member is not None:
+                histories.append(practice_member.add_history(dict(row)))
+
+        self.bot.update_practice_stats(self, histories=histories)
+
+        if self.view is not None:
+            await self.view.update_message()
+
+        return [practice_member for member_id in joining_ids if (practice_member := self.get_member(member_id))]
+
     async def handle_member_leave(self, *, member: discord.Member, when: Optional[datetime.datetime] = None) -> None:
         """|coro|
 
@@ -759,7 +967,8 @@ class Practice(TeamAble):
         await team_member.handle_leave(when=when)
 
         # Finally update our message to edit the embed.
-        await self.view.update_message()
+        if self.view is not None:
+            await self.view.update_message()
 
         # We need to check if all members have left the voice channel and if so, we need to mark the practice
         # as completed. Note if one member remains in the voice chat we can end it as well, they'd be alone.
@@ -783,6 +992,10 @@ class Practice(TeamAble):
         """
         self.status = PracticeStatus.completed
         self.ended_at = discord.utils.utcnow()
+        self.bot.update_ongoing_practice(self)
+        # Only the practice itself has changed.
+        self.bot.update_practice_stats(self, members=())
+
         async with self.bot.safe_connection() as connection:
             await connection.execute(
                 "UPDATE teams.practice SET status = $1, ended_at = $2 WHERE id = $3",
@@ -793,6 +1006,12 @@ class Practice(TeamAble):
 
         _log.debug("Practice %s has ended.", self.id)
 
+        # This practice can no longer be interacted with, so drop its persistent view and
+        # show the final state of the practice on its message.
+        view = self.release_view()
+        if view is not None:
+            await view.update_message()
+
         embed = await self.fetch_end_embed()
 
         # NOTE: Add a note for if only one member joins the practice session.
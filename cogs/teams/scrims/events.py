@@ -84,6 +84,8 @@ class ScrimEventListener(BaseCog):
         guild_id: :class:`int`
             The id of the guild that the scrim is in.
         """
+        await self.bot.wait_for_cache('SCRIMS')
+
         scrim = self.bot.get_scrim(scrim_id, guild_id)
         if scrim is None:
             return
@@ -158,6 +160,8 @@ class ScrimEventListener(BaseCog):
         guild_id: :class:`int`
             The id of the guild that the scrim is in.
         """
+        await self.bot.wait_for_cache('SCRIMS')
+
         scrim = self.bot.remove_scrim(scrim_id, guild_id)
         if not scrim:
             return
@@ -185,6 +189,8 @@ class ScrimEventListener(BaseCog):
         guild_id: :class:`int`
             The id of the guild that the scrim is in.
         """
+        await self.bot.wait_for_cache('SCRIMS')
+
         scrim = self.bot.get_scrim(scrim_id, guild_id)
         if not scrim:
             return
@@ -371,7 +371,20 @@ class Scrim:
         home_message_id: :class:`int`
             The ID of the home message.
         """
-        builder = QueryBuilder('teams.scrims')
+        builder = QueryBuilder(
+            'teams.scrims',
+            columns=(
+                'scrim_chat_id',
+                'scrim_scheduled_timer_id',
+                'scrim_reminder_timer_id',
+                'scrim_delete_timer_id',
+                'scheduled_for',
+                'away_confirm_anyways_message_id',
+                'away_message_id',
+                'away_confirm_anyways_voter_ids',
+                'home_message_id',
+            ),
+        )
         builder.add_condition('id', self.id)
 
         if scrim_chat_id is not MISSING:
@@ -388,7 +401,8 @@ class Scrim:
             self.scrim_delete_timer_id = scrim_delete_timer_id
         if scheduled_for is not MISSING:
             builder.add_arg('scheduled_for', scheduled_for)
-            self.scheduled_for = scheduled_for
+            old_scheduled_for, self.scheduled_for = self.scheduled_for, scheduled_for
+            self.bot.reschedule_scrim(self, old_scheduled_for)
         if away_confirm_anyways_message_id is not MISSING:
             builder.add_arg('away_confirm_anyways_message_id', away_confirm_anyways_message_id)
             self.away_confirm_anyways_message_id = away_confirm_anyways_message_id
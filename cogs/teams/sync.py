@@ -0,0 +1,189 @@
+"""
+Contributor-Only License v1.0
+
+This file is licensed under the Contributor-Only License. Usage is restricted to
+non-commercial purposes. Distribution, sublicensing, and sharing of this file
+are prohibited except by the original owner.
+
+Modifications are allowed solely for contributing purposes and must not
+misrepresent the original material. This license does not grant any
+patent rights or trademark rights.
+
+Full license terms are available in the LICENSE file at the root of the repository.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import logging
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple
+
+import discord
+
+if TYPE_CHECKING:
+    from discord.abc import Snowflake
+
+    from .team import Team
+
+__all__: Tuple[str, ...] = ('TeamSyncOperation', 'TeamSyncPlan', 'TeamSyncReport')
+
+_log = logging.getLogger(__name__)
+
+TEXT_CHANNEL_NAME: str = 'team-chat'
+VOICE_CHANNEL_NAME: str = 'Voice Chat'
+
+
+def _freeze_overwrites(overwrites: Mapping[Snowflake, discord.PermissionOverwrite]) -> Dict[int, Tuple[int, int]]:
+    # Overwrites compare by the target's ID and the raw allow and deny values, so cached roles and members
+    # compare equal to the discord.Object targets the desired overwrites are built from.
+    frozen: Dict[int, Tuple[int, int]] = {}
+    for target, overwrite in overwrites.items():
+        allow, deny = overwrite.pair()
+        frozen[target.id] = (allow.value, deny.value)
+
+    return frozen
+
+
+@dataclasses.dataclass()
+class TeamSyncOperation:
+    """A single channel edit needed to bring a team channel in sync.
+
+    Attributes
+    ----------
+    channel: :class:`discord.abc.GuildChannel`
+        The channel to edit.
+    changes: Dict[:class:`str`, Any]
+        The changed fields, such as ``name`` or ``overwrites``, and their new values.
+    """
+
+    channel: discord.abc.GuildChannel
+    changes: Dict[str, Any]
+
+    @property
+    def description(self) -> str:
+        """:class:`str`: A short description of this operation."""
+        return f'{self.channel.name} ({self.channel.id}): {", ".join(self.changes)}'
+
+    async def apply(self, *, reason: Optional[str] = None) -> None:
+        await self.channel._edit(dict(self.changes), reason=reason)  # skipcq: PYL-W0212
+
+
+@dataclasses.dataclass()
+class TeamSyncReport:
+    """The outcome of syncing the channels of a team.
+
+    Attributes
+    ----------
+    performed: List[:class:`str`]
+        The descriptions of the channel edits that were made.
+    failed: List[:class:`str`]
+        The descriptions of the channel edits that failed.
+    skipped: :class:`int`
+        How many channels were already in sync and were not edited.
+    """
+
+    performed: List[str] = dataclasses.field(default_factory=list)
+    failed: List[str] = dataclasses.field(default_factory=list)
+    skipped: int = 0
+
+
+class TeamSyncPlan:
+    """Compares the current state of a team's channels with their desired state and holds the
+    edits that are needed to get there. Channels that are already in sync are not edited.
+
+    Every channel is given the desired overwrites directly rather than syncing with its category, so
+    the edits don't depend on each other and can run at once.
+
+    Parameters
+    ----------
+    team: :class:`Team`
+        The team to sync.
+    overwrites: Dict[:class:`discord.Object`, :class:`discord.PermissionOverwrite`]
+        The desired overwrites of the team's channels, see :meth:`Team.channel_overwrites`.
+    """
+
+    __slots__: Tuple[str, ...] = ('team', 'operations', 'skipped')
+
+    def __init__(self, team: Team, overwrites: Dict[discord.Object, discord.PermissionOverwrite]) -> None:
+        self.team: Team = team
+        self.operations: List[TeamSyncOperation] = []
+        self.skipped: int = 0
+
+        if team.guild is None:
+            return
+
+        self._plan(team.category_channel, overwrites, name=team.name)
+        self._plan(team.text_channel, overwrites, name=TEXT_CHANNEL_NAME)
+        self._plan(team.voice_channel, overwrites, name=VOICE_CHANNEL_NAME)
+
+        for channel in team.extra_channels:
+            if channel.category_id == team.category_channel_id:
+                self._plan(channel, overwrites)
+            elif channel.category is not None:
+                # Extra channels outside of the team category are kept in sync with their own category.
+                self._plan(channel, channel.category.overwrites)
+
+    def __bool__(self) -> bool:
+        return bool(self.operations)
+
+    def _plan(
+        self,
+        channel: Optional[discord.abc.GuildChannel],
+        overwrites: Mapping[Snowflake, discord.PermissionOverwrite],
+        *,
+        name: Optional[str] = None,
+    ) -> None:
+        if channel is None:
+            return
+
+        changes: Dict[str, Any] = {}
+        if name is not None and channel.name != name:
+            changes['name'] = name
+
+        if _freeze_overwrites(channel.overwrites) != _freeze_overwrites(overwrites):
+            changes['overwrites'] = overwrites
+
+        if changes:
+            self.operations.append(TeamSyncOperation(channel=channel, changes=changes))
+        else:
+            self.skipped += 1
+
+    async def execute(self, *, reason: Optional[str] = 'Syncing team channels.') -> TeamSyncReport:
+        """|coro|
+
+        Apply every planned channel edit at once.
+
+        Parameters
+        ----------
+        reason: Optional[:class:`str`]
+            The reason shown in the audit log.
+
+        Returns
+        -------
+        :class:`TeamSyncReport`
+        """
+        report = TeamSyncReport(skipped=self.skipped)
+        if not self.operations:
+            return report
+
+        results = await asyncio.gather(
+            *(operation.apply(reason=reason) for operation in self.operations), return_exceptions=True
+        )
+        for operation, result in zip(self.operations, results):
+            if result is None:
+                report.performed.append(operation.description)
+            elif isinstance(result, discord.HTTPException):
+                _log.warning('Failed to sync %s for team %s.', operation.description, self.team.id, exc_info=result)
+                report.failed.append(operation.description)
+            else:
+                raise result
+
+        _log.debug(
+            'Synced team %s: %s edits performed, %s failed, %s channels already in sync.',
+            self.team.id,
+            len(report.performed),
+            len(report.failed),
+            report.skipped,
+        )
+        return report
@@ -18,14 +18,14 @@ import dataclasses
 import datetime
 import enum
 import logging
-from collections import Counter
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Type, Union
 
 import discord
 
-from utils import RUNNING_DEVELOPMENT, QueryBuilder, human_join
+from utils import RUNNING_DEVELOPMENT, BatchUpdateBuilder, InsertBuilder, QueryBuilder, human_join
 
 from .errors import TeamNotFound
+from .sync import TeamSyncPlan, TeamSyncReport
 
 if TYPE_CHECKING:
     from bot import ConnectionType, FuryBot
@@ -40,8 +40,10 @@ _log = logging.getLogger(__name__)
 if RUNNING_DEVELOPMENT:
     _log.setLevel(logging.DEBUG)
 
+# The PostgreSQL types of the columns of teams.members, used for bulk statements.
+MEMBER_COLUMN_TYPES: Dict[str, str] = {'team_id': 'integer', 'member_id': 'bigint', 'is_sub': 'boolean'}
+
 
-@dataclasses.dataclass(init=True, repr=True)
 class TeamMember:
     """Represents a member of a team.
 
@@ -60,6 +62,8 @@ class TeamMember:
         Whether the member is a sub or not.
     """
 
+    __slots__: Tuple[str, ...] = ('bot', 'team_id', 'member_id', 'guild_id', 'is_sub')
+
     def __init__(self, bot: FuryBot, *, guild_id: int, team_id: int, member_id: int, is_sub: bool) -> None:
         self.bot: FuryBot = bot
         self.team_id: int = team_id
@@ -67,6 +71,9 @@ class TeamMember:
         self.guild_id: int = guild_id
         self.is_sub: bool = is_sub
 
+    def __repr__(self) -> str:
+        return f'<TeamMember team_id={self.team_id} member_id={self.member_id} is_sub={self.is_sub}>'
+
     def __eq__(self, __o: object) -> bool:
         return isinstance(__o, self.__class__) and self.member_id == __o.member_id
 
@@ -205,12 +212,14 @@ class CaptainType(enum.Enum):
 class TeamCaptains:
     """Denotes the captains of a given team."""
 
+    __slots__: Tuple[str, ...] = ('team_id', 'captain_id', 'captain_type', 'guild_id', 'bot')
+
     def __init__(self, bot: FuryBot, *, guild_id: int, team_id: int, captain_id: int, captain_type: str) -> None:
         self.team_id: int = team_id
         self.captain_id: int = captain_id
         self.captain_type: CaptainType = CaptainType(captain_type)
         self.guild_id: int = guild_id
-        self.bot = bot
+        self.bot: FuryBot = bot
 
     @property
     def guild(self) -> Optional[discord.Guild]:
@@ -341,12 +350,11 @@ class Team:
         TeamNotFound
             A team belonging to the channel was not found.
         """
-        teams = bot.get_teams(guild_id)
-        for team in teams:
-            if team.has_channel(channel_id):
-                return team
+        team = bot.get_team_from_channel(channel_id, guild_id)
+        if team is None:
+            raise TeamNotFound("No team with that channel exists.")
 
-        raise TeamNotFound("No team with that channel exists.")
+        return team
 
     @classmethod
     def from_raw(
@@ -493,9 +501,15 @@ class Team:
 
     @property
     def scrims(self) -> List[Scrim]:
-        """List[:class:`Scrim`]: A list of all scrims this team has."""
+        """List[:class:`Scrim`]: A list of all scrims this team has, ordered by when they are scheduled for."""
         return self.bot.get_scrims_for(self.id, self.guild_id)
 
+    @property
+    def upcoming_scrims(self) -> List[Scrim]:
+        """List[:class:`Scrim`]: A list of all scrims this team has that have not started yet, ordered by when
+        they are scheduled for."""
+        return self.bot.get_upcoming_scrims_for(self.id, self.guild_id)
+
     @property
     def practices(self) -> List[Practice]:
         """List[:class:`Practice`]: A list of all practices this team has."""
@@ -504,7 +518,7 @@ class Team:
     @property
     def ongoing_practice(self) -> Optional[Practice]:
         """Optional[:class:`Practice`]: The ongoing practice for this team."""
-        return discord.utils.find(lambda practice: practice.ongoing, self.practices)
+        return self.bot.get_ongoing_practice(self.id, self.guild_id)
 
     @property
     def display_name(self) -> str:
@@ -514,11 +528,7 @@ class Team:
     @property
     def total_points(self) -> float:
         """:class:`float`: The total points for this team based on their practices."""
-        practice_points = [points for practice in self.practices if (points := practice.total_points)]
-        if not practice_points:
-            return 0
-
-        return sum(practice_points)
+        return self.bot.get_practice_ledger(self.guild_id).get_points(self.id)
 
     def mention_members(self, delimiter: str = ", ") -> str:
         """Mentions all the members in this team.
@@ -578,7 +588,15 @@ class Team:
         -------
         :class:`bool`
         """
-        return channel_id in [self.category_channel_id, self.text_channel_id, self.voice_channel_id] + self.extra_channel_ids
+        return (
+            channel_id in (self.category_channel_id, self.text_channel_id, self.voice_channel_id)
+            or channel_id in self.extra_channel_ids
+        )
+
+    @property
+    def channel_ids(self) -> List[int]:
+        """List[:class:`int`]: The IDs of all channels bound to this team, including the extra channels."""
+        return [self.category_channel_id, self.text_channel_id, self.voice_channel_id, *self.extra_channel_ids]
 
     def get_member(self, member_id: int, /) -> Optional[TeamMember]:
         """Gets a member from this team based upon the given ID.
@@ -595,6 +613,36 @@ class Team:
         """
         return self.team_members.get(member_id)
 
+    def add_member(self, team_member: TeamMember, /) -> None:
+        """Add a member to this team's cache and the bot's member index. This does not touch the database.
+
+        Parameters
+        ----------
+        team_member: :class:`TeamMember`
+            The member to add.
+        """
+        self.team_members[team_member.member_id] = team_member
+        self.bot.index_team_member(team_member)
+
+    def remove_member(self, member_id: int, /) -> Optional[TeamMember]:
+        """Remove a member from this team's cache and the bot's member index. This does not touch the database.
+
+        Parameters
+        ----------
+        member_id: :class:`int`
+            The ID of the member to remove.
+
+        Returns
+        -------
+        Optional[:class:`TeamMember`]
+            The member that was removed, if they were on the team.
+        """
+        team_member = self.team_members.pop(member_id, None)
+        if team_member is not None:
+            self.bot.unindex_team_member(team_member)
+
+        return team_member
+
     def get_practice_streak(self) -> int:
         """The current practice streak for this team. This is the number of practices in a row that have
         been completed.
@@ -633,14 +681,8 @@ class Team:
         :class:`datetime.timedelta`
             The total practice time.
         """
-        total_time = datetime.timedelta()
-
-        for practice in self.practices:
-            prac_time = practice.get_total_practice_time()
-            if prac_time is not None:
-                total_time += prac_time
-
-        return total_time
+        analytics = self.bot.get_practice_analytics(self.guild_id)
+        return datetime.timedelta(seconds=analytics.get_total_practice_seconds(self.id))
 
     def rank_member_practice_times(self) -> List[Tuple[TeamMember, datetime.timedelta]]:
         """Ranks the members of this team based upon their practice times.
@@ -650,28 +692,16 @@ class Team:
         List[Tuple[:class:`TeamMember`, :class:`datetime.timedelta`]]
             A list of tuples containing the member and their practice time.
         """
-        member_times: Dict[TeamMember, datetime.timedelta] = {}
-
-        for practice in self.practices:
-            if practice.ongoing:  # Don't count ongoing practices
-                continue
-
-            practice_time = practice.get_total_practice_time()
-            if not practice_time:  # This should never happen
-                continue
-
-            for member in practice.members:
-                team_member = self.get_member(member.member_id)
-                if team_member is None:
-                    continue
+        # Only completed practices are counted.
+        analytics = self.bot.get_practice_analytics(self.guild_id)
 
-                # Setdefault wont let us use += so we have to do this
-                if team_member not in member_times:
-                    member_times[team_member] = member.get_total_practice_time()
-                else:
-                    member_times[team_member] += member.get_total_practice_time()
+        member_times: List[Tuple[TeamMember, datetime.timedelta]] = []
+        for member_id, seconds in analytics.get_member_practice_seconds(self.id).items():
+            team_member = self.get_member(member_id)
+            if team_member is not None:
+                member_times.append((team_member, datetime.timedelta(seconds=seconds)))
 
-        return sorted(member_times.items(), key=lambda item: item[1], reverse=True)
+        return sorted(member_times, key=lambda item: item[1], reverse=True)
 
     def rank_member_absences(self) -> List[Tuple[TeamMember, int]]:
         """Ranks the members on their team based on their absences for team practices.
@@ -681,13 +711,11 @@ class Team:
         List[Tuple[:class:`TeamMember`, :class:`int`]]
             A list of tuples containing the member and their absence count.
         """
-        member_absences: Counter[TeamMember] = Counter()
+        analytics = self.bot.get_practice_analytics(self.guild_id)
+        absences = analytics.get_member_absences(self.id, self.team_members.keys())
 
-        for practice in self.practices:
-            for member in practice.missing_members:
-                member_absences[member] += 1
-
-        return member_absences.most_common()
+        member_absences = [(member, absences[member.member_id]) for member in self.members if absences[member.member_id]]
+        return sorted(member_absences, key=lambda item: item[1], reverse=True)
 
     def get_practice_rank(self) -> int:
         """|coro|
@@ -699,10 +727,13 @@ class Team:
         :class:`int`
             The rank of the team in the practice leaderboard.
         """
-        # Count up all the teams scores, rank them, then get the rank of the team we're looking for
-        teams = self.bot.get_teams(self.guild_id)
-        team_scores = [(team, team.total_points) for team in teams]
-        return sorted(team_scores, key=lambda item: item[1], reverse=True).index((self, self.total_points)) + 1
+        ledger = self.bot.get_practice_ledger(self.guild_id)
+        rank = ledger.get_rank(self.id)
+        if rank is None:
+            # This team is not cached, so rank it last.
+            return len(ledger) + 1
+
+        return rank
 
     # Captain related methods
     def has_captain(self, target_id: int, /) -> bool:
@@ -767,7 +798,11 @@ class Team:
         }
 
         for team_member in self.team_members.values():
-            discord_member = await team_member.getch_discord_member()
+            # Once the guild is chunked every member is cached, so a missing member has left the guild.
+            discord_member = guild.get_member(team_member.member_id)
+            if discord_member is None and not guild.chunked:
+                discord_member = await team_member.getch_discord_member()
+
             if discord_member:
                 overwrites[discord.Object(discord_member.id, type=discord.Member)] = discord.PermissionOverwrite(
                     view_channel=True
@@ -780,27 +815,21 @@ class Team:
 
         return overwrites
 
-    async def sync(self) -> None:
+    async def sync(self) -> TeamSyncReport:
         """|coro|
 
         Syncs the team's channels with the data in the team.
-        """
-        overwrites = await self.channel_overwrites()
-
-        if self.category_channel:
-            await self.category_channel.edit(overwrites=overwrites, name=self.name, reason='Syncing team channels.')
 
-        if self.text_channel:
-            _log.debug('Syncing text channel %s for team %s', self.text_channel.id, self.id)
-            await self.text_channel.edit(sync_permissions=True, name='team-chat', reason='Syncing team channels.')
+        Only the channels whose name or overwrites differ from what they should be are edited,
+        and those edits are made at once. See :class:`TeamSyncPlan`.
 
-        if self.voice_channel:
-            _log.debug('Syncing voice channel %s for team %s', self.voice_channel.id, self.id)
-            await self.voice_channel.edit(sync_permissions=True, name='Voice Chat', reason='Syncing team channels.')
-
-        for channel in self.extra_channels:
-            _log.debug('Syncing extra channel %s for team %s', channel.id, self)
-            await channel._edit({"sync_permissions": True}, reason="Syncing team channels.")  # skipcq: PYL-W0212
+        Returns
+        -------
+        :class:`TeamSyncReport`
+            The channel edits that were made.
+        """
+        overwrites = await self.channel_overwrites()
+        return await TeamSyncPlan(self, overwrites).execute()
 
     async def add_team_member(self, member_id: int, is_sub: bool = False) -> TeamMember:
         """|coro|
@@ -818,25 +847,49 @@ class Team:
         Returns
         -------
         :class:`TeamMember`
-            The newly added member.
+            The newly added member, or the existing one if they were already on the team.
         """
-        async with self.bot.safe_connection() as connection:
-            member_record = await connection.fetchrow(
-                "INSERT INTO teams.members(team_id, member_id, is_sub) VALUES($1, $2, $3) RETURNING *",
-                self.id,
-                member_id,
-                is_sub,
-            )
+        added = await self.add_team_members([member_id], is_sub=is_sub)
+        return added[0] if added else self.team_members[member_id]
 
-            if not member_record:
-                raise Exception("Failed to add a new member to the team.")
+    async def add_team_members(self, member_ids: Iterable[int], /, *, is_sub: bool = False) -> List[TeamMember]:
+        """|coro|
 
-        team_member = TeamMember(self.bot, guild_id=self.guild_id, **dict(member_record))
-        self.team_members[team_member.member_id] = team_member
+        Add many members to this team at once. Every member is inserted with one statement and
+        the team's channels are synced once afterwards.
+
+        Parameters
+        -----------
+        member_ids: Iterable[:class:`int`]
+            The ids of the members you want to add. Members already on the team are skipped.
+        is_sub: :class:`bool`
+            Denotes whether the new members are subs or not. This defaults
+            to ``False`..
+
+        Returns
+        -------
+        List[:class:`TeamMember`]
+            The newly added members.
+        """
+        new_member_ids = [member_id for member_id in dict.fromkeys(member_ids) if member_id not in self.team_members]
+        if not new_member_ids:
+            return []
 
-        # Now we can sync the permissions for this member
+        builder = InsertBuilder('teams.members', MEMBER_COLUMN_TYPES, returning=('*',))
+        builder.add_rows((self.id, member_id, is_sub) for member_id in new_member_ids)
+
+        async with self.bot.safe_connection() as connection:
+            member_records = await builder.fetch(connection)
+
+        team_members: List[TeamMember] = []
+        for member_record in member_records:
+            team_member = TeamMember(self.bot, guild_id=self.guild_id, **dict(member_record))
+            self.add_member(team_member)
+            team_members.append(team_member)
+
+        # Now we can sync the permissions for these members
         await self.sync()
-        return team_member
+        return team_members
 
     async def remove_team_member(self, team_member: TeamMember, /, force_voice_disconnect: bool = False) -> None:
         """|coro|
@@ -848,27 +901,99 @@ class Team:
         team_member: :class:`TeamMember`
             The member you want to remove from the team.
         """
+        await self.remove_team_members([team_member], force_voice_disconnect=force_voice_disconnect)
+
+    async def remove_team_members(
+        self, team_members: Iterable[TeamMember], /, *, force_voice_disconnect: bool = False
+    ) -> None:
+        """|coro|
+
+        Remove many members from this team at once. Every member is deleted with one statement and
+        the team's channels are synced once afterwards.
+
+        Parameters
+        ----------
+        team_members: Iterable[:class:`TeamMember`]
+            The members you want to remove from the team.
+        force_voice_disconnect: :class:`bool`
+            Whether to disconnect the members from the team's voice channels.
+        """
+        team_members = list(team_members)
+        if not team_members:
+            return
+
         async with self.bot.safe_connection() as connection:
             await connection.execute(
-                "DELETE FROM teams.members WHERE team_id = $1 AND member_id = $2",
+                "DELETE FROM teams.members WHERE team_id = $1 AND member_id = ANY($2::bigint[])",
                 self.id,
-                team_member.member_id,
+                [team_member.member_id for team_member in team_members],
             )
 
-        # Remove this member and sync the channels
-        self.team_members.pop(team_member.member_id, None)
+        # Remove these members and sync the channels
+        for team_member in team_members:
+            self.remove_member(team_member.member_id)
 
-        discord_member = await team_member.getch_discord_member()
+        if force_voice_disconnect:
+            team_voice_channels = (self.voice_channel, *self.extra_channels)
+            for team_member in team_members:
+                discord_member = await team_member.getch_discord_member()
 
-        voice = discord_member and discord_member.voice
-        connected_voice_channel = voice and voice.channel
-        member_in_team_voice = connected_voice_channel and connected_voice_channel in (
-            self.voice_channel,
-            *self.extra_channels,
-        )
+                voice = discord_member and discord_member.voice
+                connected_voice_channel = voice and voice.channel
+                if discord_member and connected_voice_channel and connected_voice_channel in team_voice_channels:
+                    await discord_member.move_to(None, reason="Member removed from the team.")
 
-        if discord_member and member_in_team_voice and force_voice_disconnect:
-            await discord_member.move_to(None, reason="Member removed from the team.")
+        await self.sync()
+
+    async def set_roster(self, member_ids: Iterable[int], /, *, sub_ids: Iterable[int] = ()) -> None:
+        """|coro|
+
+        Replace the members of this team. Members that are not given are removed, new members are added and
+        members whose role changed are promoted or demoted, each with one statement in a single transaction.
+        The team's channels are synced once afterwards.
+
+        Parameters
+        ----------
+        member_ids: Iterable[:class:`int`]
+            The ids of the members on the main roster.
+        sub_ids: Iterable[:class:`int`]
+            The ids of the subs. A member given in both is a sub.
+        """
+        roster: Dict[int, bool] = dict.fromkeys(member_ids, False)
+        roster.update(dict.fromkeys(sub_ids, True))
+
+        removed = [member_id for member_id in self.team_members if member_id not in roster]
+        added = [member_id for member_id in roster if member_id not in self.team_members]
+        changed = [
+            member_id
+            for member_id, is_sub in roster.items()
+            if member_id in self.team_members and self.team_members[member_id].is_sub != is_sub
+        ]
+        if not removed and not added and not changed:
+            return
+
+        async with self.bot.safe_connection() as connection:
+            if removed:
+                await connection.execute(
+                    "DELETE FROM teams.members WHERE team_id = $1 AND member_id = ANY($2::bigint[])", self.id, removed
+                )
+
+            insert_builder = InsertBuilder('teams.members', MEMBER_COLUMN_TYPES, returning=('*',))
+            insert_builder.add_rows((self.id, member_id, roster[member_id]) for member_id in added)
+            member_records = await insert_builder.fetch(connection)
+
+            update_builder = BatchUpdateBuilder('teams.members', ('team_id', 'member_id'), MEMBER_COLUMN_TYPES)
+            update_builder.add_rows((self.id, member_id, roster[member_id]) for member_id in changed)
+            await update_builder(connection)
+
+        for member_id in removed:
+            self.remove_member(member_id)
+
+        for member_record in member_records:
+            self.add_member(TeamMember(self.bot, guild_id=self.guild_id, **dict(member_record)))
+
+        for member_id in changed:
+            self.team_members[member_id].is_sub = roster[member_id]
 
         await self.sync()
 
@@ -922,9 +1047,23 @@ class Team:
         None
             When updated, the current instance is edited.
         """
-        builder = QueryBuilder("teams.settings")
+        builder = QueryBuilder(
+            "teams.settings",
+            columns=(
+                "name",
+                "nickname",
+                "description",
+                "logo",
+                "category_channel_id",
+                "text_channel_id",
+                "voice_channel_id",
+                "extra_channel_ids",
+            ),
+        )
         builder.add_condition("id", self.id)
 
+        old_channel_ids = self.channel_ids
+
         if name is not MISSING:
             builder.add_arg("name", name)
             self.name = name
@@ -950,6 +1089,9 @@ class Team:
             builder.add_arg("extra_channel_ids", extra_channel_ids)
             self.extra_channel_ids = extra_channel_ids
 
+        if self.channel_ids != old_channel_ids:
+            self.bot.update_team_channels(self, old_channel_ids)
+
         async with self.bot.safe_connection() as connection:
             await builder(connection)
 
@@ -63,12 +63,13 @@ class TeamTransformer(app_commands.Transformer):
         if guild is None:
             return []
 
-        guild_teams = interaction.client.get_teams(guild.id)
-        team = discord.utils.find(lambda team: team.has_channel(channel.id), guild_teams)
+        team = interaction.client.get_team_from_channel(channel.id, guild.id)
         if not team:
             # This command wasn't invoked in a team chat
             return []
 
+        guild_teams = interaction.client.get_teams(guild.id)
+
         # Great, now let's get all similar teams matching the teams name.
         team_name_parsed = ' '.join(team.name.split()[:-1])  # Turns "Rocket League 1" to "Rocket League"
 
@@ -196,15 +196,14 @@ class TeamMembersView(BaseView):
     ) -> None:
         await interaction.response.defer()
 
-        for member in members:
-            if remove_member:
-                team_member = self.team.get_member(member.id)
-                if team_member is not None:
-                    await self.team.remove_team_member(team_member)
-            else:
-                team_member = self.team.get_member(member.id)
-                if team_member is None:
-                    await self.team.add_team_member(member.id, is_sub=assign_sub)
+        # Every member is added or removed at once so the team's channels are only synced one time.
+        if remove_member:
+            team_members = [
+                team_member for member in members if (team_member := self.team.get_member(member.id)) is not None
+            ]
+            await self.team.remove_team_members(team_members)
+        else:
+            await self.team.add_team_members((member.id for member in members), is_sub=assign_sub)
 
         await interaction.edit_original_response(embed=self.embed, view=self)
 
@@ -0,0 +1,79 @@
+-- Publishes a notification on the "cache_changes" channel for every row inserted, updated or deleted
+-- in a table the bot caches. The bot listens on this channel to keep its caches in sync with changes
+-- made by manual SQL or by another bot process. The trigger arguments are the key columns of the table.
+CREATE OR REPLACE FUNCTION public.notify_cache_change() RETURNS TRIGGER AS $$
+DECLARE
+    data JSONB;
+    payload TEXT;
+    key_column TEXT;
+    row_keys JSONB := '{}'::JSONB;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        data := to_jsonb(OLD);
+    ELSE
+        data := to_jsonb(NEW);
+    END IF;
+
+    payload := jsonb_build_object(
+        'table', TG_TABLE_SCHEMA || '.' || TG_TABLE_NAME,
+        'operation', TG_OP,
+        'origin', current_setting('application_name', TRUE),
+        'row', data
+    )::TEXT;
+
+    -- Notification payloads must be shorter than 8000 bytes. For larger rows only the key
+    -- columns are sent and the bot fetches the rest of the row itself.
+    IF octet_length(payload) >= 8000 THEN
+        FOREACH key_column IN ARRAY TG_ARGV LOOP
+            row_keys := row_keys || jsonb_build_object(key_column, data -> key_column);
+        END LOOP;
+
+        payload := jsonb_build_object(
+            'table', TG_TABLE_SCHEMA || '.' || TG_TABLE_NAME,
+            'operation', TG_OP,
+            'origin', current_setting('application_name', TRUE),
+            'row', row_keys,
+            'partial', TRUE
+        )::TEXT;
+    END IF;
+
+    PERFORM pg_notify('cache_changes', payload);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS notify_cache_change ON teams.settings;
+CREATE TRIGGER notify_cache_change AFTER INSERT OR UPDATE OR DELETE ON teams.settings
+    FOR EACH ROW EXECUTE FUNCTION public.notify_cache_change('id');
+
+DROP TRIGGER IF EXISTS notify_cache_change ON teams.captains;
+CREATE TRIGGER notify_cache_change AFTER INSERT OR UPDATE OR DELETE ON teams.captains
+    FOR EACH ROW EXECUTE FUNCTION public.notify_cache_change('team_id', 'captain_id');
+
+DROP TRIGGER IF EXISTS notify_cache_change ON teams.members;
+CREATE TRIGGER notify_cache_change AFTER INSERT OR UPDATE OR DELETE ON teams.members
+    FOR EACH ROW EXECUTE FUNCTION public.notify_cache_change('team_id', 'member_id');
+
+DROP TRIGGER IF EXISTS notify_cache_change ON teams.scrims;
+CREATE TRIGGER notify_cache_change AFTER INSERT OR UPDATE OR DELETE ON teams.scrims
+    FOR EACH ROW EXECUTE FUNCTION public.notify_cache_change('id', 'guild_id');
+
+DROP TRIGGER IF EXISTS notify_cache_change ON teams.practice;
+CREATE TRIGGER notify_cache_change AFTER INSERT OR UPDATE OR DELETE ON teams.practice
+    FOR EACH ROW EXECUTE FUNCTION public.notify_cache_change('id', 'team_id', 'guild_id');
+
+DROP TRIGGER IF EXISTS notify_cache_change ON teams.practice_member;
+CREATE TRIGGER notify_cache_change AFTER INSERT OR UPDATE OR DELETE ON teams.practice_member
+    FOR EACH ROW EXECUTE FUNCTION public.notify_cache_change('id', 'practice_id', 'member_id');
+
+DROP TRIGGER IF EXISTS notify_cache_change ON teams.practice_member_history;
+CREATE TRIGGER notify_cache_change AFTER INSERT OR UPDATE OR DELETE ON teams.practice_member_history
+    FOR EACH ROW EXECUTE FUNCTION public.notify_cache_change('id', 'practice_id', 'member_id');
+
+DROP TRIGGER IF EXISTS notify_cache_change ON infractions.settings;
+CREATE TRIGGER notify_cache_change AFTER INSERT OR UPDATE OR DELETE ON infractions.settings
+    FOR EACH ROW EXECUTE FUNCTION public.notify_cache_change('guild_id');
+
+DROP TRIGGER IF EXISTS notify_cache_change ON images.request_settings;
+CREATE TRIGGER notify_cache_change AFTER INSERT OR UPDATE OR DELETE ON images.request_settings
+    FOR EACH ROW EXECUTE FUNCTION public.notify_cache_change('id');
@@ -0,0 +1,42 @@
+"""
+Contributor-Only License v1.0
+
+This file is licensed under the Contributor-Only License. Usage is restricted to
+non-commercial purposes. Distribution, sublicensing, and sharing of this file
+are prohibited except by the original owner.
+
+Modifications are allowed solely for contributing purposes and must not
+misrepresent the original material. This license does not grant any
+patent rights or trademark rights.
+
+Full license terms are available in the LICENSE file at the root of the repository.
+"""
+
+from __future__ import annotations
+
+import datetime
+
+import pytest
+
+pytest.importorskip('discord')
+pytest.importorskip('asyncpg')
+
+from cogs.cache_sync import CacheSync  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    ('value', 'microsecond'),
+    [
+        ('2026-10-16T13:48:41.431530+00:00', 431530),
+        # to_jsonb trims trailing zeros from the fraction
+        ('2026-10-16T13:48:41.43153+00:00', 431530),
+        ('2026-10-16T13:48:41.4+00:00', 400000),
+        ('2026-10-16T13:48:41+00:00', 0),
+    ],
+)
+def test_parse_row_timestamps(value: str, microsecond: int) -> None:
+    row = CacheSync._parse_row({'id': 1, 'started_at': value, 'ended_at': None})
+
+    assert row['started_at'] == datetime.datetime(2026, 10, 16, 13, 48, 41, microsecond, tzinfo=datetime.timezone.utc)
+    assert row['ended_at'] is None
+    assert row['id'] == 1
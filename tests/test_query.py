@@ -0,0 +1,68 @@
+"""
+Contributor-Only License v1.0
+
+This file is licensed under the Contributor-Only License. Usage is restricted to
+non-commercial purposes. Distribution, sublicensing, and sharing of this file
+are prohibited except by the original owner.
+
+Modifications are allowed solely for contributing purposes and must not
+misrepresent the original material. This license does not grant any
+patent rights or trademark rights.
+
+Full license terms are available in the LICENSE file at the root of the repository.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip('discord')
+
+from utils.query import BatchUpdateBuilder, InsertBuilder  # noqa: E402
+
+MEMBER_TYPES = {'team_id': 'integer', 'member_id': 'bigint', 'is_sub': 'boolean'}
+
+
+def test_insert_builder_statement_does_not_depend_on_row_count() -> None:
+    single = InsertBuilder('teams.members', MEMBER_TYPES, returning=('*',))
+    single.add_row(1, 10, False)
+
+    many = InsertBuilder('teams.members', MEMBER_TYPES, returning=('*',))
+    many.add_rows([(1, 10, False), (1, 11, True), (1, 12, False)])
+
+    assert single.query == many.query
+    assert 'unnest($1::integer[], $2::bigint[], $3::boolean[])' in many.query
+    assert many.args == ([1, 1, 1], [10, 11, 12], [False, True, False])
+
+
+def test_insert_builder_on_conflict() -> None:
+    builder = InsertBuilder('teams.members', MEMBER_TYPES)
+    builder.on_conflict('team_id', 'member_id')
+    assert builder.query.endswith('ON CONFLICT (team_id, member_id) DO UPDATE SET is_sub = EXCLUDED.is_sub')
+
+    builder.on_conflict(do_nothing=True)
+    assert builder.query.endswith('ON CONFLICT DO NOTHING')
+
+    with pytest.raises(ValueError):
+        builder.add_row(1, 10)
+
+
+def test_batch_update_builder_statement_does_not_depend_on_row_count() -> None:
+    single = BatchUpdateBuilder('teams.members', ('team_id', 'member_id'), MEMBER_TYPES)
+    single.add_row(1, 10, True)
+
+    many = BatchUpdateBuilder('teams.members', ('team_id', 'member_id'), MEMBER_TYPES)
+    many.add_rows([(1, 10, True), (1, 11, False)])
+
+    assert single.query == many.query
+    assert many.query == (
+        'UPDATE teams.members SET is_sub = data.is_sub '
+        'FROM unnest($1::integer[], $2::bigint[], $3::boolean[]) AS data (team_id, member_id, is_sub) '
+        'WHERE teams.members.team_id = data.team_id AND teams.members.member_id = data.member_id'
+    )
+    assert many.args == ([1, 1], [10, 11], [True, False])
+
+
+def test_batch_update_builder_requires_key_types() -> None:
+    with pytest.raises(ValueError):
+        BatchUpdateBuilder('teams.members', 'id', MEMBER_TYPES)
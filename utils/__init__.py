@@ -25,7 +25,11 @@ from .context import *
 from .error_handler import *
 from .errors import *
 from .images import *
+from .message_editor import *
 from .query import *
+from .query_stats import *
+from .role_sync import *
+from .snapshot import *
 from .time import *
 from .timers import *
 from .types import *
@@ -65,6 +69,37 @@ START_TIMER_MANAGER: bool = _parse_environ_boolean(
     'START_TIMER_MANAGER',
 )
 
+# The path of the practice cache snapshot, snapshots are disabled when this is not set.
+CACHE_SNAPSHOT_PATH: Optional[str] = os.environ.get('CACHE_SNAPSHOT_PATH') or None
+# How often, in minutes, to write the snapshot while running. It is always written on shutdown.
+CACHE_SNAPSHOT_INTERVAL: float = float(os.environ.get('CACHE_SNAPSHOT_INTERVAL') or 0)
+
+# Statements that take longer than this many milliseconds are logged with their call site, 0 disables this.
+SLOW_QUERY_THRESHOLD: float = float(os.environ.get('SLOW_QUERY_THRESHOLD') or 250)
+# Whether to log the EXPLAIN (ANALYZE, BUFFERS) output of slow reads, this runs the statement a second time.
+SLOW_QUERY_EXPLAIN: bool = _parse_environ_boolean('SLOW_QUERY_EXPLAIN', false_if_none=True)
+
+# Completed practices that ended more than this many days ago only keep the total practice time of each member
+# in memory, their join and leave history is loaded on demand. Every practice keeps its history when this is 0.
+PRACTICE_HISTORY_MAX_AGE: float = float(os.environ.get('PRACTICE_HISTORY_MAX_AGE') or 0)
+# The amount of practices whose on demand history is kept in memory at once.
+PRACTICE_HISTORY_CACHE_SIZE: int = int(os.environ.get('PRACTICE_HISTORY_CACHE_SIZE') or 128)
+
+# How many seconds to wait for more changes before editing a message that changes often, such as a practice message.
+MESSAGE_EDIT_DELAY: float = float(os.environ.get('MESSAGE_EDIT_DELAY') or 2)
+# How many role changes can be in flight at once in a single guild when synchronizing who has a role.
+ROLE_SYNC_CONCURRENCY: int = int(os.environ.get('ROLE_SYNC_CONCURRENCY') or 5)
+
+# New infractions are written in batches. A batch is written once this many infractions are waiting,
+# or this many seconds after the first one arrived. Adding more than the maximum waits for a write.
+INFRACTION_FLUSH_SIZE: int = int(os.environ.get('INFRACTION_FLUSH_SIZE') or 100)
+INFRACTION_FLUSH_INTERVAL: float = float(os.environ.get('INFRACTION_FLUSH_INTERVAL') or 5)
+INFRACTION_BUFFER_MAX_SIZE: int = int(os.environ.get('INFRACTION_BUFFER_MAX_SIZE') or 5000)
+
+# How many of the most recent infractions of each member are kept in memory to answer windowed counts,
+# such as the infractions in the last 7 days.
+INFRACTION_HISTORY_SIZE: int = int(os.environ.get('INFRACTION_HISTORY_SIZE') or 100)
+
 
 def parse_initial_extensions(extensions: Iterable[str]) -> Iterable[str]:
     if RUNNING_DEVELOPMENT:
@@ -26,10 +26,14 @@ __all__: Tuple[str, ...] = ('GuildAble', 'TeamAble', 'Botable', 'TeamMemberAble'
 
 
 class Botable(Protocol):
+    __slots__: Tuple[str, ...] = ()
+
     def _get_bot(self) -> FuryBot: ...
 
 
 class GuildAble(Botable, Protocol):
+    __slots__: Tuple[str, ...] = ()
+
     def _get_guild_id(self) -> int: ...
 
     @property
@@ -38,6 +42,8 @@ class GuildAble(Botable, Protocol):
 
 
 class TeamAble(GuildAble, Protocol):
+    __slots__: Tuple[str, ...] = ()
+
     def _get_team_id(self) -> int: ...
 
     @property
@@ -46,6 +52,8 @@ class TeamAble(GuildAble, Protocol):
 
 
 class TeamMemberAble(TeamAble, Protocol):
+    __slots__: Tuple[str, ...] = ()
+
     def _get_member_id(self) -> int: ...
 
     @property
@@ -0,0 +1,207 @@
+"""
+Contributor-Only License v1.0
+
+This file is licensed under the Contributor-Only License. Usage is restricted to
+non-commercial purposes. Distribution, sublicensing, and sharing of this file
+are prohibited except by the original owner.
+
+Modifications are allowed solely for contributing purposes and must not
+misrepresent the original material. This license does not grant any
+patent rights or trademark rights.
+
+Full license terms are available in the LICENSE file at the root of the repository.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import logging
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Protocol, Tuple
+
+import cachetools
+import discord
+
+if TYPE_CHECKING:
+    from bot import FuryBot
+
+__all__: Tuple[str, ...] = ('MessageEditCoalescer', 'MessageEditStats')
+
+_log = logging.getLogger(__name__)
+
+
+class _PartialMessageable(Protocol):
+    def get_partial_message(self, message_id: int, /) -> discord.PartialMessage: ...
+
+
+# Renders the keyword arguments to edit the message with, or None to skip the edit.
+RenderCallback = Callable[[], Optional[Dict[str, Any]]]
+
+
+@dataclasses.dataclass()
+class MessageEditStats:
+    """Holds the edit statistics of a single message.
+
+    Attributes
+    ----------
+    scheduled: :class:`int`
+        How many times an edit of the message was requested.
+    edits: :class:`int`
+        How many edits were actually sent to Discord.
+    dropped: :class:`int`
+        How many requested renders were replaced by a newer one before they were sent.
+    failed: :class:`int`
+        How many edits failed, such as when the message was deleted.
+    """
+
+    scheduled: int = 0
+    edits: int = 0
+    dropped: int = 0
+    failed: int = 0
+
+
+class _PendingEdit:
+    __slots__: Tuple[str, ...] = ('channel', 'render', 'dirty', 'task')
+
+    def __init__(self, channel: _PartialMessageable, render: RenderCallback) -> None:
+        self.channel: _PartialMessageable = channel
+        self.render: RenderCallback = render
+        self.dirty: bool = True
+        self.task: Optional[asyncio.Task[None]] = None
+
+
+class MessageEditCoalescer:
+    """Debounces the edits of messages that change often, such as a practice message that is
+    edited every time a member joins or leaves the voice channel.
+
+    Every message has at most one edit waiting. Requesting another edit while one is waiting
+    replaces its render callback, so only the latest state is ever sent. Edits are sent through
+    a :class:`discord.PartialMessage`, so the message is never fetched.
+
+    Parameters
+    ----------
+    bot: :class:`FuryBot`
+        The bot instance.
+    delay: :class:`float`
+        How many seconds to wait for more changes before editing a message.
+    max_tracked: :class:`int`
+        The amount of messages to keep the statistics of.
+    """
+
+    __slots__: Tuple[str, ...] = ('bot', 'delay', 'edits', 'dropped', '_pending', '_stats')
+
+    def __init__(self, bot: FuryBot, *, delay: float, max_tracked: int = 1024) -> None:
+        self.bot: FuryBot = bot
+        self.delay: float = delay
+        self.edits: int = 0
+        self.dropped: int = 0
+
+        # Mapping[message_id, _PendingEdit]
+        self._pending: Dict[int, _PendingEdit] = {}
+
+        # Mapping[message_id, MessageEditStats]
+        self._stats: cachetools.LRUCache[int, MessageEditStats] = cachetools.LRUCache(maxsize=max_tracked)
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def get_stats(self, message_id: int, /) -> Optional[MessageEditStats]:
+        """Get the edit statistics of a message.
+
+        Parameters
+        ----------
+        message_id: :class:`int`
+            The ID of the message.
+
+        Returns
+        -------
+        Optional[:class:`MessageEditStats`]
+        """
+        return self._stats.get(message_id)
+
+    def schedule(self, channel: _PartialMessageable, message_id: int, render: RenderCallback) -> None:
+        """Request an edit of a message. The message is edited once no more edits have been
+        requested for :attr:`delay` seconds, with whatever ``render`` returns at that time.
+
+        Parameters
+        ----------
+        channel: :class:`discord.abc.Messageable`
+            The channel the message is in.
+        message_id: :class:`int`
+            The ID of the message to edit.
+        render: Callable[[], Optional[Dict[:class:`str`, Any]]]
+            Returns the keyword arguments to pass to :meth:`discord.PartialMessage.edit`, or ``None`` to skip the edit.
+        """
+        stats = self._stats.get(message_id)
+        if stats is None:
+            stats = self._stats[message_id] = MessageEditStats()
+
+        stats.scheduled += 1
+
+        pending = self._pending.get(message_id)
+        if pending is not None:
+            if pending.dirty:
+                stats.dropped += 1
+                self.dropped += 1
+
+            pending.channel, pending.render, pending.dirty = channel, render, True
+            return
+
+        self._pending[message_id] = pending = _PendingEdit(channel, render)
+        pending.task = self.bot.create_task(self._worker(message_id, pending), name=f'message-edit-{message_id}')
+
+    async def flush(self) -> None:
+        """|coro|
+
+        Send every waiting edit right away, such as before the bot shuts down.
+        """
+        pending_edits: List[Tuple[int, _PendingEdit]] = list(self._pending.items())
+        tasks = [pending.task for _, pending in pending_edits if pending.task is not None]
+        for task in tasks:
+            task.cancel()
+
+        # Let the workers finish cancelling, an edit cancelled mid-request marks itself dirty again.
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        for message_id, pending in pending_edits:
+            if pending.dirty:
+                await self._edit(message_id, pending)
+
+    async def _worker(self, message_id: int, pending: _PendingEdit) -> None:
+        try:
+            # Edits requested while this one was being sent mark it dirty again, so the
+            # latest state always ends up on the message.
+            while pending.dirty:
+                await asyncio.sleep(self.delay)
+                await self._edit(message_id, pending)
+        finally:
+            if self._pending.get(message_id) is pending:
+                del self._pending[message_id]
+
+    async def _edit(self, message_id: int, pending: _PendingEdit) -> None:
+        pending.dirty = False
+
+        kwargs = pending.render()
+        if kwargs is None:
+            return
+
+        stats = self._stats.get(message_id)
+        message = pending.channel.get_partial_message(message_id)
+        try:
+            await message.edit(**kwargs)
+        except asyncio.CancelledError:
+            # The edit may not have gone through, send it again with the next flush.
+            pending.dirty = True
+            raise
+        except discord.NotFound:
+            # The message has been deleted, there's nothing left to edit.
+            if stats is not None:
+                stats.failed += 1
+        except discord.HTTPException as exc:
+            _log.warning('Failed to edit message %s.', message_id, exc_info=exc)
+            if stats is not None:
+                stats.failed += 1
+        else:
+            self.edits += 1
+            if stats is not None:
+                stats.edits += 1
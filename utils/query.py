@@ -14,27 +14,63 @@ Full license terms are available in the LICENSE file at the root of the reposito
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Coroutine, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Coroutine, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
 
 if TYPE_CHECKING:
+    from asyncpg import Record
+
     from bot import ConnectionType
 
-__all__: Tuple[str, ...] = ('QueryBuilder',)
+__all__: Tuple[str, ...] = ('QueryBuilder', 'InsertBuilder', 'BatchUpdateBuilder')
+
+
+def _format_returning(returning: Sequence[str]) -> str:
+    if not returning:
+        return ''
+
+    return f' RETURNING {", ".join(returning)}'
 
 
 class QueryBuilder:
-    def __init__(self, table: str) -> None:
+    """Builds an ``UPDATE`` statement from the columns that were changed.
+
+    Parameters
+    ----------
+    table: :class:`str`
+        The table to update.
+    columns: Optional[Sequence[:class:`str`]]
+        Every column that can be updated through this builder, in a fixed order. When given, the
+        statement always lists all of them and columns that were not changed keep their current value,
+        so every combination of changes runs the same statement and shares one prepared plan on the
+        connection. When omitted, only the changed columns are listed.
+    returning: Sequence[:class:`str`]
+        The columns to return from the updated rows, see :meth:`fetchrow`.
+    """
+
+    def __init__(self, table: str, *, columns: Optional[Sequence[str]] = None, returning: Sequence[str] = ()) -> None:
         self.table: str = table
+        self.columns: Optional[Tuple[str, ...]] = tuple(columns) if columns is not None else None
+        self.returning: Tuple[str, ...] = tuple(returning)
         self._args: List[Tuple[str, Any]] = []
         self._conds: List[Tuple[str, Any]] = []
 
+    def __bool__(self) -> bool:
+        return bool(self._args)
+
     @property
     def query(self) -> str:
         arg_amount: int = 1
         conds: List[str] = []
-        for predicate, _ in self._args:
-            conds.append(f"{predicate} = ${arg_amount}")
-            arg_amount += 1
+
+        if self.columns is not None:
+            # Each column gets a flag telling whether it was changed and the value to change it to.
+            for column in self.columns:
+                conds.append(f"{column} = CASE WHEN ${arg_amount} THEN ${arg_amount + 1} ELSE {column} END")
+                arg_amount += 2
+        else:
+            for predicate, _ in self._args:
+                conds.append(f"{predicate} = ${arg_amount}")
+                arg_amount += 1
 
         clauses: List[str] = []
         for clause, _ in self._conds:
@@ -44,11 +80,18 @@ class QueryBuilder:
         formatted_conds = " , ".join(conds)
         formatted_clauses = " AND ".join(clauses)
 
-        return f'UPDATE {self.table} SET {formatted_conds} WHERE {formatted_clauses}'
+        return f'UPDATE {self.table} SET {formatted_conds} WHERE {formatted_clauses}{_format_returning(self.returning)}'
 
     @property
     def args(self) -> Tuple[Any, ...]:
-        conds = [value for (_, value) in self._args]
+        if self.columns is not None:
+            changed: Dict[str, Any] = dict(self._args)
+            conds: List[Any] = []
+            for column in self.columns:
+                conds.extend((column in changed, changed.get(column)))
+        else:
+            conds = [value for (_, value) in self._args]
+
         clauses = [value for (_, value) in self._conds]
         return (*conds, *clauses)
 
@@ -56,6 +99,9 @@ class QueryBuilder:
         return self._execute_query(connection)
 
     def add_arg(self, predicate: str, value: Any) -> None:
+        if self.columns is not None and predicate not in self.columns:
+            raise ValueError(f'Column {predicate!r} is not one of the columns of this builder.')
+
         self._args.append((predicate, value))
 
     def add_condition(self, predicate: str, value: Any) -> None:
@@ -66,3 +112,261 @@ class QueryBuilder:
             return
 
         return await connection.execute(self.query, *self.args)
+
+    async def fetchrow(self, connection: ConnectionType) -> Optional[Record]:
+        """|coro|
+
+        Run the statement and return the ``returning`` columns of the first updated row.
+
+        Parameters
+        ----------
+        connection: :class:`asyncpg.Connection`
+            The connection to run the statement on.
+
+        Returns
+        -------
+        Optional[:class:`asyncpg.Record`]
+            The updated row, or ``None`` if nothing was changed or no row matched.
+        """
+        if not self._args:
+            return None
+
+        return await connection.fetchrow(self.query, *self.args)
+
+
+def _format_unnest(types: Mapping[str, str], names: Sequence[str]) -> str:
+    arrays = ", ".join(f"${index}::{types[name]}[]" for index, name in enumerate(names, start=1))
+    return f'unnest({arrays}) AS data ({", ".join(names)})'
+
+
+def _transpose(rows: Sequence[Tuple[Any, ...]], width: int) -> Tuple[List[Any], ...]:
+    # unnest takes one array per column rather than one tuple per row.
+    return tuple([row[index] for row in rows] for index in range(width))
+
+
+class InsertBuilder:
+    """Builds an ``INSERT ... SELECT FROM unnest(...)`` statement that inserts many rows at once,
+    optionally resolving conflicts and returning columns.
+
+    Every column is sent as a single array, so the statement only depends on the columns, never on
+    the amount of rows, and every batch shares one prepared plan on the connection.
+
+    Parameters
+    ----------
+    table: :class:`str`
+        The table to insert into.
+    types: Mapping[:class:`str`, :class:`str`]
+        The PostgreSQL type of every column each row has values for, in order.
+    returning: Sequence[:class:`str`]
+        The columns to return from the inserted rows, see :meth:`fetch` and :meth:`fetchrow`.
+    """
+
+    def __init__(self, table: str, types: Mapping[str, str], *, returning: Sequence[str] = ()) -> None:
+        self.table: str = table
+        self.types: Dict[str, str] = dict(types)
+        self.columns: Tuple[str, ...] = tuple(self.types)
+        self.returning: Tuple[str, ...] = tuple(returning)
+        self._rows: List[Tuple[Any, ...]] = []
+        self._conflict_columns: Tuple[str, ...] = ()
+        self._conflict_update: Optional[Tuple[str, ...]] = None
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @property
+    def query(self) -> str:
+        columns = ", ".join(self.columns)
+        query = f'INSERT INTO {self.table} ({columns}) SELECT {columns} FROM {_format_unnest(self.types, self.columns)}'
+
+        if self._conflict_update is not None:
+            target = f' ({", ".join(self._conflict_columns)})' if self._conflict_columns else ''
+            if self._conflict_update:
+                updates = ", ".join(f"{column} = EXCLUDED.{column}" for column in self._conflict_update)
+                query += f' ON CONFLICT{target} DO UPDATE SET {updates}'
+            else:
+                query += f' ON CONFLICT{target} DO NOTHING'
+
+        return query + _format_returning(self.returning)
+
+    @property
+    def args(self) -> Tuple[List[Any], ...]:
+        return _transpose(self._rows, len(self.columns))
+
+    @property
+    def rows(self) -> List[Tuple[Any, ...]]:
+        return self._rows
+
+    def __call__(self, connection: ConnectionType) -> Coroutine[Any, Any, Optional[str]]:
+        return self._execute_query(connection)
+
+    def add_row(self, *values: Any) -> None:
+        if len(values) != len(self.columns):
+            raise ValueError(f'Expected {len(self.columns)} values for {self.table}, got {len(values)}.')
+
+        self._rows.append(values)
+
+    def add_rows(self, rows: Iterable[Sequence[Any]]) -> None:
+        for row in rows:
+            self.add_row(*row)
+
+    def on_conflict(self, *columns: str, update: Optional[Sequence[str]] = None, do_nothing: bool = False) -> None:
+        """Resolve conflicts on the given columns instead of raising.
+
+        Parameters
+        ----------
+        *columns: :class:`str`
+            The conflict target. Can be omitted together with ``do_nothing``.
+        update: Optional[Sequence[:class:`str`]]
+            The columns to overwrite with the new values on a conflict. Defaults to every
+            column that is not part of the conflict target.
+        do_nothing: :class:`bool`
+            Whether to skip conflicting rows instead of updating them.
+        """
+        self._conflict_columns = columns
+
+        if do_nothing:
+            self._conflict_update = ()
+        elif update is not None:
+            self._conflict_update = tuple(update)
+        else:
+            self._conflict_update = tuple(column for column in self.columns if column not in columns)
+
+        if not self._conflict_update and not do_nothing:
+            raise ValueError('There are no columns to update on a conflict, pass do_nothing=True instead.')
+
+    async def _execute_query(self, connection: ConnectionType) -> Optional[str]:
+        if not self._rows:
+            return
+
+        return await connection.execute(self.query, *self.args)
+
+    async def fetchrow(self, connection: ConnectionType) -> Optional[Record]:
+        """|coro|
+
+        Insert the only row of the builder and return its ``returning`` columns.
+
+        Parameters
+        ----------
+        connection: :class:`asyncpg.Connection`
+            The connection to run the statement on.
+
+        Returns
+        -------
+        Optional[:class:`asyncpg.Record`]
+            The inserted row, or ``None`` if it was skipped because of a conflict.
+        """
+        if len(self._rows) != 1:
+            raise ValueError(f'fetchrow expects exactly one row, the builder has {len(self._rows)}.')
+
+        return await connection.fetchrow(self.query, *self.args)
+
+    async def fetch(self, connection: ConnectionType) -> List[Record]:
+        """|coro|
+
+        Insert every row of the builder in one statement and return their ``returning`` columns.
+
+        Parameters
+        ----------
+        connection: :class:`asyncpg.Connection`
+            The connection to run the statement on.
+
+        Returns
+        -------
+        List[:class:`asyncpg.Record`]
+            The inserted rows. Rows skipped because of a conflict are left out.
+        """
+        if not self._rows:
+            return []
+
+        return await connection.fetch(self.query, *self.args)
+
+
+class BatchUpdateBuilder:
+    """Builds a single ``UPDATE ... FROM unnest(...)`` statement that updates many rows at once,
+    each to its own values.
+
+    Like :class:`InsertBuilder`, every column is sent as a single array, so the statement is the
+    same for any amount of rows.
+
+    Parameters
+    ----------
+    table: :class:`str`
+        The table to update.
+    key: Union[:class:`str`, Sequence[:class:`str`]]
+        The column, or columns, used to match each row, usually the primary key.
+    types: Mapping[:class:`str`, :class:`str`]
+        The PostgreSQL type of the key columns and of every column to update, in order.
+    returning: Sequence[:class:`str`]
+        The columns to return from the updated rows, see :meth:`fetch`.
+    """
+
+    def __init__(
+        self, table: str, key: Union[str, Sequence[str]], types: Mapping[str, str], *, returning: Sequence[str] = ()
+    ) -> None:
+        self.keys: Tuple[str, ...] = (key,) if isinstance(key, str) else tuple(key)
+        for column in self.keys:
+            if column not in types:
+                raise ValueError(f'The type of the key column {column!r} is missing.')
+
+        self.table: str = table
+        self.types: Dict[str, str] = dict(types)
+        self.columns: Tuple[str, ...] = tuple(column for column in self.types if column not in self.keys)
+        self.returning: Tuple[str, ...] = tuple(returning)
+        self._rows: List[Tuple[Any, ...]] = []
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @property
+    def query(self) -> str:
+        names = (*self.keys, *self.columns)
+        updates = ", ".join(f"{column} = data.{column}" for column in self.columns)
+        conditions = " AND ".join(f"{self.table}.{key} = data.{key}" for key in self.keys)
+        returning = _format_returning(tuple(f'{self.table}.{column}' for column in self.returning))
+        return (
+            f'UPDATE {self.table} SET {updates} FROM {_format_unnest(self.types, names)} ' f'WHERE {conditions}{returning}'
+        )
+
+    @property
+    def args(self) -> Tuple[List[Any], ...]:
+        return _transpose(self._rows, len(self.keys) + len(self.columns))
+
+    def __call__(self, connection: ConnectionType) -> Coroutine[Any, Any, Optional[str]]:
+        return self._execute_query(connection)
+
+    def add_row(self, *values: Any) -> None:
+        """Add a row to update, given its key values followed by the new value of every column."""
+        expected = len(self.keys) + len(self.columns)
+        if len(values) != expected:
+            raise ValueError(f'Expected {expected} values for {self.table}, got {len(values)}.')
+
+        self._rows.append(values)
+
+    def add_rows(self, rows: Iterable[Sequence[Any]]) -> None:
+        for row in rows:
+            self.add_row(*row)
+
+    async def _execute_query(self, connection: ConnectionType) -> Optional[str]:
+        if not self._rows:
+            return
+
+        return await connection.execute(self.query, *self.args)
+
+    async def fetch(self, connection: ConnectionType) -> List[Record]:
+        """|coro|
+
+        Update every row of the builder and return their ``returning`` columns.
+
+        Parameters
+        ----------
+        connection: :class:`asyncpg.Connection`
+            The connection to run the statement on.
+
+        Returns
+        -------
+        List[:class:`asyncpg.Record`]
+        """
+        if not self._rows:
+            return []
+
+        return await connection.fetch(self.query, *self.args)
@@ -0,0 +1,318 @@
+"""
+Contributor-Only License v1.0
+
+This file is licensed under the Contributor-Only License. Usage is restricted to
+non-commercial purposes. Distribution, sublicensing, and sharing of this file
+are prohibited except by the original owner.
+
+Modifications are allowed solely for contributing purposes and must not
+misrepresent the original material. This license does not grant any
+patent rights or trademark rights.
+
+Full license terms are available in the LICENSE file at the root of the repository.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import logging
+import os
+import re
+import sys
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Final, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from bot import ConnectionType, FuryBot
+
+__all__: Tuple[str, ...] = ('InstrumentedConnection', 'QueryStats', 'StatementStats', 'normalize_query')
+
+_log = logging.getLogger(__name__)
+
+# The upper bounds, in seconds, of the latency histogram buckets. A final bucket holds everything slower.
+HISTOGRAM_BUCKETS: Final[Tuple[float, ...]] = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+_WHITESPACE_REGEX = re.compile(r'\s+')
+# String literals and numbers that are not part of an identifier or a $n placeholder.
+_LITERAL_REGEX = re.compile(r"'(?:[^']|'')*'|(?<![\w$])\d+(?:\.\d+)?\b")
+_STATUS_ROWS_REGEX = re.compile(r'(\d+)$')
+
+# Frames in these files only pass statements along, a slow statement is reported at the code that called them.
+_SKIPPED_FILES: Final[Tuple[str, ...]] = (__file__, os.path.join(os.path.dirname(__file__), 'query.py'))
+
+# The bot's own single query helpers, skipped for the same reason.
+_HELPER_NAMES: Final[Tuple[str, ...]] = ('fetch', 'fetchrow', 'fetchval')
+
+
+@functools.lru_cache(maxsize=1024)
+def normalize_query(query: str, /) -> str:
+    """Normalize a query so that statements that only differ in whitespace or inlined literals share their statistics.
+
+    Parameters
+    ----------
+    query: :class:`str`
+        The query to normalize.
+
+    Returns
+    -------
+    :class:`str`
+    """
+    return _LITERAL_REGEX.sub('?', _WHITESPACE_REGEX.sub(' ', query).strip())
+
+
+def _find_call_site() -> str:
+    frame = sys._getframe(1)
+    while frame is not None:
+        code = frame.f_code
+        if code.co_filename in _SKIPPED_FILES:
+            frame = frame.f_back
+            continue
+
+        if code.co_name in _HELPER_NAMES and frame.f_globals.get('__name__') == 'bot':
+            frame = frame.f_back
+            continue
+
+        return f'{code.co_filename}:{frame.f_lineno} in {code.co_name}'
+
+    return '<unknown>'
+
+
+@dataclasses.dataclass()
+class StatementStats:
+    """Holds the statistics of a single normalized statement.
+
+    Attributes
+    ----------
+    query: :class:`str`
+        The normalized query.
+    calls: :class:`int`
+        How many times the statement has been run.
+    total_time: :class:`float`
+        The total time in seconds spent running the statement.
+    max_time: :class:`float`
+        The longest time in seconds a single run of the statement took.
+    rows: :class:`int`
+        The total amount of rows returned or affected by the statement.
+    histogram: List[:class:`int`]
+        The amount of runs that fell in each of the latency buckets.
+    plan: Optional[:class:`str`]
+        The ``EXPLAIN (ANALYZE, BUFFERS)`` output of a slow run, if one was captured.
+    """
+
+    query: str
+    calls: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    rows: int = 0
+    histogram: List[int] = dataclasses.field(default_factory=lambda: [0] * (len(HISTOGRAM_BUCKETS) + 1))
+    plan: Optional[str] = None
+
+    @property
+    def mean_time(self) -> float:
+        """:class:`float`: The average time in seconds a run of the statement took."""
+        return self.total_time / self.calls if self.calls else 0.0
+
+    def percentile(self, percentile: float, /) -> float:
+        """Estimate a latency percentile from the histogram.
+
+        Parameters
+        ----------
+        percentile: :class:`float`
+            The percentile to estimate, between ``0`` and ``1``.
+
+        Returns
+        -------
+        :class:`float`
+            The upper bound in seconds of the bucket the percentile falls in.
+        """
+        target = percentile * self.calls
+        seen = 0
+        for index, count in enumerate(self.histogram):
+            seen += count
+            if count and seen >= target:
+                return HISTOGRAM_BUCKETS[index] if index < len(HISTOGRAM_BUCKETS) else self.max_time
+
+        return 0.0
+
+    def record(self, elapsed: float, rows: int) -> None:
+        self.calls += 1
+        self.total_time += elapsed
+        self.max_time = max(self.max_time, elapsed)
+        self.rows += rows
+
+        for index, bound in enumerate(HISTOGRAM_BUCKETS):
+            if elapsed <= bound:
+                self.histogram[index] += 1
+                break
+        else:
+            self.histogram[-1] += 1
+
+
+class QueryStats:
+    """Collects the statistics of every statement run through the connections handed out by
+    :meth:`FuryBot.safe_connection`.
+
+    Parameters
+    ----------
+    bot: :class:`FuryBot`
+        The bot instance.
+    slow_threshold: :class:`float`
+        The time in seconds after which a statement is logged as slow. ``0`` disables logging.
+    explain_slow: :class:`bool`
+        Whether to capture the ``EXPLAIN (ANALYZE, BUFFERS)`` output of slow reads. Each statement
+        is explained at most once.
+    """
+
+    __slots__: Tuple[str, ...] = ('bot', 'slow_threshold', 'explain_slow', '_statements', '_explaining')
+
+    def __init__(self, bot: FuryBot, *, slow_threshold: float, explain_slow: bool) -> None:
+        self.bot: FuryBot = bot
+        self.slow_threshold: float = slow_threshold
+        self.explain_slow: bool = explain_slow
+
+        # Mapping[normalized_query, StatementStats]
+        self._statements: Dict[str, StatementStats] = {}
+        self._explaining: Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._statements)
+
+    def get(self, query: str, /) -> Optional[StatementStats]:
+        """Get the statistics of a statement.
+
+        Parameters
+        ----------
+        query: :class:`str`
+            The query, it does not need to be normalized.
+
+        Returns
+        -------
+        Optional[:class:`StatementStats`]
+        """
+        return self._statements.get(normalize_query(query))
+
+    def top(self, limit: int = 10, /, *, sort: str = 'total_time') -> List[StatementStats]:
+        """Get the statements that have the highest value of an attribute.
+
+        Parameters
+        ----------
+        limit: :class:`int`
+            The amount of statements to get.
+        sort: :class:`str`
+            The :class:`StatementStats` attribute to sort by, such as ``total_time``, ``calls``,
+            ``mean_time``, ``max_time`` or ``rows``.
+
+        Returns
+        -------
+        List[:class:`StatementStats`]
+        """
+        return sorted(self._statements.values(), key=lambda stats: getattr(stats, sort), reverse=True)[:limit]
+
+    def reset(self) -> None:
+        """Forget the statistics of every statement."""
+        self._statements.clear()
+
+    def record(self, query: str, args: Tuple[Any, ...], elapsed: float, rows: int) -> None:
+        normalized = normalize_query(query)
+        stats = self._statements.get(normalized)
+        if stats is None:
+            stats = self._statements[normalized] = StatementStats(query=normalized)
+
+        stats.record(elapsed, rows)
+
+        if not self.slow_threshold or elapsed < self.slow_threshold:
+            return
+
+        _log.warning('Slow statement took %.2fms at %s: %s', elapsed * 1000, _find_call_site(), normalized)
+
+        if (
+            self.explain_slow
+            and stats.plan is None
+            and normalized not in self._explaining
+            and normalized.upper().startswith(('SELECT', 'WITH'))
+        ):
+            self._explaining.add(normalized)
+            self.bot.create_task(self._explain(stats, query, args))
+
+    async def _explain(self, stats: StatementStats, query: str, args: Tuple[Any, ...]) -> None:
+        # A pooled connection is used directly so the EXPLAIN is not recorded itself. The read only
+        # transaction makes sure ANALYZE, which runs the statement, can never write anything.
+        try:
+            async with self.bot.pool.acquire() as connection:
+                async with connection.transaction(readonly=True):
+                    records = await connection.fetch(f'EXPLAIN (ANALYZE, BUFFERS) {query}', *args)
+        except Exception as exc:
+            _log.warning('Failed to explain slow statement: %s', stats.query, exc_info=exc)
+        else:
+            stats.plan = '\n'.join(record[0] for record in records)
+            _log.warning('Plan of slow statement %s:\n%s', stats.query, stats.plan)
+        finally:
+            self._explaining.discard(stats.query)
+
+
+class InstrumentedConnection:
+    """Wraps a pooled connection, recording the statistics of every statement run through it.
+    Everything that isn't a statement is passed through to the connection.
+
+    Parameters
+    ----------
+    connection: :class:`asyncpg.Connection`
+        The connection to wrap.
+    stats: :class:`QueryStats`
+        Where to record the statistics.
+    """
+
+    __slots__: Tuple[str, ...] = ('_connection', '_stats')
+
+    def __init__(self, connection: ConnectionType, stats: QueryStats) -> None:
+        self._connection: ConnectionType = connection
+        self._stats: QueryStats = stats
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._connection, name)
+
+    async def _run(
+        self, method: Callable[..., Awaitable[Any]], query: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+    ) -> Tuple[Any, float]:
+        start = time.perf_counter()
+        result = await method(query, *args, **kwargs)
+        return result, time.perf_counter() - start
+
+    async def execute(self, query: str, *args: Any, **kwargs: Any) -> str:
+        status, elapsed = await self._run(self._connection.execute, query, args, kwargs)
+
+        # The status of a statement ends with the amount of rows it affected, such as "UPDATE 3".
+        match = _STATUS_ROWS_REGEX.search(status or '')
+        self._stats.record(query, args, elapsed, int(match.group(1)) if match else 0)
+        return status
+
+    async def executemany(self, command: str, args: Any, **kwargs: Any) -> None:
+        start = time.perf_counter()
+        await self._connection.executemany(command, args, **kwargs)
+        self._stats.record(command, (), time.perf_counter() - start, 0)
+
+    async def copy_records_to_table(self, table_name: str, *, records: Any, **kwargs: Any) -> str:
+        start = time.perf_counter()
+        status = await self._connection.copy_records_to_table(table_name, records=records, **kwargs)
+
+        schema_name = kwargs.get('schema_name')
+        target = f'{schema_name}.{table_name}' if schema_name else table_name
+        match = _STATUS_ROWS_REGEX.search(status or '')
+        self._stats.record(f'COPY {target}', (), time.perf_counter() - start, int(match.group(1)) if match else 0)
+        return status
+
+    async def fetch(self, query: str, *args: Any, **kwargs: Any) -> List[Any]:
+        records, elapsed = await self._run(self._connection.fetch, query, args, kwargs)
+        self._stats.record(query, args, elapsed, len(records))
+        return records
+
+    async def fetchrow(self, query: str, *args: Any, **kwargs: Any) -> Optional[Any]:
+        record, elapsed = await self._run(self._connection.fetchrow, query, args, kwargs)
+        self._stats.record(query, args, elapsed, int(record is not None))
+        return record
+
+    async def fetchval(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        value, elapsed = await self._run(self._connection.fetchval, query, args, kwargs)
+        self._stats.record(query, args, elapsed, int(value is not None))
+        return value
@@ -0,0 +1,171 @@
+"""
+Contributor-Only License v1.0
+
+This file is licensed under the Contributor-Only License. Usage is restricted to
+non-commercial purposes. Distribution, sublicensing, and sharing of this file
+are prohibited except by the original owner.
+
+Modifications are allowed solely for contributing purposes and must not
+misrepresent the original material. This license does not grant any
+patent rights or trademark rights.
+
+Full license terms are available in the LICENSE file at the root of the repository.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import logging
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Set, Tuple
+
+import discord
+
+if TYPE_CHECKING:
+    from bot import FuryBot
+
+__all__: Tuple[str, ...] = ('RoleSyncEngine', 'RoleSyncReport')
+
+_log = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass()
+class RoleSyncReport:
+    """The outcome of synchronizing the members of a role.
+
+    Attributes
+    ----------
+    added: :class:`int`
+        How many members were given the role.
+    removed: :class:`int`
+        How many members had the role taken away.
+    skipped: :class:`int`
+        How many members already had the role they should have, or left the guild.
+    failed: :class:`int`
+        How many changes failed, such as when the bot lacks permissions.
+    """
+
+    added: int = 0
+    removed: int = 0
+    skipped: int = 0
+    failed: int = 0
+
+    @property
+    def applied(self) -> int:
+        """:class:`int`: How many changes were applied."""
+        return self.added + self.removed
+
+
+class RoleSyncEngine:
+    """Synchronizes who has a role by only applying the difference between the members that should
+    have it and the members that do.
+
+    Changes are sent straight through the HTTP client, so members never have to be fetched, and run
+    concurrently. Role changes are rate limited per guild, so every guild has its own budget of changes
+    that can be in flight at once, shared by every synchronization running in it.
+
+    Parameters
+    ----------
+    bot: :class:`FuryBot`
+        The bot instance.
+    concurrency: :class:`int`
+        How many role changes can be in flight at once in a single guild.
+    """
+
+    __slots__: Tuple[str, ...] = ('bot', 'concurrency', '_budgets')
+
+    def __init__(self, bot: FuryBot, *, concurrency: int) -> None:
+        self.bot: FuryBot = bot
+        self.concurrency: int = concurrency
+
+        # Mapping[guild_id, Semaphore]
+        self._budgets: Dict[int, asyncio.Semaphore] = {}
+
+    def _get_budget(self, guild_id: int, /) -> asyncio.Semaphore:
+        budget = self._budgets.get(guild_id)
+        if budget is None:
+            budget = self._budgets[guild_id] = asyncio.Semaphore(self.concurrency)
+
+        return budget
+
+    async def sync(
+        self,
+        role: discord.Role,
+        member_ids: Iterable[int],
+        *,
+        possible_holders: Iterable[int] = (),
+        reason: Optional[str] = None,
+    ) -> RoleSyncReport:
+        """|coro|
+
+        Make sure exactly the given members have a role.
+
+        Parameters
+        ----------
+        role: :class:`discord.Role`
+            The role to synchronize.
+        member_ids: Iterable[:class:`int`]
+            The IDs of the members that should have the role.
+        possible_holders: Iterable[:class:`int`]
+            The IDs of members that may have the role but aren't in the member cache, so :attr:`discord.Role.members`
+            can't tell. They have the role removed unless they're in ``member_ids``, in which case the role is
+            always added.
+        reason: Optional[:class:`str`]
+            The reason shown in the audit log.
+
+        Returns
+        -------
+        :class:`RoleSyncReport`
+        """
+        guild = role.guild
+        desired: Set[int] = set(member_ids)
+        current: Set[int] = {member.id for member in role.members}
+
+        # Whether an uncached member has the role is unknown, so they're only used to remove the role.
+        # Uncached members that should have it are always sent an add, which does nothing if they have it.
+        uncached: Set[int] = {member_id for member_id in possible_holders if guild.get_member(member_id) is None}
+
+        to_add = desired - current
+        to_remove = (current | uncached) - desired
+
+        report = RoleSyncReport(skipped=len(desired & current))
+        if not to_add and not to_remove:
+            return report
+
+        budget = self._get_budget(guild.id)
+        http = self.bot.http
+
+        async def _apply(member_id: int, add: bool) -> None:
+            async with budget:
+                try:
+                    if add:
+                        await http.add_role(guild.id, member_id, role.id, reason=reason)
+                    else:
+                        await http.remove_role(guild.id, member_id, role.id, reason=reason)
+                except discord.NotFound:
+                    # The member has left the guild.
+                    report.skipped += 1
+                except discord.HTTPException as exc:
+                    _log.debug('Failed to update role %s of member %s.', role.id, member_id, exc_info=exc)
+                    report.failed += 1
+                else:
+                    if add:
+                        report.added += 1
+                    else:
+                        report.removed += 1
+
+        await asyncio.gather(
+            *(_apply(member_id, False) for member_id in to_remove),
+            *(_apply(member_id, True) for member_id in to_add),
+        )
+
+        _log.debug(
+            'Synchronized role %s in guild %s: %s added, %s removed, %s skipped, %s failed.',
+            role.id,
+            guild.id,
+            report.added,
+            report.removed,
+            report.skipped,
+            report.failed,
+        )
+        return report
@@ -0,0 +1,361 @@
+"""
+Contributor-Only License v1.0
+
+This file is licensed under the Contributor-Only License. Usage is restricted to
+non-commercial purposes. Distribution, sublicensing, and sharing of this file
+are prohibited except by the original owner.
+
+Modifications are allowed solely for contributing purposes and must not
+misrepresent the original material. This license does not grant any
+patent rights or trademark rights.
+
+Full license terms are available in the LICENSE file at the root of the repository.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import logging
+import os
+from typing import TYPE_CHECKING, Any, Dict, Final, Iterable, List, Optional, Set, Tuple
+
+import discord
+import orjson
+from typing_extensions import Self
+
+if TYPE_CHECKING:
+    from bot import ConnectionType
+    from cogs.teams.practices import Practice
+
+__all__: Tuple[str, ...] = ('PracticeSnapshot', 'SnapshotTable')
+
+_log = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION: Final[int] = 2
+
+PRACTICE_COLUMNS: Final[Tuple[str, ...]] = (
+    'id',
+    'started_at',
+    'ended_at',
+    'team_id',
+    'channel_id',
+    'guild_id',
+    'status',
+    'started_by_id',
+    'message_id',
+)
+# practice_seconds is only set for members whose history has been trimmed, their history rows are not stored.
+PRACTICE_MEMBER_COLUMNS: Final[Tuple[str, ...]] = (
+    'id',
+    'member_id',
+    'practice_id',
+    'attending',
+    'reason',
+    'practice_seconds',
+)
+PRACTICE_MEMBER_HISTORY_COLUMNS: Final[Tuple[str, ...]] = (
+    'id',
+    'joined_at',
+    'left_at',
+    'practice_id',
+    'member_id',
+    'team_id',
+    'channel_id',
+    'guild_id',
+)
+
+# orjson writes datetimes as ISO 8601 strings, these columns need to be parsed back when loading.
+DATETIME_COLUMNS: Final[Tuple[str, ...]] = ('started_at', 'ended_at', 'joined_at', 'left_at')
+
+
+@dataclasses.dataclass()
+class SnapshotTable:
+    """Represents the rows of a single table stored in a snapshot.
+
+    Attributes
+    ----------
+    high_water_mark: :class:`int`
+        The highest row ID of this table at the time the snapshot was taken. Any row
+        with a higher ID was created after the snapshot.
+    rows: List[Dict[:class:`str`, Any]]
+        The stored rows.
+    """
+
+    high_water_mark: int = 0
+    rows: List[Dict[str, Any]] = dataclasses.field(default_factory=list)
+
+    def to_payload(self, columns: Tuple[str, ...]) -> Dict[str, Any]:
+        # Rows are stored as lists rather than mappings so the column names are not repeated on every row.
+        return {
+            'high_water_mark': self.high_water_mark,
+            'columns': columns,
+            'rows': [[row[column] for column in columns] for row in self.rows],
+        }
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> Self:
+        columns: List[str] = payload['columns']
+        datetime_indexes = [index for index, column in enumerate(columns) if column in DATETIME_COLUMNS]
+
+        rows: List[Dict[str, Any]] = []
+        for raw in payload['rows']:
+            for index in datetime_indexes:
+                if raw[index] is not None:
+                    raw[index] = datetime.datetime.fromisoformat(raw[index])
+
+            rows.append(dict(zip(columns, raw)))
+
+        return cls(high_water_mark=payload['high_water_mark'], rows=rows)
+
+
+@dataclasses.dataclass()
+class PracticeSnapshot:
+    """Represents an on-disk snapshot of the practice cache, used to avoid scanning the
+    entire practice history on every startup.
+
+    Only completed practices are stored in the snapshot. A completed practice, its members and
+    their history are never updated again, so they can safely be loaded from disk. Practices that
+    were ongoing when the snapshot was taken are refetched in full on load.
+
+    Attributes
+    ----------
+    created_at: :class:`datetime.datetime`
+        When the snapshot was taken.
+    pending_practice_ids: List[:class:`int`]
+        The IDs of the practices that were ongoing when the snapshot was taken.
+    practices: :class:`SnapshotTable`
+        The ``teams.practice`` rows.
+    members: :class:`SnapshotTable`
+        The ``teams.practice_member`` rows.
+    history: :class:`SnapshotTable`
+        The ``teams.practice_member_history`` rows.
+    """
+
+    created_at: datetime.datetime
+    pending_practice_ids: List[int]
+    practices: SnapshotTable
+    members: SnapshotTable
+    history: SnapshotTable
+
+    @classmethod
+    def from_practices(cls, practices: Iterable[Practice]) -> Self:
+        """Create a snapshot from the given cached practices.
+
+        Parameters
+        ----------
+        practices: Iterable[:class:`Practice`]
+            The practices to store.
+
+        Returns
+        -------
+        :class:`PracticeSnapshot`
+        """
+        snapshot = cls(
+            created_at=discord.utils.utcnow(),
+            pending_practice_ids=[],
+            practices=SnapshotTable(),
+            members=SnapshotTable(),
+            history=SnapshotTable(),
+        )
+
+        for practice in practices:
+            snapshot.practices.high_water_mark = max(snapshot.practices.high_water_mark, practice.id)
+            for member in practice.members:
+                snapshot.members.high_water_mark = max(snapshot.members.high_water_mark, member.id)
+                for history in member.history:
+                    snapshot.history.high_water_mark = max(snapshot.history.high_water_mark, history.id)
+
+            if practice.ongoing:
+                # This practice can still change, it will be refetched when the snapshot is loaded.
+                snapshot.pending_practice_ids.append(practice.id)
+                continue
+
+            snapshot.practices.rows.append(
+                {
+                    'id': practice.id,
+                    'started_at': practice.started_at,
+                    'ended_at': practice.ended_at,
+                    'team_id': practice.team_id,
+                    'channel_id': practice.channel_id,
+                    'guild_id': practice.guild_id,
+                    'status': practice.status.value,
+                    'started_by_id': practice.started_by_id,
+                    'message_id': practice.message_id,
+                }
+            )
+
+            for member in practice.members:
+                snapshot.members.rows.append(
+                    {
+                        'id': member.id,
+                        'member_id': member.member_id,
+                        'practice_id': member.practice_id,
+                        'attending': member.attending,
+                        'reason': member.reason,
+                        'practice_seconds': (
+                            member.get_total_practice_time().total_seconds() if member.history_trimmed else None
+                        ),
+                    }
+                )
+
+                for history in member.history:
+                    snapshot.history.rows.append(
+                        {
+                            'id': history.id,
+                            'joined_at': history.joined_at,
+                            'left_at': history.left_at,
+                            'practice_id': member.practice_id,
+                            'member_id': member.member_id,
+                            'team_id': history.team_id,
+                            'channel_id': history.channel_id,
+                            'guild_id': history.guild_id,
+                        }
+                    )
+
+        return snapshot
+
+    @classmethod
+    def read(cls, path: str) -> Optional[Self]:
+        """Read a snapshot from disk. This is blocking and should be run in an executor.
+
+        Parameters
+        ----------
+        path: :class:`str`
+            The path of the snapshot file.
+
+        Returns
+        -------
+        Optional[:class:`PracticeSnapshot`]
+            The snapshot, or ``None`` if it does not exist, is unreadable or was written by
+            a different snapshot version.
+        """
+        try:
+            with open(path, 'rb') as file:
+                payload = orjson.loads(file.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, orjson.JSONDecodeError) as exc:
+            _log.warning('Failed to read cache snapshot %s, ignoring it.', path, exc_info=exc)
+            return None
+
+        if payload.get('version') != SNAPSHOT_VERSION:
+            _log.info('Cache snapshot %s has version %s, ignoring it.', path, payload.get('version'))
+            return None
+
+        tables = payload['tables']
+        return cls(
+            created_at=datetime.datetime.fromisoformat(payload['created_at']),
+            pending_practice_ids=payload['pending_practice_ids'],
+            practices=SnapshotTable.from_payload(tables['teams.practice']),
+            members=SnapshotTable.from_payload(tables['teams.practice_member']),
+            history=SnapshotTable.from_payload(tables['teams.practice_member_history']),
+        )
+
+    def write(self, path: str) -> None:
+        """Write this snapshot to disk. This is blocking and should be run in an executor.
+
+        The snapshot is written to a temporary file first and then moved into place, so a crash
+        while writing never leaves a partially written snapshot behind.
+
+        Parameters
+        ----------
+        path: :class:`str`
+            The path of the snapshot file.
+        """
+        payload = {
+            'version': SNAPSHOT_VERSION,
+            'created_at': self.created_at,
+            'pending_practice_ids': self.pending_practice_ids,
+            'tables': {
+                'teams.practice': self.practices.to_payload(PRACTICE_COLUMNS),
+                'teams.practice_member': self.members.to_payload(PRACTICE_MEMBER_COLUMNS),
+                'teams.practice_member_history': self.history.to_payload(PRACTICE_MEMBER_HISTORY_COLUMNS),
+            },
+        }
+
+        temporary_path = f'{path}.tmp'
+        with open(temporary_path, 'wb') as file:
+            file.write(orjson.dumps(payload))
+
+        os.replace(temporary_path, path)
+
+    async def fetch_rows(
+        self, connection: ConnectionType
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """|coro|
+
+        Merge this snapshot with the rows that have changed in the database since it was taken.
+
+        Rows with an ID above the high water mark of their table, and rows belonging to a practice
+        that was ongoing when the snapshot was taken, are fetched. Stored rows that have since been
+        deleted are dropped by checking which of their IDs still exist.
+
+        Parameters
+        ----------
+        connection: :class:`asyncpg.Connection`
+            The connection to use.
+
+        Returns
+        -------
+        Tuple[List[Dict[:class:`str`, Any]], List[Dict[:class:`str`, Any]], List[Dict[:class:`str`, Any]]]
+            The practice, practice member and practice member history rows.
+        """
+        pending = self.pending_practice_ids
+
+        existing_practice_ids: Set[int] = {
+            record['id']
+            for record in await connection.fetch(
+                'SELECT id FROM teams.practice WHERE id <= $1', self.practices.high_water_mark
+            )
+        }
+        practice_data = [row for row in self.practices.rows if row['id'] in existing_practice_ids]
+        new_practice_data = await connection.fetch(
+            'SELECT * FROM teams.practice WHERE id > $1 OR id = ANY($2::bigint[])',
+            self.practices.high_water_mark,
+            pending,
+        )
+        practice_data.extend(map(dict, new_practice_data))
+
+        existing_member_ids: Set[int] = {
+            record['id']
+            for record in await connection.fetch(
+                'SELECT id FROM teams.practice_member WHERE id <= $1', self.members.high_water_mark
+            )
+        }
+        member_data = [
+            row
+            for row in self.members.rows
+            if row['id'] in existing_member_ids and row['practice_id'] in existing_practice_ids
+        ]
+        new_member_data = await connection.fetch(
+            'SELECT * FROM teams.practice_member WHERE id > $1 OR practice_id = ANY($2::bigint[])',
+            self.members.high_water_mark,
+            pending,
+        )
+        member_data.extend(map(dict, new_member_data))
+
+        # History rows are only ever deleted alongside their practice member, so we only need to keep the
+        # history of the members that still exist.
+        existing_members = {(row['practice_id'], row['member_id']) for row in member_data}
+        history_data = [row for row in self.history.rows if (row['practice_id'], row['member_id']) in existing_members]
+        new_history_data = await connection.fetch(
+            'SELECT * FROM teams.practice_member_history WHERE id > $1 OR practice_id = ANY($2::bigint[])',
+            self.history.high_water_mark,
+            pending,
+        )
+        history_data.extend(map(dict, new_history_data))
+
+        _log.info(
+            'Loaded %s practices, %s practice members and %s history entries from the cache snapshot taken at %s, '
+            'fetched %s, %s and %s changed rows.',
+            len(practice_data),
+            len(member_data),
+            len(history_data),
+            self.created_at,
+            len(new_practice_data),
+            len(new_member_data),
+            len(new_history_data),
+        )
+
+        return practice_data, member_data, history_data
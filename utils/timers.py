@@ -199,8 +199,9 @@ class Timer:
             builder.add_arg('expires', expires)
             self.expires = expires
 
-        async with self.bot.safe_connection() as connection:
-            await builder(connection)
+        if builder:
+            async with self.bot.safe_connection() as connection:
+                await builder(connection)
 
         if self.bot.timer_manager:
             self.bot.timer_manager.restart_task()
@@ -271,7 +272,8 @@ class TimerManager:
         """
         # Please note the return value in the doc is different than the one in the function.
         # This function actually only returns a Timer but pyright doesn't like typehinting that.
-        async with self.bot.safe_connection() as con:
+        # This can wait on new timers for a long time, so the connection must not sit idle in a transaction.
+        async with self.bot.safe_connection(transaction=False) as con:
             timer = await self.get_active_timer(connection=con, days=days)
             if timer is not None:
                 self._have_data.set()
@@ -433,8 +435,7 @@ class TimerManager:
             A timer with that ID does not exist.
         """
         if connection is None:
-            async with self.bot.safe_connection() as conn:
-                data = await conn.fetchrow('SELECT * FROM timers WHERE id = $1', id)
+            data = await self.bot.fetchrow('SELECT * FROM timers WHERE id = $1', id)
         else:
             data = await connection.fetchrow('SELECT * FROM timers WHERE id = $1', id)
 
@@ -453,7 +454,6 @@ class TimerManager:
         :class:`list`
             A list of :class:`Timer` objects.
         """
-        async with self.bot.safe_connection() as conn:
-            data = await conn.fetch('SELECT * FROM timers')
+        data = await self.bot.fetch('SELECT * FROM timers')
 
         return [Timer(record=row, bot=self.bot) for row in data]